@@ -0,0 +1,31 @@
+"""Compare the default (stdlib csv) and arrow CSV engines end to end.
+
+Usage: python benchmarks/bench_csv_engine.py [ROWS]   (needs pyarrow)
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_csv_import import _write_csv
+
+from llmindex.importers.csv_importer import CSV_ENGINES, iter_csv
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "products.csv"
+        _write_csv(path, rows)
+        for engine in CSV_ENGINES:
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_csv(path, engine=engine))
+            elapsed = time.perf_counter() - start
+            print(f"{engine:>8}: {count / elapsed:>10,.0f} products/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare importing the same catalog from CSV and from Parquet.
+
+Usage: python benchmarks/bench_parquet_import.py [ROWS]   (needs pyarrow)
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from bench_csv_import import _write_csv
+
+from llmindex.importers.arrow_importer import iter_parquet
+from llmindex.importers.csv_importer import iter_csv
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "products.csv"
+        parquet_path = Path(tmp) / "products.parquet"
+        _write_csv(csv_path, rows)
+        pq.write_table(pa_csv.read_csv(csv_path), parquet_path)
+        for name, path, fn in (
+            ("CSV", csv_path, iter_csv),
+            ("Parquet", parquet_path, iter_parquet),
+        ):
+            size = path.stat().st_size / (1 << 20)
+            start = time.perf_counter()
+            count = sum(1 for _ in fn(path))
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:>8}: {count / elapsed:>10,.0f} products/s ({elapsed:.2f}s, {size:.1f} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
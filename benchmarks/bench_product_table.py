@@ -0,0 +1,58 @@
+"""Memory of list[Product] vs ProductTable for a synthetic catalog.
+
+Usage: python benchmarks/bench_product_table.py [ROWS]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+
+from llmindex.llmindex_cli.models import Product, ProductTable
+
+_BRANDS = [f"Brand {i}" for i in range(200)]
+_CATEGORIES = [f"Category {i}" for i in range(50)]
+_AVAILABILITY = ["in_stock", "out_of_stock", "preorder"]
+
+
+def _products(n: int) -> Iterator[Product]:
+    for i in range(n):
+        yield Product(
+            id=f"P{i:07d}",
+            title=f"Product {i}",
+            url=f"https://example.com/products/{i}",
+            image_url=f"https://example.com/img/{i}.jpg" if i % 2 else None,
+            price=float(i % 1000) + 0.99 if i % 10 else None,
+            currency="USD" if i % 10 else None,
+            availability=_AVAILABILITY[i % 3],
+            brand=_BRANDS[i % len(_BRANDS)],
+            category=_CATEGORIES[i % len(_CATEGORIES)],
+            updated_at="2026-01-01T00:00:00Z",
+        )
+
+
+def _measure(name: str, build) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:>14}: {current / 2**20:8.1f} MiB retained, {current / len(store):6.0f} B/row ({elapsed:.1f}s)"
+    )
+    del store
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    _measure("list[Product]", lambda: list(_products(n)))
+    _measure("ProductTable", lambda: ProductTable(_products(n)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Compare per-record Product(**record) with batch and trusted validation.
+
+Usage: python benchmarks/bench_validation.py [RECORDS]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from llmindex.importers.batch import validate_records
+from llmindex.llmindex_cli.models import Product
+
+
+def _records(n: int) -> list[tuple[int, dict]]:
+    return [
+        (
+            i,
+            {
+                "id": f"P{i}",
+                "title": f"Product {i}",
+                "url": f"https://example.com/p/{i}",
+                "image_url": f"https://example.com/img/{i}.jpg",
+                "price": float(i % 500),
+                "currency": "USD",
+                "availability": "in_stock",
+                "brand": "ACME",
+                "category": "Gear",
+                "updated_at": "2026-01-01T00:00:00Z",
+            },
+        )
+        for i in range(n)
+    ]
+
+
+def _warn(ref: int, exc: Exception) -> None:
+    raise exc
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    records = _records(n)
+    cases = {
+        "Product(**record)": lambda: [Product(**record) for _, record in records],
+        "batch": lambda: list(validate_records(records, _warn)),
+        "trusted": lambda: list(validate_records(records, _warn, trusted=True)),
+    }
+    for name, fn in cases.items():
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>18}: {n / best:>12,.0f} records/s ({best:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+"""Arrow importer — reads products from Parquet files and Arrow IPC files/streams.
+
+Requires the optional `pyarrow` package (pip install 'llmindex[arrow]'). Data is
+read one record batch at a time and only the columns that map to Product fields
+are decoded. Per-column work (casting, defaults, empty-to-null) runs in Arrow
+compute kernels. Low-cardinality string columns are converted through
+their dictionary, so each distinct value becomes one shared Python string.
+
+Also provides the `arrow` CSV engine (iter_csv_arrow), which parses CSV with
+Arrow's multithreaded reader and checks Product constraints column-wise.
+"""
+
+from __future__ import annotations
+
+import csv
+import sys
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Optional
+
+from llmindex.importers.batch import Record, construct_products, utc_timestamp, validate_records
+from llmindex.importers.compression import detect_compression, is_stdin, open_source
+from llmindex.importers.csv_importer import CSV_FIELDS, _csv_row_getter
+from llmindex.importers.errors import ImportAbortedError, ImportErrors, row_warner
+from llmindex.llmindex_cli.models import _AVAILABILITY_ALIASES, Product
+from llmindex.llmindex_cli.stats import RunStats
+
+# Rows per record batch read from the file
+_BATCH_ROWS = 64 * 1024
+
+# Fields that must stay strings ("" rather than None) so validation reports them
+_REQUIRED_FIELDS = ("id", "title", "url")
+# Repetitive string columns converted via a dictionary (one Python str per value)
+_DICTIONARY_FIELDS = frozenset({"currency", "availability", "brand", "category", "updated_at"})
+
+_IPC_FILE_MAGIC = b"ARROW1"
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Bytes per block handed to the Arrow CSV reader's threads
+_CSV_BLOCK_BYTES = 4 << 20
+# Product constraints, checked column-wise by the arrow CSV engine
+_CURRENCY_PATTERN = r"^[A-Z]{3}$"
+_AVAILABILITY_VALUES = ("in_stock", "out_of_stock", "preorder")
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow  # type: ignore[import-not-found]
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "pyarrow is required for Parquet/Arrow input. Install with: pip install 'llmindex[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _resolve_columns(
+    schema_names: list[str], columns: Optional[Mapping[str, str]]
+) -> dict[str, str]:
+    """Map Product field -> source column for the fields present in the file."""
+    columns = columns or {}
+    resolved: dict[str, str] = {}
+    for name in Product.model_fields:
+        source = columns.get(name, name)
+        if name in columns and source not in schema_names:
+            raise ValueError(f"Column '{source}' (mapped to '{name}') not found in input")
+        if source in schema_names:
+            resolved[name] = source
+    return resolved
+
+
+def _is_string(pa: Any, col: Any) -> bool:
+    return pa.types.is_string(col.type) or pa.types.is_large_string(col.type)
+
+
+def _strings(pa: Any, pc: Any, name: str, col: Any, defaults: Mapping[str, str]) -> Any:
+    """Cast `col` to strings and apply the empty/null handling for field `name`."""
+    if pa.types.is_timestamp(col.type):
+        # Whole seconds in UTC; naive timestamps are taken to be UTC already
+        tz = "UTC" if col.type.tz is not None else None
+        col = pc.cast(col, pa.timestamp("s", tz=tz), safe=False)
+        col = pc.strftime(col, format=_TIMESTAMP_FORMAT)
+    elif not _is_string(pa, col):
+        col = pc.cast(col, pa.string())
+
+    # Same defaults as the JSON importer: empty or null availability/updated_at
+    # get the import default, other empty optional strings become None
+    if name in defaults:
+        col = pc.fill_null(col, defaults[name])
+        return pc.if_else(pc.equal(col, ""), defaults[name], col)
+    if name not in _REQUIRED_FIELDS:
+        return pc.if_else(pc.equal(col, ""), pa.scalar(None, col.type), col)
+    return col
+
+
+def _to_pylist(pa: Any, pc: Any, name: str, col: Any, defaults: Mapping[str, str]) -> list[Any]:
+    """Convert one Arrow column to the Python values of a Product field."""
+    if name == "price":
+        if _is_string(pa, col):
+            return col.to_pylist()  # parsed per row, so a bad cell only rejects its row
+        return pc.cast(col, pa.float64()).to_pylist()
+    if name == "price_range":
+        return col.to_pylist()
+
+    if pa.types.is_dictionary(col.type):
+        col = col.cast(col.type.value_type)
+    if name not in _DICTIONARY_FIELDS:
+        return _strings(pa, pc, name, col, defaults).to_pylist()
+
+    # Convert only the distinct values, then expand through the indices
+    encoded = pc.dictionary_encode(col)
+    values = _strings(pa, pc, name, encoded.dictionary, defaults).to_pylist()
+    missing = defaults.get(name)
+    return [missing if i is None else values[i] for i in encoded.indices.to_pylist()]
+
+
+def _dictionary_pylist(pc: Any, col: Any) -> list[Any]:
+    """to_pylist() through the column's dictionary: one Python str per distinct value."""
+    encoded = pc.dictionary_encode(col)
+    values = encoded.dictionary.to_pylist()
+    return [None if i is None else values[i] for i in encoded.indices.to_pylist()]
+
+
+def _parse_price(row_num: int, record: dict[str, Any]) -> tuple[int, Record]:
+    price = record["price"]
+    if isinstance(price, str):
+        try:
+            price = price.strip()
+            record["price"] = float(price) if price else None
+        except ValueError as exc:
+            return row_num, exc
+    return row_num, record
+
+
+def _iter_records(
+    batches: Iterator[Any], resolved: dict[str, str], updated_at: str
+) -> Iterator[tuple[int, Record]]:
+    pa = _require_pyarrow()
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+
+    defaults = {"availability": "in_stock", "updated_at": updated_at}
+    row_num = 1
+    for batch in batches:
+        n = batch.num_rows
+        data = {
+            name: _to_pylist(pa, pc, name, batch.column(source), defaults)
+            for name, source in resolved.items()
+        }
+        for name, default in defaults.items():
+            data.setdefault(name, [default] * n)
+
+        names = list(data)
+        records = (dict(zip(names, values)) for values in zip(*data.values()))
+        rows = range(row_num, row_num + n)
+        if "price" in resolved and _is_string(pa, batch.column(resolved["price"])):
+            yield from map(_parse_price, rows, records)
+        else:
+            yield from zip(rows, records)
+        row_num += n
+
+
+def iter_parquet(
+    path: str | Path,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a Parquet file, one record batch at a time.
+
+    Only columns that map to Product fields are read. `columns` maps Product
+    fields to differently named source columns. Invalid rows are reported to
+    stderr (or to `errors`, if given) with their 1-based row number.
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+    with pq.ParquetFile(Path(path), memory_map=True) as parquet:
+        resolved = _resolve_columns(parquet.schema_arrow.names, columns)
+        batches = parquet.iter_batches(batch_size=_BATCH_ROWS, columns=list(resolved.values()))
+        records = _iter_records(batches, resolved, utc_timestamp())
+        yield from validate_records(
+            records, row_warner("Row", errors), trusted=trusted, stats=stats
+        )
+
+
+def iter_arrow(
+    path: str | Path,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from an Arrow IPC file (Feather v2) or IPC stream.
+
+    IPC files are memory-mapped, so column buffers are read in place rather
+    than copied. Otherwise behaves like iter_parquet.
+    """
+    pa = _require_pyarrow()
+
+    path = Path(path)
+    with path.open("rb") as f:
+        is_file_format = f.read(len(_IPC_FILE_MAGIC)) == _IPC_FILE_MAGIC
+
+    with pa.memory_map(str(path)) as source:
+        if is_file_format:
+            reader = pa.ipc.open_file(source)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        else:
+            reader = pa.ipc.open_stream(source)
+            batches = iter(reader)
+        resolved = _resolve_columns(reader.schema.names, columns)
+        records = _iter_records(batches, resolved, utc_timestamp())
+        yield from validate_records(
+            records, row_warner("Row", errors), trusted=trusted, stats=stats
+        )
+
+
+def _normalize_availability(pa: Any, pc: Any, col: Any) -> Any:
+    # Same mapping as Product.normalize_availability, applied to the distinct values
+    encoded = pc.dictionary_encode(col)
+    values = [_AVAILABILITY_ALIASES.get(v.lower(), v) for v in encoded.dictionary.to_pylist()]
+    return pc.take(pa.array(values, pa.string()), encoded.indices)
+
+
+def _csv_prices(pa: Any, pc: Any, col: Any) -> tuple[Any, list[Any]]:
+    """Return (price array or None, per-row values) for a trimmed price column."""
+    col = pc.if_else(pc.equal(col, ""), pa.scalar(None, pa.string()), col)
+    try:
+        prices = pc.cast(col, pa.float64())
+    except pa.ArrowInvalid:
+        # Some cell is not a number: parse per row so only that row is rejected
+        values: list[Any] = []
+        for cell in col.to_pylist():
+            try:
+                values.append(None if cell is None else float(cell))
+            except ValueError as exc:
+                values.append(exc)
+        return None, values
+    return prices, prices.to_pylist()
+
+
+def _csv_batch(
+    pa: Any, pc: Any, batch: Any, sources: dict[str, Optional[str]], updated_at: str
+) -> tuple[Iterator[Product], list[bool]]:
+    """Convert one batch of string columns to unvalidated Products and a row-is-valid mask.
+
+    A row whose price did not parse carries the ValueError as its price.
+    """
+    n = batch.num_rows
+    cols: dict[str, Any] = {}
+    for name, source in sources.items():
+        if source is None:  # column absent from the header, as in compile_row_getter
+            default = "in_stock" if name == "availability" else ""
+            cols[name] = pa.array([default] * n, pa.string())
+        else:
+            cols[name] = pc.utf8_trim_whitespace(batch.column(source))
+
+    null = pa.scalar(None, pa.string())
+    for name in ("image_url", "currency", "brand", "category"):
+        cols[name] = pc.if_else(pc.equal(cols[name], ""), null, cols[name])
+    cols["updated_at"] = pc.if_else(
+        pc.equal(cols["updated_at"], ""), updated_at, cols["updated_at"]
+    )
+    cols["availability"] = _normalize_availability(pa, pc, cols["availability"])
+    prices, price_cells = _csv_prices(pa, pc, cols.pop("price"))
+
+    # Rows passing every Product constraint are built without per-row validation
+    checks = [
+        pc.greater(pc.utf8_length(cols["id"]), 0),
+        pc.greater(pc.utf8_length(cols["title"]), 0),
+        pc.is_in(cols["availability"], value_set=pa.array(_AVAILABILITY_VALUES)),
+        pc.fill_null(pc.match_substring_regex(cols["currency"], _CURRENCY_PATTERN), True),
+    ]
+    if prices is None:
+        checks.append(pa.array([False] * n))
+    else:
+        checks.append(pc.fill_null(pc.greater_equal(prices, 0), True))
+    valid = checks[0]
+    for check in checks[1:]:
+        valid = pc.and_(valid, check)
+
+    data = {
+        name: _dictionary_pylist(pc, col) if name in _DICTIONARY_FIELDS else col.to_pylist()
+        for name, col in cols.items()
+    }
+    data["price"] = price_cells
+    return construct_products(data, n), valid.to_pylist()
+
+
+def iter_csv_arrow(
+    path: str | Path,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a CSV file using Arrow's multithreaded CSV reader.
+
+    Produces the same products as csv_importer.iter_csv. Cells are trimmed,
+    defaulted and checked against the Product constraints (non-empty id and
+    title, price >= 0, currency pattern, normalised availability) one column
+    at a time; only rows failing a check go through Product validation, so
+    their warnings keep the default engine's text.
+
+    Unlike the default engine, a row whose number of cells differs from the
+    header is skipped with a warning that has no row number (the rows after
+    it keep their numbers), and standard input ("-") cannot be read: the
+    header is read before the file is reopened.
+    """
+    if is_stdin(path):
+        raise ValueError("The arrow CSV engine cannot read standard input; use the python engine")
+    pa = _require_pyarrow()
+    import pyarrow.compute as pc  # type: ignore[import-not-found]
+    import pyarrow.csv as pa_csv  # type: ignore[import-not-found]
+
+    path = Path(path)
+    with open_source(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), None)
+    if not header:
+        return
+    _csv_row_getter(header, columns)  # fail fast on a bad column mapping
+
+    # Positional names, so duplicated headers resolve to their last occurrence
+    names = [f"f{i}" for i in range(len(header))]
+    positions = {name: f"f{i}" for i, name in enumerate(header)}
+    sources = {name: positions.get((columns or {}).get(name, name)) for name in CSV_FIELDS}
+    used = sorted({s for s in sources.values() if s is not None}, key=names.index)
+
+    # Exceptions raised by the handler are swallowed by pyarrow, so an abort is
+    # signalled by failing the parse and re-raised from read_batches()
+    aborted: list[ImportAbortedError] = []
+    # Row numbers of skipped rows (header is row 1), so later rows keep theirs
+    skipped: set[int] = set()
+
+    def skip_row(row: Any) -> str:
+        if row.number is not None:
+            skipped.add(row.number)
+        message = f"{row.actual_columns} cells (header has {row.expected_columns}): {row.text!r}"
+        if stats is not None:
+            stats.rows_parsed += 1
+            stats.rows_rejected += 1
+        if errors is None:
+            print(f"[warn] Skipped row with {message}", file=sys.stderr)
+            return "skip"
+        try:
+            errors.record("Skipped row", ["cell_count"], message)
+        except ImportAbortedError as exc:
+            aborted.append(exc)
+            return "error"
+        return "skip"
+
+    read_options = pa_csv.ReadOptions(
+        column_names=names, skip_rows=1, block_size=_CSV_BLOCK_BYTES, use_threads=True
+    )
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip_row)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=used,
+        column_types=dict.fromkeys(used, pa.string()),
+        strings_can_be_null=False,
+        quoted_strings_can_be_null=False,
+    )
+
+    def read_batches(source: Any) -> Iterator[Any]:
+        try:
+            yield from pa_csv.open_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+        except pa.ArrowInvalid:
+            if aborted:
+                raise aborted[0] from None
+            raise
+
+    with ExitStack() as stack:
+        source: Any = str(path)
+        if detect_compression(path) is not None:
+            source = stack.enter_context(open_source(path, "rb"))
+        report = row_warner("Row", errors)
+
+        def warn(row_num: int, exc: Exception) -> None:
+            if stats is not None:
+                stats.rows_rejected += 1
+            report(row_num, exc)
+
+        def next_row(row_num: int) -> int:
+            # A skipped row is reported before the batches that follow it
+            while row_num in skipped:
+                row_num += 1
+            return row_num
+
+        updated_at = utc_timestamp()
+        row_num = 2  # header is row 1
+        for batch in read_batches(source):
+            # The column-wise checks stand in for Product validation
+            start = time.perf_counter()
+            products, valid = _csv_batch(pa, pc, batch, sources, updated_at)
+            if stats is not None:
+                stats.validate_seconds += time.perf_counter() - start
+                stats.rows_parsed += len(valid)
+            if all(valid):
+                yield from products
+                if not skipped:
+                    row_num += len(valid)
+                    continue
+                for _ in valid:
+                    row_num = next_row(row_num) + 1
+                continue
+            for product, ok in zip(products, valid):
+                row_num = next_row(row_num)
+                price = product.price
+                if isinstance(price, Exception):
+                    warn(row_num, price)
+                elif ok or trusted:
+                    yield product
+                else:
+                    try:
+                        yield Product(**product.__dict__)
+                    except Exception as exc:
+                        warn(row_num, exc)
+                row_num += 1
+
+
+def import_parquet(
+    path: str | Path,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+) -> list[Product]:
+    """Import products from a Parquet file."""
+    return list(iter_parquet(path, columns=columns, trusted=trusted))
+
+
+def import_arrow(
+    path: str | Path,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+) -> list[Product]:
+    """Import products from an Arrow IPC file or stream."""
+    return list(iter_arrow(path, columns=columns, trusted=trusted))
@@ -0,0 +1,174 @@
+"""Block-wise Product validation shared by the streaming importers."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from llmindex.llmindex_cli.models import PriceRange, Product
+from llmindex.llmindex_cli.stats import RunStats
+
+# Records validated per TypeAdapter call. Large enough to amortise the call
+# overhead, small enough that streaming imports stay constant-memory.
+BATCH_SIZE = 1024
+
+_products_adapter = TypeAdapter(list[Product])
+_object_new = object.__new__
+_set_attr = object.__setattr__
+
+# An importer record: the raw fields of one product, or the exception raised
+# while extracting them (reported in file order alongside validation errors).
+Record = Union[dict[str, Any], Exception]
+
+
+def utc_timestamp() -> str:
+    """Current UTC time in the feed's ISO 8601 format (fallback `updated_at`)."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _construct(model: type[BaseModel], fields: dict[str, None], data: dict[str, Any]) -> Any:
+    # Same result as model.model_construct(**data) for a complete record, without
+    # its per-field default handling (which costs more than validating).
+    values = fields.copy()
+    if data.keys() <= fields.keys():
+        values.update(data)
+    else:
+        for name in fields:
+            values[name] = data.get(name)
+    obj = _object_new(model)
+    _set_attr(obj, "__dict__", values)
+    _set_attr(obj, "__pydantic_fields_set__", set(fields))
+    _set_attr(obj, "__pydantic_extra__", None)
+    _set_attr(obj, "__pydantic_private__", None)
+    return obj
+
+
+# Field name -> None templates, in declaration order
+_PRODUCT_FIELDS = dict.fromkeys(Product.model_fields)
+_PRICE_RANGE_FIELDS = dict.fromkeys(PriceRange.model_fields)
+
+
+def construct_product(data: dict[str, Any]) -> Product:
+    """Build a Product from already-valid fields without running validation.
+
+    Only for trusted input (e.g. a feed written by `llmindex generate`): values
+    are stored as given, availability is not normalised and unknown keys are
+    dropped. Fields absent from `data` are set to None.
+    """
+    product = _construct(Product, _PRODUCT_FIELDS, data)
+    price_range = product.__dict__["price_range"]
+    if isinstance(price_range, dict):
+        product.__dict__["price_range"] = _construct(PriceRange, _PRICE_RANGE_FIELDS, price_range)
+    return product
+
+
+def construct_products(columns: Mapping[str, Sequence[Any]], n: int) -> Iterator[Product]:
+    """Column-wise construct_product: yield one Product per row of `n`-long columns.
+
+    `columns` maps field names to their values; fields without a column are
+    None. Values are stored as given (price_range must already be a
+    PriceRange or None), so only pass columns whose values are known valid.
+    Products are built lazily so a large batch is never held as objects.
+    """
+    names = tuple(_PRODUCT_FIELDS)
+    data = [columns.get(name, repeat(None, n)) for name in names]
+    fields_set = set(names)
+    for values in zip(*data):
+        product = _object_new(Product)
+        _set_attr(product, "__dict__", dict(zip(names, values)))
+        _set_attr(product, "__pydantic_fields_set__", fields_set.copy())
+        _set_attr(product, "__pydantic_extra__", None)
+        _set_attr(product, "__pydantic_private__", None)
+        yield product
+
+
+def _validate_block(
+    block: list[tuple[Any, Record]], warn: Callable[[Any, Exception], None]
+) -> list[Product]:
+    items = [record for _, record in block if not isinstance(record, Exception)]
+    if len(items) == len(block):
+        try:
+            return _products_adapter.validate_python(items)
+        except Exception:
+            pass
+
+    # Some record is bad: validate one by one so warnings keep the same text
+    # and order as per-row Product(**record).
+    products: list[Product] = []
+    for ref, record in block:
+        if isinstance(record, Exception):
+            warn(ref, record)
+            continue
+        try:
+            products.append(Product(**record))
+        except Exception as exc:
+            warn(ref, exc)
+    return products
+
+
+def _validate_block_timed(
+    block: list[tuple[Any, Record]], warn: Callable[[Any, Exception], None], stats: RunStats
+) -> list[Product]:
+    start = time.perf_counter()
+    products = _validate_block(block, warn)
+    stats.validate_seconds += time.perf_counter() - start
+    stats.rows_parsed += len(block)
+    stats.rows_rejected += len(block) - len(products)
+    return products
+
+
+def _count_trusted(
+    records: Iterable[tuple[Any, Record]], stats: RunStats
+) -> Iterator[tuple[Any, Record]]:
+    for entry in records:
+        stats.rows_parsed += 1
+        if isinstance(entry[1], Exception):
+            stats.rows_rejected += 1
+        yield entry
+
+
+def validate_records(
+    records: Iterable[tuple[Any, Record]],
+    warn: Callable[[Any, Exception], None],
+    trusted: bool = False,
+    batch_size: int = BATCH_SIZE,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Turn (ref, record) pairs into Products, validating `batch_size` at a time.
+
+    Args:
+        records: Pairs of a source reference (row/line/item number) and either
+            the raw product fields or an extraction error.
+        warn: Called as warn(ref, exc) for every rejected record, in order.
+        trusted: Skip validation and build Products with construct_product.
+        batch_size: Records per TypeAdapter(list[Product]) call.
+        stats: Receives rows parsed and rejected and the validation time.
+    """
+    if trusted:
+        if stats is not None:
+            records = _count_trusted(records, stats)
+        for ref, record in records:
+            if isinstance(record, Exception):
+                warn(ref, record)
+            else:
+                yield construct_product(record)
+        return
+
+    def validate(block: list[tuple[Any, Record]]) -> list[Product]:
+        if stats is None:
+            return _validate_block(block, warn)
+        return _validate_block_timed(block, warn, stats)
+
+    block: list[tuple[Any, Record]] = []
+    for entry in records:
+        block.append(entry)
+        if len(block) >= batch_size:
+            yield from validate(block)
+            block = []
+    if block:
+        yield from validate(block)
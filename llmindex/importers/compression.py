@@ -0,0 +1,109 @@
+"""Transparent decompression of product source files.
+
+Compression is detected from the file extension, falling back to the magic
+bytes at the start of the file, and the source is decompressed as a stream
+straight into the importer. gzip, bz2 and xz use the standard library; zstd
+requires the optional `zstandard` package. The path "-" reads standard input,
+whose compression is detected from its first bytes.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+import sys
+from pathlib import Path
+from typing import IO, Any, Optional
+
+# Path that stands for standard input
+STDIN = "-"
+
+# Extension -> codec. Also the suffixes watch mode treats as product sources.
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+
+def is_stdin(path: str | Path) -> bool:
+    """True for the path "-", which stands for standard input."""
+    return str(path) == STDIN
+
+
+def _sniff(head: bytes) -> Optional[str]:
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def detect_compression(path: str | Path) -> Optional[str]:
+    """Return "gzip", "bz2", "xz" or "zstd" for a compressed file, else None."""
+    path = Path(path)
+    codec = COMPRESSION_SUFFIXES.get(path.suffix.lower())
+    if codec is not None:
+        return codec
+    with path.open("rb") as f:
+        return _sniff(f.read(6))
+
+
+def _open_zstd(path: Path | IO[bytes], mode: str, **kwargs: Any) -> IO[Any]:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "zstandard is required to read .zst input. Install with: pip install 'llmindex[zstd]'"
+        ) from e
+    return zstandard.open(path, mode, **kwargs)
+
+
+def open_source(
+    path: str | Path,
+    mode: str = "rt",
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+) -> IO[Any]:
+    """Open a product source for reading, decompressing it on the fly if needed.
+
+    Args:
+        path: Plain or compressed source file, or "-" for standard input.
+        mode: "rt" for text (the default) or "rb" for bytes.
+        encoding: Text encoding (text mode only).
+        newline: Newline handling as for `open()` (text mode only).
+    """
+    kwargs: dict[str, Any] = {}
+    if "b" not in mode:
+        kwargs = {"encoding": encoding, "newline": newline}
+
+    source: Path | IO[bytes]
+    if is_stdin(path):
+        source = sys.stdin.buffer
+        if not hasattr(source, "peek"):
+            source = io.BufferedReader(source)  # type: ignore[arg-type]
+        codec = _sniff(source.peek(6)[:6])
+        if codec is None:
+            return source if "b" in mode else io.TextIOWrapper(source, **kwargs)
+    else:
+        source = Path(path)
+        codec = detect_compression(source)
+        if codec is None:
+            return source.open(mode.replace("t", ""), **kwargs)
+
+    if codec == "gzip":
+        return gzip.open(source, mode, **kwargs)
+    if codec == "bz2":
+        return bz2.open(source, mode, **kwargs)
+    if codec == "xz":
+        return lzma.open(source, mode, **kwargs)
+    return _open_zstd(source, mode, **kwargs)
@@ -3,57 +3,400 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime, timezone
+import io
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, Optional
 
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.compression import detect_compression, is_stdin, open_source
+from llmindex.importers.errors import ImportErrors, error_kinds, row_warner
 from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
 
+# Target size of the byte ranges handed to worker processes by iter_csv(workers=N).
+_PARALLEL_CHUNK_BYTES = 8 << 20
+_SCAN_BLOCK_BYTES = 1 << 20
 
-def import_csv(path: str | Path) -> list[Product]:
-    """Import products from a CSV file.
+# Values of iter_csv(engine=...): the stdlib csv module, or pyarrow.csv (needs [arrow])
+CSV_ENGINES = ("python", "arrow")
 
-    Expected columns: id, title, url, image_url, price, currency, availability,
-                      brand, category, updated_at
+# Product fields read from a standard products CSV, in extraction order.
+CSV_FIELDS = (
+    "id",
+    "title",
+    "url",
+    "image_url",
+    "price",
+    "currency",
+    "availability",
+    "brand",
+    "category",
+    "updated_at",
+)
 
-    Rows with missing required fields (id, title, url, availability) are skipped
-    with a warning printed to stderr.
+
+def compile_row_getter(
+    header: Sequence[str],
+    fields: Sequence[str],
+    defaults: Optional[Mapping[str, str]] = None,
+    columns: Optional[Mapping[str, str]] = None,
+) -> Callable[[list[str]], list[Optional[str]]]:
+    """Resolve `fields` to header positions once and return a positional row getter.
+
+    The getter takes a `csv.reader` row and returns the stripped cell for each
+    field, in order. It mirrors `csv.DictReader` + `row.get(name, default)`:
+    a field whose column is absent from the header yields its default ("" if
+    not given), a duplicated header name resolves to its last occurrence, and
+    a cell missing because the row is too short comes back as None.
+
+    `columns` maps a field to the source header it should be read from; a
+    mapped header that does not exist raises ValueError.
     """
-    path = Path(path)
-    products: list[Product] = []
-    errors: list[str] = []
-
-    with path.open(newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row_num, row in enumerate(reader, start=2):  # header is row 1
-            try:
-                price_raw = row.get("price", "").strip()
-                price = float(price_raw) if price_raw else None
-                currency = row.get("currency", "").strip() or None
-
-                updated = row.get("updated_at", "").strip()
-                if not updated:
-                    updated = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-                product = Product(
-                    id=row.get("id", "").strip(),
-                    title=row.get("title", "").strip(),
-                    url=row.get("url", "").strip(),
-                    image_url=row.get("image_url", "").strip() or None,
-                    price=price,
-                    currency=currency,
-                    availability=row.get("availability", "in_stock").strip(),
-                    brand=row.get("brand", "").strip() or None,
-                    category=row.get("category", "").strip() or None,
-                    updated_at=updated,
+    defaults = defaults or {}
+    columns = columns or {}
+    positions = {name: i for i, name in enumerate(header)}
+
+    plan: list[tuple[Optional[int], str]] = []
+    for name in fields:
+        source = columns.get(name, name)
+        if name in columns and source not in positions:
+            raise ValueError(f"Column '{source}' (mapped to '{name}') not found in CSV header")
+        plan.append((positions.get(source), defaults.get(name, "")))
+
+    width = max((i for i, _ in plan if i is not None), default=-1) + 1
+    if all(i is not None for i, _ in plan) and len(plan) > 1:
+        get = itemgetter(*(i for i, _ in plan))
+
+        def getter(row: list[str]) -> list[Optional[str]]:
+            if len(row) < width:
+                return _short_row(row, plan)
+            return [cell.strip() for cell in get(row)]
+
+        return getter
+
+    def getter(row: list[str]) -> list[Optional[str]]:
+        if len(row) < width:
+            return _short_row(row, plan)
+        return [row[i].strip() if i is not None else default for i, default in plan]
+
+    return getter
+
+
+def _short_row(row: list[str], plan: list[tuple[Optional[int], str]]) -> list[Optional[str]]:
+    n = len(row)
+    return [
+        (row[i].strip() if i < n else None) if i is not None else default for i, default in plan
+    ]
+
+
+def _row_to_record(cells: list[Optional[str]], updated_at: str) -> dict[str, Any]:
+    if None in cells:
+        raise ValueError("row has fewer columns than the header")
+    (
+        id_,
+        title,
+        url,
+        image_url,
+        price_raw,
+        currency,
+        availability,
+        brand,
+        category,
+        updated,
+    ) = cells
+
+    return {
+        "id": id_,
+        "title": title,
+        "url": url,
+        "image_url": image_url or None,
+        "price": float(price_raw) if price_raw else None,
+        "currency": currency or None,
+        "availability": availability,
+        "brand": brand or None,
+        "category": category or None,
+        "updated_at": updated or updated_at,
+    }
+
+
+def _iter_records(
+    rows: Iterable[list[str]],
+    get_cells: Callable[[list[str]], list[Optional[str]]],
+    updated_at: str,
+    first_row: int,
+) -> Iterator[tuple[int, Record]]:
+    row_num = first_row
+    for row in rows:
+        if not row:  # blank line, skipped like csv.DictReader does
+            continue
+        try:
+            yield row_num, _row_to_record(get_cells(row), updated_at)
+        except Exception as exc:
+            yield row_num, exc
+        row_num += 1
+
+
+def _csv_row_getter(
+    header: Sequence[str], columns: Optional[Mapping[str, str]]
+) -> Callable[[list[str]], list[Optional[str]]]:
+    return compile_row_getter(
+        header, CSV_FIELDS, defaults={"availability": "in_stock"}, columns=columns
+    )
+
+
+def _record_boundaries(path: Path, chunk_bytes: int) -> list[int]:
+    """Return byte offsets that split `path` into CSV-record-aligned ranges.
+
+    The first offset is the end of the header record, the last is the file
+    size, and the ones in between fall roughly every `chunk_bytes` on a newline
+    that is not inside a quoted field. Quote state is tracked by the parity of
+    '"' bytes seen so far (an escaped "" flips it twice), which only needs
+    bytes.count/find per block rather than a per-byte scan.
+
+    Parity is only a guess: a stray quote in an unquoted field (`3" wide`)
+    flips it for the rest of the file, so the ranges are checked by
+    _parse_range before their rows are used.
+    """
+    size = path.stat().st_size
+    boundaries: list[int] = []
+    target = 0  # the header ends at the first unquoted newline
+    in_quotes = False
+    base = 0
+
+    with path.open("rb") as f:
+        while block := f.read(_SCAN_BLOCK_BYTES):
+            block_end = base + len(block)
+            while target < block_end:
+                t = target - base
+                quoted = (in_quotes + block.count(b'"', 0, t)) % 2 == 1
+                while True:
+                    nl = block.find(b"\n", t)
+                    if nl == -1:
+                        # No boundary in this block; resume at the next one.
+                        target = block_end
+                        break
+                    quoted ^= block.count(b'"', t, nl) % 2 == 1
+                    if not quoted:
+                        boundaries.append(base + nl + 1)
+                        target = base + nl + 1 + chunk_bytes
+                        break
+                    t = nl + 1
+            in_quotes = (in_quotes + block.count(b'"')) % 2 == 1
+            base = block_end
+
+    if not boundaries:
+        return [size]
+    if boundaries[-1] != size:
+        boundaries.append(size)
+    return boundaries
+
+
+def _parse_range(
+    path: Path,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+    columns: Optional[Mapping[str, str]] = None,
+    updated_at: str = "",
+    trusted: bool = False,
+) -> Optional[tuple[list[Product], list[tuple[int, list[str], str]], int, float]]:
+    """Parse the records in bytes [start, end) of `path` (runs in a worker process).
+
+    Returns (products, errors, row_count, validate_seconds) where each error
+    is (row index relative to the start of the range, error_kinds, message).
+
+    Returns None if the range does not end on a record boundary: given that it
+    starts on one, the csv module then either ends inside a quoted field or
+    hits a quote it cannot place, both of which strict mode reports. Ranges
+    are checked in file order, so each accepted range proves the next one
+    starts on a real boundary.
+    """
+    with path.open("rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    errors: list[tuple[int, list[str], str]] = []
+    try:
+        records = list(
+            _iter_records(
+                csv.reader(io.StringIO(text, newline=""), strict=True),
+                _csv_row_getter(fieldnames, columns),
+                updated_at,
+                first_row=0,
+            )
+        )
+    except csv.Error:
+        return None
+
+    def collect(i: int, exc: Exception) -> None:
+        errors.append((i, error_kinds(exc), str(exc)))
+
+    stats = RunStats()
+    products = list(validate_records(records, collect, trusted=trusted, stats=stats))
+    return products, errors, len(records), stats.validate_seconds
+
+
+def _iter_csv_parallel(
+    path: Path,
+    workers: int,
+    chunk_bytes: int = _PARALLEL_CHUNK_BYTES,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    boundaries = _record_boundaries(path, chunk_bytes)
+    header_end = boundaries[0]
+    with path.open("rb") as f:
+        header = f.read(header_end).decode("utf-8-sig")
+    try:
+        header_rows = list(csv.reader(io.StringIO(header, newline=""), strict=True))
+    except csv.Error:
+        header_rows = []
+    ranges = [(a, b) for a, b in zip(boundaries, boundaries[1:]) if b > a]
+    if len(header_rows) != 1 or not header_rows[0] or len(ranges) <= 1:
+        # Nothing to split, or the header itself was misread
+        yield from iter_csv(path, columns=columns, trusted=trusted, errors=errors, stats=stats)
+        return
+    fieldnames = header_rows[0]
+    _csv_row_getter(fieldnames, columns)  # fail fast on a bad column mapping
+
+    updated_at = utc_timestamp()
+    options = (fieldnames, columns, updated_at, trusted)
+    row_base = 2  # header is row 1
+    resume_at: Optional[int] = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a bounded window of chunks in flight so results are merged in
+        # file order without holding the whole catalog in memory.
+        pending: deque[tuple[int, Future]] = deque()
+        todo = iter(ranges)
+        for start, end in todo:
+            pending.append((start, pool.submit(_parse_range, path, start, end, *options)))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            start, future = pending.popleft()
+            result = future.result()
+            if result is None:
+                # Misaligned range: read the rest of the file sequentially
+                for _, future in pending:
+                    future.cancel()
+                resume_at = start
+                break
+            products, rejected, row_count, validate_seconds = result
+            for next_range in todo:
+                pending.append(
+                    (next_range[0], pool.submit(_parse_range, path, *next_range, *options))
+                )
+                break
+            for i, kinds, message in rejected:
+                if errors is None:
+                    print(f"[warn] Row {row_base + i}: {message}", file=sys.stderr)
+                else:
+                    errors.record(f"Row {row_base + i}", kinds, message)
+            row_base += row_count
+            if stats is not None:
+                # Validation time is summed over the workers' CPU time
+                stats.rows_parsed += row_count
+                stats.rows_rejected += len(rejected)
+                stats.validate_seconds += validate_seconds
+            yield from products
+
+    if resume_at is not None:
+        with path.open("rb") as raw:
+            raw.seek(resume_at)
+            with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+                records = _iter_records(
+                    csv.reader(f), _csv_row_getter(fieldnames, columns), updated_at, row_base
                 )
-                products.append(product)
-            except Exception as exc:
-                errors.append(f"Row {row_num}: {exc}")
+                yield from validate_records(
+                    records, row_warner("Row", errors), trusted=trusted, stats=stats
+                )
+
+
+def iter_csv(
+    path: str | Path,
+    workers: int = 1,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    engine: str = "python",
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a CSV file, yielding one Product per valid row.
+
+    Rows are read incrementally and validated in blocks of BATCH_SIZE, so
+    arbitrarily large files can be piped straight into the feed writer.
+    Invalid rows are reported to stderr in file order, or to `errors` if
+    given (see ImportErrors).
 
-    if errors:
-        import sys
+    The header is resolved to column positions once (see compile_row_getter);
+    `columns` maps Product fields to non-standard header names, e.g.
+    {"id": "sku", "title": "name"}. `trusted` skips validation for input that
+    is known to be valid (see construct_product).
 
-        for err in errors:
-            print(f"[warn] {err}", file=sys.stderr)
+    With `workers` > 1 the file is split into quote-aware byte ranges that are
+    parsed and validated in a process pool; products are still yielded in
+    file order and warnings keep their original row numbers. If a range turns
+    out not to start on a record boundary, the rest of the file is read
+    sequentially. Compressed files
+    and standard input ("-", see open_source) are always parsed here.
 
-    return products
+    `engine="arrow"` parses with pyarrow's multithreaded CSV reader instead
+    (see arrow_importer.iter_csv_arrow); `workers` is then ignored.
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine: {engine}")
+    if engine == "arrow":
+        from llmindex.importers.arrow_importer import iter_csv_arrow
+
+        yield from iter_csv_arrow(
+            path, columns=columns, trusted=trusted, errors=errors, stats=stats
+        )
+        return
+
+    path = Path(path)
+
+    # Byte-range splitting needs random access, so stdin and compressed input
+    # are read sequentially
+    if workers > 1 and not is_stdin(path) and detect_compression(path) is None:
+        yield from _iter_csv_parallel(
+            path, workers, columns=columns, trusted=trusted, errors=errors, stats=stats
+        )
+        return
+
+    with open_source(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        records = _iter_records(
+            reader, _csv_row_getter(header, columns), utc_timestamp(), first_row=2
+        )
+        yield from validate_records(
+            records, row_warner("Row", errors), trusted=trusted, stats=stats
+        )
+
+
+def import_csv(
+    path: str | Path,
+    workers: int = 1,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    engine: str = "python",
+) -> list[Product]:
+    """Import products from a CSV file.
+
+    Expected columns: id, title, url, image_url, price, currency, availability,
+                      brand, category, updated_at
+
+    Rows with missing required fields (id, title, url, availability) are skipped
+    with a warning printed to stderr. `workers` > 1 parses in parallel processes;
+    `engine` selects the CSV parser (one of CSV_ENGINES).
+    """
+    return list(iter_csv(path, workers=workers, columns=columns, trusted=trusted, engine=engine))
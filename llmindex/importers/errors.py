@@ -0,0 +1,183 @@
+"""Aggregated reporting of records rejected during an import.
+
+By default every importer prints one `[warn]` line per rejected record. An
+ImportErrors collector replaces that with bounded state: a counter per error
+kind (e.g. "title: string_too_short") and the first few sample records of
+each kind. Only sampled records are echoed to stderr, `max_errors` aborts the
+import early, and `report()` gives a JSON-ready summary for CI.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+DEFAULT_MAX_SAMPLES = 5
+
+
+class ImportAbortedError(ValueError):
+    """Raised when an import rejects more records than ImportErrors.max_errors."""
+
+
+def error_kinds(exc: Exception) -> list[str]:
+    """Classify a rejected record: "<field>: <pydantic error type>" or the exception name."""
+    if isinstance(exc, ValidationError):
+        kinds = []
+        for error in exc.errors(include_url=False):
+            where = ".".join(str(part) for part in error["loc"]) or "record"
+            kinds.append(f"{where}: {error['type']}")
+        return list(dict.fromkeys(kinds))
+    return [type(exc).__name__]
+
+
+@dataclass
+class _Tally:
+    total: int = 0
+    aborted: bool = False
+    counts: Counter = field(default_factory=Counter)
+    samples: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+
+
+class ImportErrors:
+    """Counts rejected records per error kind and keeps the first samples of each.
+
+    Args:
+        max_samples: Sample records kept (and echoed) per error kind.
+        max_errors: Raise ImportAbortedError once more than this many records
+            have been rejected (None: never abort).
+        echo: Print each sampled record to stderr as `[warn] <ref>: <error>`.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        max_errors: Optional[int] = None,
+        echo: bool = True,
+    ) -> None:
+        self.max_samples = max_samples
+        self.max_errors = max_errors
+        self.echo = echo
+        self.source: Optional[str] = None
+        # When set, every rejected record is also recorded there, e.g. to
+        # summarize one source's rejections for a cached catalog
+        self.mirror: Optional[ImportErrors] = None
+        self._tally = _Tally()
+
+    def with_source(self, source: str) -> ImportErrors:
+        """A view that tags its samples with `source` and shares this collector's counts."""
+        view = ImportErrors(self.max_samples, self.max_errors, self.echo)
+        view.source = source
+        view._tally = self._tally
+        return view
+
+    @property
+    def total(self) -> int:
+        """Number of rejected records."""
+        return self._tally.total
+
+    @property
+    def counts(self) -> Counter:
+        """Rejected records per error kind (a record can have several kinds)."""
+        return self._tally.counts
+
+    def add(self, ref: str, exc: Exception) -> None:
+        """Record a rejected record, e.g. add("Row 12", exc)."""
+        self.record(ref, error_kinds(exc), str(exc))
+
+    def record(self, ref: str, kinds: list[str], message: str) -> None:
+        """Record a rejected record that was already classified (see error_kinds)."""
+        if self.mirror is not None:
+            self.mirror.record(ref, kinds, message)
+        tally = self._tally
+        tally.total += 1
+        sampled = False
+        for kind in kinds:
+            tally.counts[kind] += 1
+            samples = tally.samples.setdefault(kind, [])
+            if len(samples) < self.max_samples:
+                sample = {"ref": ref, "message": message}
+                if self.source is not None:
+                    sample["source"] = self.source
+                samples.append(sample)
+                sampled = True
+
+        if sampled:
+            self._echo(ref, message)
+        self._check_limit()
+
+    def replay(self, report: Mapping[str, Any]) -> None:
+        """Record the rejections summarized by an earlier report() again.
+
+        Counts add up as if the records were rejected now; samples are kept
+        and echoed up to `max_samples` per kind, and `max_errors` applies.
+        """
+        tally = self._tally
+        tally.total += report["total"]
+        echoed: set[tuple[str, str]] = set()
+        for kind, entry in report["kinds"].items():
+            tally.counts[kind] += entry["count"]
+            samples = tally.samples.setdefault(kind, [])
+            for sample in entry["samples"][: max(self.max_samples - len(samples), 0)]:
+                ref, message = sample["ref"], sample["message"]
+                samples.append({"ref": ref, "message": message})
+                if self.source is not None:
+                    samples[-1]["source"] = self.source
+                if (ref, message) not in echoed:
+                    echoed.add((ref, message))
+                    self._echo(ref, message)
+        self._check_limit()
+
+    def _echo(self, ref: str, message: str) -> None:
+        if self.echo:
+            where = f"{self.source} {ref}" if self.source is not None else ref
+            print(f"[warn] {where}: {message}", file=sys.stderr)
+
+    def _check_limit(self) -> None:
+        if self.max_errors is not None and self._tally.total > self.max_errors:
+            self._tally.aborted = True
+            raise ImportAbortedError(f"Import aborted: more than {self.max_errors} invalid records")
+
+    def report(self) -> dict[str, Any]:
+        """JSON-serialisable summary: totals plus count and samples per kind."""
+        tally = self._tally
+        return {
+            "total": tally.total,
+            "aborted": tally.aborted,
+            "max_errors": self.max_errors,
+            "kinds": {
+                kind: {"count": count, "samples": tally.samples[kind]}
+                for kind, count in tally.counts.most_common()
+            },
+        }
+
+    def write_json(self, path: Path) -> None:
+        """Write report() to `path` as indented JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2, ensure_ascii=False) + "\n")
+
+
+def row_warner(
+    label: str, errors: Optional[ImportErrors] = None
+) -> Callable[[Any, Exception], None]:
+    """Return a validate_records `warn` callback for records referenced as "<label> N".
+
+    Without `errors` every rejected record is printed to stderr.
+    """
+    if errors is None:
+
+        def warn(ref: Any, exc: Exception) -> None:
+            print(f"[warn] {label} {ref}: {exc}", file=sys.stderr)
+
+    else:
+
+        def warn(ref: Any, exc: Exception) -> None:
+            errors.add(f"{label} {ref}", exc)
+
+    return warn
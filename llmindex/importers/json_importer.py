@@ -3,52 +3,184 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import IO, Any, Optional
 
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.compression import open_source
+from llmindex.importers.errors import ImportErrors, row_warner
 from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
 
+# Characters read per refill. Items larger than this are handled by growing the
+# read size geometrically until the item decodes.
+_CHUNK_SIZE = 1 << 16
+# Largest array element accepted, in characters: an element that still does not
+# decode with this much buffered is malformed, rather than cut off by a refill
+MAX_ITEM_CHARS = 64 << 20
+_WHITESPACE = " \t\n\r"
+# Decode errors that more input cannot fix once the offending character is buffered
+_DEFINITE_ERRORS = (
+    "Expecting ',' delimiter",
+    "Expecting ':' delimiter",
+    "Expecting property name enclosed in double quotes",
+)
+_NUMBER_CHARS = "0123456789.eE+-"
 
-def import_json(path: str | Path) -> list[Product]:
-    """Import products from a JSON file.
 
-    Expected format: a JSON array of objects with fields matching the Product model:
-    [
-      {"id": "P001", "title": "Widget", "url": "https://...", "price": 9.99, ...},
-      ...
-    ]
+def _iter_json_array(
+    f: IO[str], chunk_size: int = _CHUNK_SIZE, max_item_chars: int = MAX_ITEM_CHARS
+) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array, reading `f` incrementally.
+
+    Memory is bounded by the largest single element plus one chunk, instead of
+    the whole document, and by about twice `max_item_chars` for malformed
+    input. Raises ValueError for malformed JSON, an element longer than
+    `max_item_chars`, or when the top-level value is not an array.
     """
-    path = Path(path)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    offset = 0  # characters discarded before buf[0], for error positions
+    eof = False
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected JSON array, got {type(data).__name__}")
+    def fill() -> bool:
+        nonlocal buf, pos, offset, eof
+        if eof:
+            return False
+        chunk = f.read(max(chunk_size, len(buf) - pos))
+        if not chunk:
+            eof = True
+            return False
+        offset += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
 
-    products: list[Product] = []
-    errors: list[str] = []
+    def skip_ws() -> str:
+        """Advance past whitespace; return the next character ("" at EOF)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
 
-    for i, item in enumerate(data):
+    def error(msg: str, at: int) -> ValueError:
+        return ValueError(f"Invalid JSON at offset {offset + at}: {msg}")
+
+    first = skip_ws()
+    if first != "[":
+        rest = buf[pos:] + f.read()
         try:
-            if not isinstance(item, dict):
-                errors.append(f"Item {i}: expected object, got {type(item).__name__}")
-                continue
+            data = json.loads(rest)
+        except json.JSONDecodeError as e:
+            raise error(e.msg, e.pos) from e
+        raise ValueError(f"Expected JSON array, got {type(data).__name__}")
+    pos += 1
+
+    if skip_ws() == "]":
+        pos += 1
+    else:
+        while True:
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if e.pos < len(buf) and e.msg in _DEFINITE_ERRORS:
+                        raise error(e.msg, e.pos) from e
+                    if len(buf) - pos > max_item_chars:
+                        raise error(
+                            f"{e.msg} (no complete element within {max_item_chars} characters)",
+                            e.pos,
+                        ) from e
+                    if fill():
+                        continue
+                    raise error(e.msg, e.pos) from e
+                # A number is only complete once a delimiter follows it: "1." or
+                # "1.5e" at the buffer edge decode as a shorter, wrong number.
+                if isinstance(item, (int, float)) and not buf[end:].strip(_NUMBER_CHARS) and fill():
+                    continue
+                break
+            pos = end
+            yield item
+
+            sep = skip_ws()
+            if sep == ",":
+                pos += 1
+                skip_ws()
+            elif sep == "]":
+                pos += 1
+                break
+            else:
+                raise error("Expecting ',' delimiter", pos)
+
+    if skip_ws():
+        raise error("Extra data", pos)
+
+
+def apply_item_defaults(item: dict, updated_at: str) -> dict:
+    """Fill import defaults into a decoded JSON object in place and return it.
+
+    Missing or empty `updated_at` becomes `updated_at` and missing or empty
+    `availability` becomes "in_stock".
+    """
+    if not item.get("updated_at"):
+        item["updated_at"] = updated_at
+    if not item.get("availability"):
+        item["availability"] = "in_stock"
+    return item
+
+
+def product_from_item(item: dict) -> Product:
+    """Build a Product from a decoded JSON object, filling in import defaults.
+
+    Missing or empty `updated_at` defaults to now and missing or empty
+    `availability` to "in_stock". Raises on validation errors.
+    """
+    return Product(**apply_item_defaults(item, utc_timestamp()))
 
-            # Fill in defaults
-            if "updated_at" not in item or not item["updated_at"]:
-                item["updated_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-            if "availability" not in item or not item["availability"]:
-                item["availability"] = "in_stock"
+def _iter_records(items: Iterable[Any], updated_at: str) -> Iterator[tuple[int, Record]]:
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            yield i, ValueError(f"expected object, got {type(item).__name__}")
+            continue
+        yield i, apply_item_defaults(item, updated_at)
 
-            product = Product(**item)
-            products.append(product)
-        except Exception as exc:
-            errors.append(f"Item {i}: {exc}")
 
-    if errors:
-        import sys
+def iter_json(
+    path: str | Path,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a JSON array file, yielding one Product per valid item.
+
+    The file is parsed incrementally and items are validated in blocks, so
+    multi-GB arrays import with memory bounded by the largest item. Invalid
+    items are reported to stderr in file order, or to `errors` if given.
+    `trusted` skips validation (see construct_product).
+    """
+    path = Path(path)
+
+    with open_source(path, encoding="utf-8") as f:
+        records = _iter_records(_iter_json_array(f), utc_timestamp())
+        yield from validate_records(
+            records, row_warner("Item", errors), trusted=trusted, stats=stats
+        )
 
-        for err in errors:
-            print(f"[warn] {err}", file=sys.stderr)
 
-    return products
+def import_json(path: str | Path, trusted: bool = False) -> list[Product]:
+    """Import products from a JSON file.
+
+    Expected format: a JSON array of objects with fields matching the Product model:
+    [
+      {"id": "P001", "title": "Widget", "url": "https://...", "price": 9.99, ...},
+      ...
+    ]
+    """
+    return list(iter_json(path, trusted=trusted))
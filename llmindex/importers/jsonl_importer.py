@@ -0,0 +1,62 @@
+"""JSONL importer — reads newline-delimited product objects (NDJSON).
+
+Accepts the same fields as the JSON importer, one object per line. A
+products.jsonl feed written by `llmindex generate` is valid input, so a
+previous build's feed can be fed straight back in.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional
+
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.compression import open_source
+from llmindex.importers.errors import ImportErrors, row_warner
+from llmindex.importers.json_importer import apply_item_defaults
+from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
+
+
+def _iter_records(f: Iterable[str], updated_at: str) -> Iterator[tuple[int, Record]]:
+    for line_num, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_num, ValueError(f"invalid JSON — {exc}")
+            continue
+        if not isinstance(item, dict):
+            yield line_num, ValueError(f"expected object, got {type(item).__name__}")
+            continue
+        yield line_num, apply_item_defaults(item, updated_at)
+
+
+def iter_jsonl(
+    path: str | Path,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a JSONL file, parsing one line at a time.
+
+    Blank lines are ignored. Malformed or invalid lines are reported to stderr
+    with their 1-based line number and skipped. `trusted` skips validation,
+    e.g. when re-importing a feed written by `llmindex generate`. Pass
+    `errors` to aggregate rejected lines instead of printing each one.
+    """
+    path = Path(path)
+
+    with open_source(path, encoding="utf-8-sig") as f:
+        records = _iter_records(f, utc_timestamp())
+        yield from validate_records(
+            records, row_warner("Line", errors), trusted=trusted, stats=stats
+        )
+
+
+def import_jsonl(path: str | Path, trusted: bool = False) -> list[Product]:
+    """Import products from a JSONL file (one JSON object per line)."""
+    return list(iter_jsonl(path, trusted=trusted))
@@ -0,0 +1,201 @@
+"""Google Merchant Center importer — reads product feeds in TSV or RSS/Atom XML.
+
+Merchant Center attributes map to Product fields as follows:
+
+    id -> id, title -> title, link -> url, image_link -> image_url,
+    price ("12.99 USD") -> price + currency, availability -> availability,
+    brand -> brand, product_type (else google_product_category) -> category
+
+XML feeds (RSS 2.0 `<item>` or Atom `<entry>` elements, with attributes in the
+`g:` namespace or unprefixed) are parsed incrementally with iterparse, and
+each item is dropped from the tree once it has been read, so memory stays
+flat however large the feed. Any other input is read as tab-separated text
+whose header names the attributes ("image_link", "image link" or
+"g:image_link"). The format is detected from the first non-blank character.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any, Optional
+from xml.etree import ElementTree
+
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.compression import open_source
+from llmindex.importers.csv_importer import compile_row_getter
+from llmindex.importers.errors import ImportErrors, row_warner
+from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
+
+GOOGLE_NS = "http://base.google.com/ns/1.0"
+
+# Merchant Center attributes read from a feed, in extraction order
+_ATTRIBUTES = (
+    "id",
+    "title",
+    "link",
+    "image_link",
+    "price",
+    "availability",
+    "brand",
+    "product_type",
+    "google_product_category",
+)
+
+# Merchant Center availability values Product does not accept itself
+_AVAILABILITY = {"backorder": "out_of_stock"}
+
+_ITEM_TAGS = ("item", "entry")
+_SNIFF_BYTES = 64
+
+
+def _attribute_name(header: str) -> str:
+    """Normalise a TSV header ("g:Image Link") to its attribute name ("image_link")."""
+    name = header.strip().lower()
+    if name.startswith("g:"):
+        name = name[2:]
+    return name.replace(" ", "_")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _parse_price(raw: str) -> tuple[Optional[float], Optional[str]]:
+    """Split a Merchant Center price ("12.99 USD") into value and currency."""
+    parts = raw.split()
+    if not parts:
+        return None, None
+    if len(parts) > 2:
+        raise ValueError(f"invalid price {raw!r} (expected e.g. '12.99 USD')")
+    try:
+        value = float(parts[0])
+    except ValueError:
+        raise ValueError(f"invalid price {raw!r} (expected e.g. '12.99 USD')") from None
+    return value, parts[1].upper() if len(parts) == 2 else None
+
+
+def _record(attrs: Mapping[str, str], updated_at: str) -> dict[str, Any]:
+    price, currency = _parse_price(attrs.get("price", ""))
+    availability = attrs.get("availability", "")
+    return {
+        "id": attrs.get("id", ""),
+        "title": attrs.get("title", ""),
+        "url": attrs.get("link", ""),
+        "image_url": attrs.get("image_link") or None,
+        "price": price,
+        "currency": currency,
+        "availability": _AVAILABILITY.get(availability.lower(), availability) or "in_stock",
+        "brand": attrs.get("brand") or None,
+        "category": attrs.get("product_type") or attrs.get("google_product_category") or None,
+        "updated_at": updated_at,
+    }
+
+
+def _item_attributes(item: ElementTree.Element) -> dict[str, str]:
+    attrs: dict[str, str] = {}
+    for child in item:
+        name = _local_name(child.tag)
+        if name == "link" and child.get("href") is not None:
+            # Atom: <link href="..."/>; only the alternate (default) link is the product page
+            if child.get("rel", "alternate") != "alternate":
+                continue
+            value = child.get("href", "")
+        else:
+            value = child.text or ""
+        # <g:title> wins over the plain RSS <title>
+        if name not in attrs or child.tag.startswith(f"{{{GOOGLE_NS}}}"):
+            attrs[name] = value.strip()
+    return attrs
+
+
+def _iter_xml_items(f: IO[bytes]) -> Iterator[dict[str, str]]:
+    """Yield the attributes of each <item>/<entry>, discarding it once read."""
+    parents: list[ElementTree.Element] = []
+    for event, elem in ElementTree.iterparse(f, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if _local_name(elem.tag) in _ITEM_TAGS:
+            yield _item_attributes(elem)
+            # Clearing the parent (<channel>/<feed>) drops this item from the tree
+            if parents:
+                parents[-1].clear()
+            elem.clear()
+
+
+def _iter_xml_records(f: IO[bytes], updated_at: str) -> Iterator[tuple[int, Record]]:
+    items = _iter_xml_items(f)
+    item_num = 1
+    while True:
+        try:
+            attrs = next(items)
+        except StopIteration:
+            return
+        except ElementTree.ParseError as e:
+            raise ValueError(f"Invalid Merchant Center XML: {e}") from e
+        try:
+            yield item_num, _record(attrs, updated_at)
+        except Exception as exc:
+            yield item_num, exc
+        item_num += 1
+
+
+def _iter_tsv_records(rows: Iterable[list[str]], updated_at: str) -> Iterator[tuple[int, Record]]:
+    header = next(iter(rows), None)
+    if header is None:
+        return
+    get_cells = compile_row_getter([_attribute_name(h) for h in header], _ATTRIBUTES)
+    row_num = 1  # header is row 1
+    for row in rows:
+        if not row:  # blank line, skipped like csv_importer does
+            continue
+        row_num += 1
+        cells = get_cells(row)
+        if None in cells:
+            yield row_num, ValueError("row has fewer columns than the header")
+            continue
+        try:
+            yield row_num, _record(dict(zip(_ATTRIBUTES, cells)), updated_at)
+        except Exception as exc:
+            yield row_num, exc
+
+
+def _is_xml(f: IO[bytes]) -> bool:
+    head = f.peek(_SNIFF_BYTES)[:_SNIFF_BYTES]  # type: ignore[attr-defined]
+    return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<")
+
+
+def iter_merchant_feed(
+    path: str | Path,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a Google Merchant Center feed (TSV or RSS/Atom XML).
+
+    Missing `availability` defaults to "in_stock" and "backorder" becomes
+    "out_of_stock". Invalid items are reported to stderr (or to `errors`, if
+    given) as "Item N" for XML and "Row N" for TSV. Malformed XML raises
+    ValueError.
+    """
+    with open_source(path, "rb") as raw:
+        f = raw if hasattr(raw, "peek") else io.BufferedReader(raw)
+        updated_at = utc_timestamp()
+        if _is_xml(f):
+            records = _iter_xml_records(f, updated_at)
+            warn = row_warner("Item", errors)
+        else:
+            text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+            records = _iter_tsv_records(csv.reader(text, dialect=csv.excel_tab), updated_at)
+            warn = row_warner("Row", errors)
+        yield from validate_records(records, warn, trusted=trusted, stats=stats)
+
+
+def import_merchant_feed(path: str | Path, trusted: bool = False) -> list[Product]:
+    """Import products from a Google Merchant Center feed."""
+    return list(iter_merchant_feed(path, trusted=trusted))
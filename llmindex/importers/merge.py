@@ -0,0 +1,187 @@
+"""Merge several product sources into one catalog, deduplicated by `id`.
+
+Sources are read in order and each product is given a sequence number. When
+two sources (or two rows) share an `id`, the merge policy picks the winner:
+
+- "last-wins": the product read last.
+- "newest": the product with the latest `updated_at`; ties go to the last one.
+
+The merged catalog keeps the order in which ids first appeared. Up to
+`max_in_memory` distinct ids are merged in a dict; beyond that, the partial
+merge is spilled to sorted run files on disk and combined with an external
+merge sort, so memory stays bounded however large the catalogs are.
+"""
+
+from __future__ import annotations
+
+import heapq
+import pickle
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+from itertools import groupby, islice
+from operator import attrgetter, itemgetter
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from llmindex.importers.batch import construct_product
+from llmindex.llmindex_cli.models import Product
+
+MERGE_POLICIES = ("last-wins", "newest")
+
+# Distinct ids merged in memory before spilling to disk
+DEFAULT_MAX_IN_MEMORY = 250_000
+
+_OLDEST = float("-inf")
+# Entries per pickled block in a run file
+_RUN_BLOCK = 1024
+_FIELDS = tuple(Product.model_fields)
+_field_values = attrgetter(*_FIELDS)
+
+
+class _Entry(NamedTuple):
+    id: str
+    first_seq: int  # when the id was first seen (output order)
+    seq: int  # when the current winner was read
+    updated: float  # winner's updated_at as a POSIX timestamp
+    product: Any
+
+
+def _timestamp(value: Optional[str]) -> float:
+    """Parse an ISO 8601 `updated_at` (naive means UTC); unparseable sorts oldest."""
+    if not value:
+        return _OLDEST
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return _OLDEST
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _rank(policy: str, entry: _Entry) -> tuple[float, int]:
+    if policy == "newest":
+        return entry.updated, entry.seq
+    return _OLDEST, entry.seq
+
+
+def _combine(policy: str, old: _Entry, new: _Entry) -> _Entry:
+    winner = new if _rank(policy, new) > _rank(policy, old) else old
+    return winner._replace(first_seq=min(old.first_seq, new.first_seq))
+
+
+def _write_run(path: Path, entries: Iterable[tuple]) -> Path:
+    # Pickled in blocks: far fewer pickle calls, and a reader holds one block
+    with path.open("wb") as f:
+        iterator = iter(entries)
+        while block := list(islice(iterator, _RUN_BLOCK)):
+            pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: Path) -> Iterator[Any]:
+    with path.open("rb") as f:
+        while True:
+            try:
+                yield from pickle.load(f)
+            except EOFError:
+                return
+
+
+class _ExternalMerge:
+    """Sorted run files in a temporary directory (removed by close())."""
+
+    def __init__(self, tmp_dir: Optional[Path]) -> None:
+        self._dir = tempfile.TemporaryDirectory(prefix="llmindex-merge-", dir=tmp_dir)
+        self._count = 0
+
+    def write(self, entries: Iterable[tuple]) -> Path:
+        self._count += 1
+        return _write_run(Path(self._dir.name) / f"run-{self._count}.pickle", entries)
+
+    def close(self) -> None:
+        self._dir.cleanup()
+
+
+def _spill(entries: dict[str, _Entry]) -> Iterator[tuple]:
+    # Products are stored as tuples of field values; they were validated on import
+    for e in sorted(entries.values(), key=itemgetter(0)):
+        yield e.id, e.first_seq, e.seq, e.updated, _field_values(e.product)
+
+
+def _merge_runs(
+    policy: str, external: _ExternalMerge, runs: list[Path], max_in_memory: int
+) -> Iterator[Product]:
+    # Pass 1: runs are sorted by id, so each id's entries arrive together
+    merged = heapq.merge(*(_read_run(run) for run in runs), key=itemgetter(0))
+    by_first_seq: list[Path] = []
+    chunk: list[tuple[int, tuple]] = []
+    for _, group in groupby(merged, key=itemgetter(0)):
+        winner = None
+        for raw in group:
+            entry = _Entry(*raw)
+            winner = entry if winner is None else _combine(policy, winner, entry)
+        chunk.append((winner.first_seq, winner.product))
+        if len(chunk) >= max_in_memory:
+            chunk.sort(key=itemgetter(0))
+            by_first_seq.append(external.write(chunk))
+            chunk = []
+
+    # Pass 2: restore first-appearance order
+    chunk.sort(key=itemgetter(0))
+    runs = [_read_run(run) for run in by_first_seq] + [iter(chunk)]
+    for _, values in heapq.merge(*runs, key=itemgetter(0)):
+        yield construct_product(dict(zip(_FIELDS, values)))
+
+
+def merge_products(
+    sources: Sequence[Iterable[Any]],
+    policy: str = "last-wins",
+    max_in_memory: int = DEFAULT_MAX_IN_MEMORY,
+    tmp_dir: Optional[Path] = None,
+) -> Iterator[Any]:
+    """Merge product iterables into one stream with a single product per `id`.
+
+    Args:
+        sources: Product iterables (Products or ProductRows), in priority order.
+        policy: One of MERGE_POLICIES.
+        max_in_memory: Distinct ids kept in memory before spilling sorted runs
+            to disk and finishing with an external merge sort.
+        tmp_dir: Directory for the run files (default: the system temp dir).
+    """
+    if policy not in MERGE_POLICIES:
+        raise ValueError(f"Unknown merge policy: {policy}")
+    if max_in_memory < 1:
+        raise ValueError("max_in_memory must be at least 1")
+
+    newest = policy == "newest"
+    entries: dict[str, _Entry] = {}
+    external: Optional[_ExternalMerge] = None
+    runs: list[Path] = []
+    seq = 0
+    try:
+        for source in sources:
+            for product in source:
+                updated = _timestamp(product.updated_at) if newest else _OLDEST
+                new = _Entry(product.id, seq, seq, updated, product)
+                old = entries.get(product.id)
+                entries[product.id] = new if old is None else _combine(policy, old, new)
+                seq += 1
+                if len(entries) >= max_in_memory:
+                    external = external or _ExternalMerge(tmp_dir)
+                    runs.append(external.write(_spill(entries)))
+                    entries = {}
+
+        if external is None:
+            # Insertion order is first-appearance order
+            yield from (entry.product for entry in entries.values())
+            return
+
+        if entries:
+            runs.append(external.write(_spill(entries)))
+            entries = {}
+        yield from _merge_runs(policy, external, runs, max_in_memory)
+    finally:
+        if external is not None:
+            external.close()
@@ -9,12 +9,20 @@ This importer maps the Shopify format to the llmindex Product model.
 from __future__ import annotations
 
 import csv
-from datetime import datetime, timezone
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Optional
 
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.compression import open_source
+from llmindex.importers.csv_importer import compile_row_getter
+from llmindex.importers.errors import ImportErrors, row_warner
 from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
 
-# Mapping from Shopify CSV columns to llmindex Product fields
+# Mapping from Shopify CSV columns to llmindex Product fields (also the order in
+# which iter_shopify_csv extracts them)
 _SHOPIFY_COLUMN_MAP = {
     "Handle": "handle",
     "Title": "title",
@@ -25,13 +33,197 @@ _SHOPIFY_COLUMN_MAP = {
     "Image Src": "image_url",
     "Published": "published",
     "Status": "status",
+    "Variant Inventory Qty": "inventory_qty",
+    "Variant Inventory Policy": "inventory_policy",
 }
 
+_SHOPIFY_DEFAULTS = {"Status": "active", "Published": "true", "Variant Inventory Policy": "deny"}
+
+_SHORT_ROW = "row has fewer columns than the header"
+
+
+def _variant_in_stock(qty_raw: str, policy: str) -> bool:
+    # Untracked inventory (no quantity) and "continue selling" count as in stock
+    if not qty_raw or policy.lower() == "continue":
+        return True
+    try:
+        return float(qty_raw) > 0
+    except ValueError:
+        return True
+
+
+@dataclass
+class _Handle:
+    """One handle's rows folded together: first-row fields plus variant aggregates."""
+
+    row_num: int
+    handle: str
+    title: str
+    brand: str
+    category: str
+    sku: str
+    image_url: str
+    listed: bool
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    in_stock: bool = False
+
+    def add_variant(self, sku: str, price_raw: str, qty_raw: str, policy: str) -> None:
+        if not (sku or price_raw or qty_raw):
+            # Extra image rows repeat the handle but carry no variant
+            return
+        self.in_stock = self.in_stock or _variant_in_stock(qty_raw, policy)
+        if price_raw:
+            price = float(price_raw)
+            if self.min_price is None or price < self.min_price:
+                self.min_price = price
+            if self.max_price is None or price > self.max_price:
+                self.max_price = price
+
+    def record(self, base_url: str, currency: str, updated_at: str) -> dict[str, Any]:
+        price: Optional[float] = self.min_price
+        price_range = None
+        if self.min_price is not None and self.min_price != self.max_price:
+            # The feed schema takes either price + currency or price_range
+            price = None
+            price_range = {"min": self.min_price, "max": self.max_price, "currency": currency}
+        return {
+            # SKU as product ID, fallback to handle
+            "id": self.sku or self.handle,
+            "title": self.title,
+            # Build product URL from handle
+            "url": f"{base_url}/products/{self.handle}",
+            "image_url": self.image_url or None,
+            "price": price,
+            "currency": currency if price is not None else None,
+            "price_range": price_range,
+            "availability": "in_stock" if self.listed and self.in_stock else "out_of_stock",
+            "brand": self.brand or None,
+            "category": self.category or None,
+            "updated_at": updated_at,
+        }
+
+
+def _iter_records(
+    rows: Iterable[list[str]],
+    get_cells: Callable[[list[str]], list[Optional[str]]],
+    base_url: str,
+    currency: str,
+    updated_at: str,
+) -> Iterator[tuple[int, Record]]:
+    """Fold each run of rows sharing a Handle into one product record.
+
+    Shopify writes a product's variant rows directly after its first row, so
+    only the current handle is held in memory; its record is emitted as soon
+    as a different handle starts.
+    """
+    current: Optional[_Handle] = None
+
+    row_num = 1  # header is row 1
+    for row in rows:
+        if not row:  # blank line, skipped like csv.DictReader does
+            continue
+        row_num += 1
+        cells = get_cells(row)
+        (
+            handle,
+            title,
+            brand,
+            category,
+            sku,
+            price_raw,
+            image_url,
+            published,
+            status,
+            qty_raw,
+            policy,
+        ) = cells
+        if handle is None:
+            yield row_num, ValueError(_SHORT_ROW)
+            continue
+        if not handle:
+            continue
+
+        if current is not None and handle == current.handle:
+            # Another variant of the current product
+            try:
+                if None in cells:
+                    raise ValueError(_SHORT_ROW)
+                current.add_variant(sku, price_raw, qty_raw, policy)
+            except Exception as exc:
+                yield row_num, exc
+            continue
+
+        if current is not None:
+            yield current.row_num, current.record(base_url, currency, updated_at)
+            current = None
+
+        try:
+            if title is None:
+                raise ValueError(_SHORT_ROW)
+            if not title:
+                continue
+            if None in cells:
+                raise ValueError(_SHORT_ROW)
+
+            product = _Handle(
+                row_num=row_num,
+                handle=handle,
+                title=title,
+                brand=brand,
+                category=category,
+                sku=sku,
+                image_url=image_url,
+                # Drafts and unpublished products are listed as out of stock
+                listed=status.lower() != "draft" and published.lower() != "false",
+            )
+            product.add_variant(sku, price_raw, qty_raw, policy)
+        except Exception as exc:
+            yield row_num, exc
+            continue
+        # Only a handle whose first variant is valid collects further variants
+        current = product
+
+    if current is not None:
+        yield current.row_num, current.record(base_url, currency, updated_at)
+
+
+def iter_shopify_csv(
+    path: str | Path,
+    base_url: str = "https://example.com",
+    currency: str = "USD",
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from a Shopify product export CSV.
+
+    Emits one Product per handle. Title, vendor, type, image and status come
+    from the handle's first row; variant prices are folded into `price`
+    (all equal) or `price_range` (min/max), and the product is in stock if
+    any variant is. Rows are expected grouped by handle, as Shopify exports
+    them, so memory does not grow with the file. Invalid rows are reported
+    to stderr, or to `errors` if given.
+    """
+    path = Path(path)
+
+    with open_source(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        get_cells = compile_row_getter(header, list(_SHOPIFY_COLUMN_MAP), _SHOPIFY_DEFAULTS)
+        records = _iter_records(reader, get_cells, base_url.rstrip("/"), currency, utc_timestamp())
+        yield from validate_records(
+            records, row_warner("Row", errors), trusted=trusted, stats=stats
+        )
+
 
 def import_shopify_csv(
     path: str | Path,
     base_url: str = "https://example.com",
     currency: str = "USD",
+    trusted: bool = False,
 ) -> list[Product]:
     """Import products from a Shopify product export CSV.
 
@@ -39,80 +231,9 @@ def import_shopify_csv(
         path: Path to the Shopify CSV export.
         base_url: Base URL for constructing product URLs (e.g., https://mystore.com).
         currency: Default currency code (Shopify CSVs may not include currency).
+        trusted: Skip Product validation (see construct_product).
 
     Returns:
         List of Product models.
     """
-    path = Path(path)
-    products: list[Product] = []
-    errors: list[str] = []
-    seen_handles: set[str] = set()
-
-    base_url = base_url.rstrip("/")
-
-    with path.open(newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for row_num, row in enumerate(reader, start=2):
-            try:
-                handle = row.get("Handle", "").strip()
-                if not handle:
-                    continue
-
-                # Shopify exports multiple rows per product (variants).
-                # Take only the first row for each handle.
-                if handle in seen_handles:
-                    continue
-                seen_handles.add(handle)
-
-                title = row.get("Title", "").strip()
-                if not title:
-                    continue
-
-                # Build product URL from handle
-                url = f"{base_url}/products/{handle}"
-
-                # Price
-                price_raw = row.get("Variant Price", "").strip()
-                price = float(price_raw) if price_raw else None
-
-                # Image
-                image_url = row.get("Image Src", "").strip() or None
-
-                # Brand / Category
-                brand = row.get("Vendor", "").strip() or None
-                category = row.get("Type", "").strip() or None
-
-                # Availability from Status/Published
-                status = row.get("Status", "active").strip().lower()
-                published = row.get("Published", "true").strip().lower()
-                if status == "draft" or published == "false":
-                    availability = "out_of_stock"
-                else:
-                    availability = "in_stock"
-
-                # SKU as product ID, fallback to handle
-                product_id = row.get("Variant SKU", "").strip() or handle
-
-                product = Product(
-                    id=product_id,
-                    title=title,
-                    url=url,
-                    image_url=image_url,
-                    price=price,
-                    currency=currency if price is not None else None,
-                    availability=availability,
-                    brand=brand,
-                    category=category,
-                    updated_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                )
-                products.append(product)
-            except Exception as exc:
-                errors.append(f"Row {row_num}: {exc}")
-
-    if errors:
-        import sys
-
-        for err in errors:
-            print(f"[warn] {err}", file=sys.stderr)
-
-    return products
+    return list(iter_shopify_csv(path, base_url=base_url, currency=currency, trusted=trusted))
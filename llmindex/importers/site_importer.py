@@ -0,0 +1,600 @@
+"""Site crawler — imports products from the schema.org JSON-LD of a site's pages.
+
+For sites without a catalog export. The sitemap (or sitemap index, plain or
+gzipped) is parsed incrementally, then the product pages it lists are
+fetched concurrently with a pooled async HTTP client (the optional `httpx`
+package), at most `concurrency` at a time and at most `per_host` per host,
+optionally spaced `delay` seconds apart per host. Every `<script
+type="application/ld+json">` block is searched for schema.org `Product`
+nodes, which map to Product:
+
+    sku (else productID, mpn, @id, page URL) -> id, name -> title,
+    url (else page URL) -> url, image -> image_url, brand -> brand,
+    category -> category, offers -> price / price_range, currency, availability
+
+Responses are kept in an on-disk cache with their ETag / Last-Modified, so a
+re-crawl sends conditional requests and reads unchanged pages (304) from the
+cache; a page whose sitemap `<lastmod>` is older than its cached copy is not
+requested at all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urljoin, urlsplit
+from xml.etree import ElementTree
+
+from llmindex.importers.batch import Record, utc_timestamp, validate_records
+from llmindex.importers.errors import ImportErrors, row_warner
+from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 30.0
+USER_AGENT = "llmindex-crawler (+https://github.com/mci77777/openllmindex)"
+
+# schema.org ItemAvailability -> Product.availability
+_AVAILABILITY = {
+    "instock": "in_stock",
+    "instoreonly": "in_stock",
+    "onlineonly": "in_stock",
+    "limitedavailability": "in_stock",
+    "preorder": "preorder",
+    "presale": "preorder",
+    "outofstock": "out_of_stock",
+    "soldout": "out_of_stock",
+    "discontinued": "out_of_stock",
+    "backorder": "out_of_stock",
+}
+# When offers disagree, the product is as available as its best offer
+_AVAILABILITY_RANK = ("in_stock", "preorder", "out_of_stock")
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx  # type: ignore[import-not-found]
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "httpx is required to crawl a site. Install with: pip install 'llmindex[crawl]'"
+        ) from e
+    return httpx
+
+
+# -- Sitemaps ----------------------------------------------------------------
+
+
+class SitemapEntry(NamedTuple):
+    """A `<url>` (kind "url") or `<sitemap>` (kind "sitemap") of a sitemap."""
+
+    kind: str
+    loc: str
+    lastmod: Optional[str] = None
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def iter_sitemap(data: bytes) -> Iterator[SitemapEntry]:
+    """Stream the entries of a sitemap or sitemap index (plain or gzipped XML).
+
+    Each entry is cleared from the tree once read, so memory does not grow
+    with the number of URLs. Malformed XML raises ValueError.
+    """
+    f: io.BufferedIOBase = io.BytesIO(data)
+    if data[:2] == b"\x1f\x8b":
+        f = gzip.GzipFile(fileobj=f)  # type: ignore[assignment]
+    root = None
+    try:
+        for event, elem in ElementTree.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or _local_name(elem.tag) not in ("url", "sitemap"):
+                continue
+            fields = {_local_name(child.tag): (child.text or "").strip() for child in elem}
+            if fields.get("loc"):
+                yield SitemapEntry(_local_name(elem.tag), fields["loc"], fields.get("lastmod"))
+            root.clear()
+    except (ElementTree.ParseError, EOFError, OSError) as e:
+        raise ValueError(f"Invalid sitemap: {e}") from e
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds of a W3C datetime ("2026-02-01", "2026-02-01T10:00:00Z")."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _iso_utc(value: Optional[str]) -> Optional[str]:
+    ts = _timestamp(value)
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# -- JSON-LD -----------------------------------------------------------------
+
+
+class _JSONLDScripts(HTMLParser):
+    """Collect the contents of <script type="application/ld+json"> elements."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.scripts: list[str] = []
+        self._parts: Optional[list[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag == "script":
+            kind = (dict(attrs).get("type") or "").split(";")[0].strip().lower()
+            if kind == "application/ld+json":
+                self._parts = []
+
+    def handle_data(self, data: str) -> None:
+        if self._parts is not None:
+            self._parts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._parts is not None:
+            self.scripts.append("".join(self._parts))
+            self._parts = None
+
+
+def _types(node: dict) -> list[str]:
+    kinds = node.get("@type", ())
+    if isinstance(kinds, str):
+        kinds = (kinds,)
+    # "Product", "schema:Product" and "https://schema.org/Product" all name Product
+    return [str(k).rsplit("/", 1)[-1].rsplit(":", 1)[-1] for k in kinds]
+
+
+def _find_products(node: Any) -> Iterator[dict]:
+    """Yield the Product nodes of a JSON-LD document (top level, @graph or nested)."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _find_products(item)
+    elif isinstance(node, dict):
+        if "Product" in _types(node):
+            yield node
+            return
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _find_products(value)
+
+
+def extract_jsonld_products(html: str) -> list[dict]:
+    """Return the schema.org Product nodes of an HTML page's JSON-LD blocks.
+
+    Blocks that are not valid JSON are skipped.
+    """
+    parser = _JSONLDScripts()
+    parser.feed(html)
+    parser.close()
+    products: list[dict] = []
+    for script in parser.scripts:
+        try:
+            document = json.loads(script)
+        except ValueError:
+            continue
+        products.extend(_find_products(document))
+    return products
+
+
+def _first(value: Any) -> Any:
+    return value[0] if isinstance(value, list) and value else value
+
+
+def _text(value: Any, *keys: str) -> Optional[str]:
+    """A string value, taking the first of a list and `keys` of an object."""
+    value = _first(value)
+    if isinstance(value, dict):
+        value = next((value[k] for k in keys if value.get(k)), None)
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return str(value).strip() or None
+
+
+def _price(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid offer price {value!r}") from None
+
+
+def _offers(node: dict) -> Iterator[dict]:
+    offers = node.get("offers") or ()
+    for offer in offers if isinstance(offers, list) else (offers,):
+        if not isinstance(offer, dict):
+            continue
+        yield offer
+        # An AggregateOffer may list its individual offers too
+        if isinstance(offer.get("offers"), (dict, list)):
+            yield from _offers(offer)
+
+
+def product_record(node: dict, page_url: str, updated_at: str) -> dict[str, Any]:
+    """Map a schema.org Product node found on `page_url` to Product fields."""
+    prices: list[float] = []
+    currency = None
+    availabilities = []
+    for offer in _offers(node):
+        spec = _first(offer.get("priceSpecification"))
+        spec = spec if isinstance(spec, dict) else {}
+        for key in ("price", "lowPrice", "highPrice"):
+            value = offer.get(key, spec.get(key) if key == "price" else None)
+            if value not in (None, ""):
+                prices.append(_price(value))
+        currency = currency or offer.get("priceCurrency") or spec.get("priceCurrency")
+        availability = _text(offer.get("availability"))
+        if availability:
+            name = availability.rsplit("/", 1)[-1].rsplit(":", 1)[-1].lower()
+            availabilities.append(_AVAILABILITY.get(name, availability))
+
+    price: Optional[float] = min(prices) if prices else None
+    price_range = None
+    currency = str(currency).strip().upper() if currency else None
+    if prices and min(prices) != max(prices):
+        # The feed schema takes either price + currency or price_range
+        price = None
+        price_range = {"min": min(prices), "max": max(prices), "currency": currency}
+
+    url = _text(node.get("url"), "@id")
+    category = node.get("category")
+    if isinstance(category, list):
+        category = " > ".join(str(c) for c in category if c)
+    return {
+        "id": _text(node.get("sku"))
+        or _text(node.get("productID"))
+        or _text(node.get("mpn"))
+        or _text(node.get("@id"))
+        or page_url,
+        "title": _text(node.get("name")) or "",
+        "url": urljoin(page_url, url) if url else page_url,
+        "image_url": (
+            urljoin(page_url, image)
+            if (image := _text(node.get("image"), "url", "contentUrl"))
+            else None
+        ),
+        "price": price,
+        "currency": currency if price is not None else None,
+        "price_range": price_range,
+        "availability": min(
+            availabilities or ["in_stock"],
+            key=lambda a: _AVAILABILITY_RANK.index(a) if a in _AVAILABILITY_RANK else 99,
+        ),
+        "brand": _text(node.get("brand"), "name"),
+        "category": _text(category, "name"),
+        "updated_at": updated_at,
+    }
+
+
+# -- Fetching ----------------------------------------------------------------
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+class ResponseCache:
+    """On-disk HTTP response cache, one file per URL under `root`.
+
+    Each file holds a JSON header line (validators and fetch time) followed by
+    the response body, and is replaced atomically.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, url: str) -> Path:
+        return self.root / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for `url`, or None on a miss."""
+        try:
+            with self._path(url).open("rb") as f:
+                meta = json.loads(f.readline())
+                return CachedResponse(f.read(), **meta)
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            self._path(url).unlink(missing_ok=True)
+            return None
+
+    def put(self, url: str, entry: CachedResponse) -> None:
+        """Store `entry` as the cached response for `url`."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+        }
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(entry.body)
+            os.replace(tmp, self._path(url))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+@dataclass
+class CrawlCounts:
+    """What a crawl did: pages listed, and how each response was obtained."""
+
+    sitemaps: int = 0
+    pages: int = 0
+    fetched: int = 0
+    not_modified: int = 0
+    cached: int = 0
+    failed: int = 0
+    # Pages without Product JSON-LD, e.g. blog posts listed in the same sitemap
+    no_products: int = 0
+    bytes_fetched: int = 0
+
+
+@dataclass
+class _Host:
+    slots: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_at: float = 0.0
+
+
+class _Fetcher:
+    """GET with a global and per-host concurrency limit, politeness delay and cache."""
+
+    def __init__(
+        self,
+        client: Any,
+        concurrency: int,
+        per_host: int,
+        delay: float,
+        cache: Optional[ResponseCache],
+        counts: CrawlCounts,
+    ) -> None:
+        self.client = client
+        self.slots = asyncio.Semaphore(concurrency)
+        self.per_host = per_host
+        self.delay = delay
+        self.cache = cache
+        self.counts = counts
+        self._hosts: dict[str, _Host] = {}
+
+    def _host(self, url: str) -> _Host:
+        netloc = urlsplit(url).netloc
+        host = self._hosts.get(netloc)
+        if host is None:
+            host = self._hosts[netloc] = _Host(asyncio.Semaphore(self.per_host))
+        return host
+
+    async def _wait_turn(self, host: _Host) -> None:
+        if not self.delay:
+            return
+        async with host.lock:
+            wait = host.next_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            host.next_at = time.monotonic() + self.delay
+
+    async def get(self, url: str, lastmod: Optional[str] = None) -> bytes:
+        """Return the body of `url`, from the cache when it is known to be current."""
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None:
+            modified = _timestamp(lastmod)
+            if modified is not None and modified <= cached.fetched_at:
+                self.counts.cached += 1
+                return cached.body
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        host = self._host(url)
+        async with self.slots, host.slots:
+            await self._wait_turn(host)
+            response = await self.client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.counts.not_modified += 1
+            if self.cache is not None:
+                cached.fetched_at = time.time()
+                self.cache.put(url, cached)
+            return cached.body
+        response.raise_for_status()
+        body = response.content
+        self.counts.fetched += 1
+        self.counts.bytes_fetched += len(body)
+        if self.cache is not None:
+            entry = CachedResponse(
+                body,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.time(),
+            )
+            self.cache.put(url, entry)
+        return body
+
+
+async def _page_urls(
+    fetcher: _Fetcher, sitemap_url: str, limit: Optional[int]
+) -> list[SitemapEntry]:
+    """Page entries of the sitemap, following sitemap indexes, in document order."""
+    pages: list[SitemapEntry] = []
+    seen_pages: set[str] = set()
+    seen_sitemaps = {sitemap_url}
+    level = [SitemapEntry("sitemap", sitemap_url)]
+    while level and (limit is None or len(pages) < limit):
+        bodies = await asyncio.gather(
+            *(fetcher.get(entry.loc, entry.lastmod) for entry in level), return_exceptions=True
+        )
+        children = []
+        for entry, body in zip(level, bodies):
+            if isinstance(body, BaseException):
+                raise ValueError(f"Could not fetch sitemap {entry.loc}: {body}") from body
+            fetcher.counts.sitemaps += 1
+            for child in iter_sitemap(body):
+                loc = urljoin(entry.loc, child.loc)
+                if child.kind == "sitemap":
+                    if loc not in seen_sitemaps:
+                        seen_sitemaps.add(loc)
+                        children.append(child._replace(loc=loc))
+                elif loc not in seen_pages and (limit is None or len(pages) < limit):
+                    seen_pages.add(loc)
+                    pages.append(child._replace(loc=loc))
+        level = children
+    return pages
+
+
+async def _crawl_page(fetcher: _Fetcher, entry: SitemapEntry) -> list[Record]:
+    try:
+        body = await fetcher.get(entry.loc, entry.lastmod)
+    except Exception as exc:
+        fetcher.counts.failed += 1
+        return [exc]
+    nodes = extract_jsonld_products(body.decode("utf-8", errors="replace"))
+    if not nodes:
+        fetcher.counts.no_products += 1
+        return []
+    updated_at = _iso_utc(entry.lastmod) or utc_timestamp()
+    records: list[Record] = []
+    for node in nodes:
+        try:
+            records.append(product_record(node, entry.loc, updated_at))
+        except Exception as exc:
+            records.append(exc)
+    return records
+
+
+async def crawl_records(
+    sitemap_url: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    delay: float = 0.0,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache: Optional[ResponseCache] = None,
+    limit: Optional[int] = None,
+    counts: Optional[CrawlCounts] = None,
+) -> AsyncIterator[tuple[str, Record]]:
+    """Crawl the pages of a sitemap, yielding (page URL, record) pairs in sitemap order.
+
+    A record is a Product field dict, or the exception that made the page or
+    product unusable. Pages without Product JSON-LD yield nothing and are
+    counted in `counts.no_products`. A sitemap that cannot be fetched or
+    parsed raises ValueError.
+    """
+    httpx = _import_httpx()
+    counts = counts if counts is not None else CrawlCounts()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        limits=limits,
+        timeout=timeout,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+    ) as client:
+        fetcher = _Fetcher(client, concurrency, per_host, delay, cache, counts)
+        pages = await _page_urls(fetcher, sitemap_url, limit)
+        counts.pages = len(pages)
+
+        # Keep a bounded window of pages in flight so records are yielded in
+        # sitemap order without holding every page's records in memory
+        pending: deque[tuple[str, asyncio.Task[list[Record]]]] = deque()
+        todo = iter(pages)
+        try:
+            for entry in todo:
+                pending.append((entry.loc, asyncio.create_task(_crawl_page(fetcher, entry))))
+                if len(pending) >= concurrency * 2:
+                    break
+            while pending:
+                loc, task = pending.popleft()
+                records = await task
+                for entry in todo:
+                    pending.append((entry.loc, asyncio.create_task(_crawl_page(fetcher, entry))))
+                    break
+                for record in records:
+                    yield loc, record
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+def _iter_async(loop: asyncio.AbstractEventLoop, items: AsyncIterator[Any]) -> Iterator[Any]:
+    """Iterate an async iterator by running `loop` until each next item is ready."""
+    while True:
+        try:
+            yield loop.run_until_complete(items.__anext__())
+        except StopAsyncIteration:
+            return
+
+
+def iter_site(
+    sitemap_url: str,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    delay: float = 0.0,
+    timeout: float = DEFAULT_TIMEOUT,
+    cache: Optional[ResponseCache] = None,
+    limit: Optional[int] = None,
+    counts: Optional[CrawlCounts] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream the products found on the pages of a sitemap (see crawl_records).
+
+    Products are yielded while the crawl is still running. Pages that fail to
+    load and products that do not validate are reported to stderr (or to
+    `errors`, if given) as "Page <url>"; pages without Product JSON-LD are
+    only counted.
+    """
+    counts = counts if counts is not None else CrawlCounts()
+    loop = asyncio.new_event_loop()
+    records = crawl_records(
+        sitemap_url,
+        concurrency=concurrency,
+        per_host=per_host,
+        delay=delay,
+        timeout=timeout,
+        cache=cache,
+        limit=limit,
+        counts=counts,
+    )
+    try:
+        yield from validate_records(
+            _iter_async(loop, records), row_warner("Page", errors), trusted=trusted, stats=stats
+        )
+    finally:
+        # Cancels the pages still in flight if the consumer stopped early
+        loop.run_until_complete(records.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+        if stats is not None:
+            stats.bytes_read += counts.bytes_fetched
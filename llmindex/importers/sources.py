@@ -0,0 +1,99 @@
+"""Importer dispatch — map an input source type to its streaming importer."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Optional
+
+from llmindex.importers.arrow_importer import iter_arrow, iter_parquet
+from llmindex.importers.csv_importer import iter_csv
+from llmindex.importers.errors import ImportErrors
+from llmindex.importers.json_importer import iter_json
+from llmindex.importers.jsonl_importer import iter_jsonl
+from llmindex.importers.merchant_importer import iter_merchant_feed
+from llmindex.importers.shopify_importer import iter_shopify_csv
+from llmindex.importers.sqlite_importer import iter_sqlite
+from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
+
+SOURCE_TYPES = (
+    "csv",
+    "json",
+    "jsonl",
+    "shopify_csv",
+    "google_merchant",
+    "parquet",
+    "arrow",
+    "sqlite",
+)
+
+# Source types that can stream from standard input (path "-")
+STDIN_SOURCE_TYPES = ("csv", "json", "jsonl", "shopify_csv", "google_merchant")
+
+
+def iter_products(
+    input_path: str | Path,
+    source_type: str,
+    base_url: str = "https://example.com",
+    currency: str = "USD",
+    workers: int = 1,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    csv_engine: str = "python",
+    query: Optional[str] = None,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from `input_path` using the importer for `source_type`.
+
+    Args:
+        input_path: Path to the product source file.
+        source_type: One of SOURCE_TYPES.
+        base_url: Store URL used by importers that build product URLs (Shopify).
+        currency: Default currency for importers whose source has none (Shopify).
+        workers: Worker processes for parallel parsing (CSV only).
+        columns: Product field -> source column name overrides (CSV, Parquet, Arrow,
+            SQLite).
+        trusted: Skip Product validation for input known to be valid.
+        csv_engine: CSV parser, one of csv_importer.CSV_ENGINES (CSV only).
+        query: SQL query selecting the products (SQLite only).
+        errors: Collector for rejected records (default: print each to stderr).
+        stats: Receives rows parsed and rejected and the validation time.
+    """
+    if source_type == "csv":
+        return iter_csv(
+            input_path,
+            workers=workers,
+            columns=columns,
+            trusted=trusted,
+            engine=csv_engine,
+            errors=errors,
+            stats=stats,
+        )
+    if source_type == "json":
+        return iter_json(input_path, trusted=trusted, errors=errors, stats=stats)
+    if source_type == "jsonl":
+        return iter_jsonl(input_path, trusted=trusted, errors=errors, stats=stats)
+    if source_type == "shopify_csv":
+        return iter_shopify_csv(
+            input_path,
+            base_url=base_url,
+            currency=currency,
+            trusted=trusted,
+            errors=errors,
+            stats=stats,
+        )
+    if source_type == "google_merchant":
+        return iter_merchant_feed(input_path, trusted=trusted, errors=errors, stats=stats)
+    if source_type == "parquet":
+        return iter_parquet(
+            input_path, columns=columns, trusted=trusted, errors=errors, stats=stats
+        )
+    if source_type == "arrow":
+        return iter_arrow(input_path, columns=columns, trusted=trusted, errors=errors, stats=stats)
+    if source_type == "sqlite":
+        return iter_sqlite(
+            input_path, query=query, columns=columns, trusted=trusted, errors=errors, stats=stats
+        )
+    raise ValueError(f"Unknown source type: {source_type}")
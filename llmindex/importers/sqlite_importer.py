@@ -0,0 +1,121 @@
+"""SQLite importer — streams products from a query against a SQLite database.
+
+The database is opened read-only and rows are pulled from the cursor in
+`fetchmany` batches, so the result set is never loaded as a whole. Result
+columns are matched to Product fields by name: alias them in SQL
+(`SELECT sku AS id, ...`) or map them with `columns` in llmindex.yaml.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator, Mapping
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+from llmindex.importers.batch import BATCH_SIZE, Record, utc_timestamp, validate_records
+from llmindex.importers.errors import ImportErrors, row_warner
+from llmindex.importers.json_importer import apply_item_defaults
+from llmindex.llmindex_cli.models import Product
+from llmindex.llmindex_cli.stats import RunStats
+
+DEFAULT_QUERY = "SELECT * FROM products"
+
+# Rows per cursor.fetchmany() call
+_FETCH_ROWS = BATCH_SIZE
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    # mode=ro: a query can never modify the catalog database
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _resolve_columns(
+    names: list[str], columns: Optional[Mapping[str, str]]
+) -> list[tuple[str, int]]:
+    """Return (Product field, result column index) for the fields the query returns."""
+    columns = columns or {}
+    positions = {name: i for i, name in enumerate(names)}
+    plan: list[tuple[str, int]] = []
+    for field_name in Product.model_fields:
+        source = columns.get(field_name, field_name)
+        if field_name in columns and source not in positions:
+            raise ValueError(
+                f"Column '{source}' (mapped to '{field_name}') not found in query result"
+            )
+        if source in positions:
+            plan.append((field_name, positions[source]))
+    return plan
+
+
+def _to_field(name: str, value: Any) -> Any:
+    # INTEGER ids/brands etc. become strings; price keeps its SQLite type
+    if value is None or isinstance(value, str) or name == "price":
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _iter_records(
+    cursor: sqlite3.Cursor, plan: list[tuple[str, int]], updated_at: str
+) -> Iterator[tuple[int, Record]]:
+    row_num = 1
+    while rows := cursor.fetchmany(_FETCH_ROWS):
+        for row in rows:
+            try:
+                item = {name: _to_field(name, row[i]) for name, i in plan}
+            except UnicodeDecodeError as exc:
+                yield row_num, ValueError(f"invalid UTF-8 in BLOB column — {exc}")
+            else:
+                yield row_num, apply_item_defaults(item, updated_at)
+            row_num += 1
+
+
+def iter_sqlite(
+    path: str | Path,
+    query: Optional[str] = None,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+    errors: Optional[ImportErrors] = None,
+    stats: Optional[RunStats] = None,
+) -> Iterator[Product]:
+    """Stream products from the rows of `query` (default: all of `products`).
+
+    Missing or empty `availability`/`updated_at` get the same defaults as the
+    JSON importer, and non-text values of text fields are converted to str.
+    Invalid rows are reported to stderr (or to `errors`, if given) with their
+    1-based result row number.
+    SQLite errors (missing table, bad SQL) are raised as ValueError.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise ValueError(f"SQLite database not found: {path}")
+
+    with closing(_connect(path)) as conn:
+        try:
+            cursor = conn.execute(query or DEFAULT_QUERY)
+        except sqlite3.Error as e:
+            raise ValueError(f"SQLite query failed: {e}") from e
+        if cursor.description is None:
+            raise ValueError("SQLite query returned no result columns")
+
+        plan = _resolve_columns([d[0] for d in cursor.description], columns)
+        records = _iter_records(cursor, plan, utc_timestamp())
+        try:
+            yield from validate_records(
+                records, row_warner("Row", errors), trusted=trusted, stats=stats
+            )
+        except sqlite3.Error as e:
+            raise ValueError(f"SQLite query failed: {e}") from e
+
+
+def import_sqlite(
+    path: str | Path,
+    query: Optional[str] = None,
+    columns: Optional[Mapping[str, str]] = None,
+    trusted: bool = False,
+) -> list[Product]:
+    """Import products from a SQLite query."""
+    return list(iter_sqlite(path, query=query, columns=columns, trusted=trusted))
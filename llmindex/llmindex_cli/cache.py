@@ -0,0 +1,253 @@
+"""On-disk cache of parsed product catalogs, keyed by source content.
+
+`generate --cache` and `watch` store each validated catalog under
+`.llmindex-cache/`. The key covers the source bytes, the importer type and
+options, and the package version, so a rebuild after a config or template
+change loads the products instead of re-parsing them.
+
+An entry is written while the import runs: pickled ProductTable blocks of up
+to BLOCK_ROWS products, then a summary of the records the import rejected
+(ImportErrors.report(): counts and a few samples per error kind), then the
+offset of that summary. Storing or loading a catalog holds one block in
+memory at a time, so the cache also works with `generate --stream`, and a hit
+reports the same error counts and samples as the import it replaces.
+
+Loading an entry unpickles it, and unpickling can run arbitrary code. The
+cache directory is relative to the working directory (`generate`) or to the
+config file (`watch`), so CatalogCache refuses to use one that is not owned
+by the current user or that group or others can write (UnsafeCacheError).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as pkg_version
+from pathlib import Path
+from typing import Any, Optional
+
+from llmindex.importers.errors import ImportErrors
+from llmindex.llmindex_cli.models import Product, ProductRow, ProductTable
+
+CACHE_DIR_NAME = ".llmindex-cache"
+DEFAULT_MAX_BYTES = 1 << 30
+# Products per pickled ProductTable block in an entry
+BLOCK_ROWS = 10_000
+_SUFFIX = ".pickle"
+_READ_BLOCK = 1 << 20
+# Offset of the rejected-records summary, at the very end of an entry
+_TRAILER = struct.Struct("<Q")
+
+
+class UnsafeCacheError(ValueError):
+    """Raised when the cache directory could be written by another user."""
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(_READ_BLOCK):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _package_version() -> str:
+    try:
+        return pkg_version("openllmindex")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class CachedCatalog:
+    """A cached catalog: iterating loads its products one block at a time.
+
+    `rejected` summarizes the records that the import which stored it
+    rejected, as an ImportErrors.report().
+    """
+
+    def __init__(self, path: Path, end: int, rejected: dict[str, Any]) -> None:
+        self.path = path
+        self.end = end
+        self.rejected = rejected
+
+    def __iter__(self) -> Iterator[ProductRow]:
+        with self.path.open("rb") as f:
+            while f.tell() < self.end:
+                try:
+                    block = pickle.load(f)
+                except Exception as e:
+                    self.path.unlink(missing_ok=True)
+                    raise ValueError(f"Corrupt cache entry {self.path} (removed)") from e
+                yield from block
+
+
+class CatalogCache:
+    """Size-bounded LRU cache of parsed catalogs stored under `root`.
+
+    Entries are `<key>.pickle` files. Reading an entry refreshes its mtime,
+    and after every write the least recently used entries are removed until
+    the directory holds at most `max_bytes`. `root` is created with mode 0700
+    and must not be writable by other users (see check_root).
+    """
+
+    def __init__(self, root: Path = Path(CACHE_DIR_NAME), max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def key(self, source: Path, source_type: str, options: Mapping[str, Any]) -> str:
+        """Cache key for `source` imported as `source_type` with importer `options`."""
+        source = Path(source)
+        # A SQLite database in WAL mode keeps recent commits in <db>-wal
+        wal = source.with_name(source.name + "-wal")
+        parts = {
+            "source": file_digest(source),
+            "wal": file_digest(wal) if wal.is_file() else None,
+            "type": source_type,
+            "options": options,
+            "version": _package_version(),
+        }
+        blob = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+    def check_root(self) -> None:
+        """Create `root` if needed and make sure no other user can write to it.
+
+        Raises UnsafeCacheError if `root` is owned by another user or is
+        group- or world-writable: its entries are unpickled.
+        """
+        self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not hasattr(os, "getuid"):  # Windows: the directory's ACL applies
+            return
+        st = self.root.stat()
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise UnsafeCacheError(
+                f"cache directory {self.root} must be owned by the current user and "
+                "not writable by group or others"
+            )
+
+    def get(self, key: str) -> Optional[CachedCatalog]:
+        """Return the cached catalog for `key`, or None on a miss."""
+        self.check_root()
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                f.seek(-_TRAILER.size, os.SEEK_END)
+                (end,) = _TRAILER.unpack(f.read(_TRAILER.size))
+                f.seek(end)
+                rejected = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or written by an incompatible version: drop it
+            path.unlink(missing_ok=True)
+            return None
+        if not isinstance(rejected, dict):
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return CachedCatalog(path, end, rejected)
+
+    def store(
+        self, key: str, products: Iterable[Product], errors: Optional[ImportErrors] = None
+    ) -> Iterator[Product]:
+        """Yield `products` while writing them to the entry for `key`.
+
+        The entry appears once `products` is exhausted, with the report()
+        `errors` gives at that point, and the cache is then evicted down to
+        `max_bytes`. An iteration that stops early stores nothing.
+        """
+        self.check_root()
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                block = ProductTable()
+                for p in products:
+                    block.append(p)
+                    yield p
+                    if len(block) >= BLOCK_ROWS:
+                        pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                        block = ProductTable()
+                if len(block):
+                    pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                end = f.tell()
+                rejected = (errors or ImportErrors()).report()
+                pickle.dump(rejected, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(_TRAILER.pack(end))
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def put(
+        self, key: str, products: Iterable[Product], errors: Optional[ImportErrors] = None
+    ) -> None:
+        """Store a complete catalog under `key`, then evict down to `max_bytes`."""
+        for _ in self.store(key, products, errors):
+            pass
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob(f"*{_SUFFIX}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _replay(catalog: CachedCatalog, errors: ImportErrors) -> Iterator[ProductRow]:
+    errors.replay(catalog.rejected)
+    yield from catalog
+
+
+def _store(
+    cache: CatalogCache, key: str, load: Callable[[], Iterable[Product]], errors: ImportErrors
+) -> Iterator[Product]:
+    # Only this source's rejections are stored, however many `errors` counts
+    rejected = ImportErrors(errors.max_samples, echo=False)
+    errors.mirror = rejected
+    try:
+        yield from cache.store(key, load(), rejected)
+    finally:
+        errors.mirror = None
+
+
+def cached_products(
+    cache: CatalogCache,
+    source: Path,
+    source_type: str,
+    options: Mapping[str, Any],
+    load: Callable[[], Iterable[Product]],
+    errors: ImportErrors,
+) -> tuple[Iterable[Any], bool]:
+    """Return (products, hit) for `source`, importing via `load()` on a miss.
+
+    `load()` must report rejected records to `errors`. On a miss the returned
+    iterator stores the catalog, along with the counts and samples of the
+    records `errors` received, once it has been consumed to the end; an import that fails part-way is not
+    cached. On a hit those records are reported to `errors` again before the
+    first product, so counts, samples and `max_errors` behave as on a miss.
+    Raises UnsafeCacheError if the cache directory is unsafe (see check_root).
+    """
+    key = cache.key(source, source_type, options)
+    catalog = cache.get(key)
+    if catalog is not None:
+        return _replay(catalog, errors), True
+    return _store(cache, key, load, errors), False
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
 
-from llmindex.importers.csv_importer import import_csv
-from llmindex.importers.json_importer import import_json
-from llmindex.importers.shopify_importer import import_shopify_csv
+from llmindex.importers.compression import COMPRESSION_SUFFIXES
+from llmindex.importers.errors import ImportErrors
+from llmindex.importers.sources import iter_products
+from llmindex.llmindex_cli.cache import (
+    CACHE_DIR_NAME,
+    CatalogCache,
+    UnsafeCacheError,
+    cached_products,
+)
 from llmindex.llmindex_cli.config import ConfigError, load_yaml_config
-from llmindex.llmindex_cli.generators.feed import write_feed
-from llmindex.llmindex_cli.generators.manifest import generate_manifest, write_manifest
-from llmindex.llmindex_cli.generators.pages import write_pages
-from llmindex.llmindex_cli.models import SiteConfig
+from llmindex.llmindex_cli.generators.catalog import write_catalog
+from llmindex.llmindex_cli.models import Product, SiteConfig
 
 console = Console()
 
@@ -22,8 +27,9 @@ console = Console()
 def _resolve_input_source(yaml_path: Path) -> tuple[Optional[Path], str]:
     """Resolve the product input file and its type from llmindex.yaml directory.
 
-    Looks for common source files relative to the config file's parent dir.
-    Returns (path, type) where type is 'csv' | 'json' | 'shopify_csv' | 'none'.
+    Looks for common source files relative to the config file's parent dir,
+    including compressed variants (e.g. products.csv.gz, products.json.zst).
+    Returns (path, type) where type is one of `sources.SOURCE_TYPES` or 'none'.
     """
     config_dir = yaml_path.parent
 
@@ -31,30 +37,50 @@ def _resolve_input_source(yaml_path: Path) -> tuple[Optional[Path], str]:
     candidates = [
         (config_dir / "products.csv", "csv"),
         (config_dir / "products.json", "json"),
+        (config_dir / "products.jsonl", "jsonl"),
         (config_dir / "shopify_products.csv", "shopify_csv"),
+        (config_dir / "merchant_products.xml", "google_merchant"),
+        (config_dir / "merchant_products.tsv", "google_merchant"),
+        (config_dir / "products.parquet", "parquet"),
+        (config_dir / "products.arrow", "arrow"),
+        (config_dir / "products.feather", "arrow"),
+        (config_dir / "products.db", "sqlite"),
+        (config_dir / "products.sqlite", "sqlite"),
+        (config_dir / "products.sqlite3", "sqlite"),
         (config_dir / "data" / "products.csv", "csv"),
         (config_dir / "data" / "products.json", "json"),
+        (config_dir / "data" / "products.jsonl", "jsonl"),
     ]
     for path, source_type in candidates:
-        if path.exists():
-            return path, source_type
+        for suffix in ("", *COMPRESSION_SUFFIXES):
+            candidate = path.with_name(path.name + suffix)
+            if candidate.exists():
+                return candidate, source_type
 
     return None, "none"
 
 
-def _import_products(
-    input_path: Optional[Path], source_type: str, base_url: str, currency: str = "USD"
-) -> list:
-    """Import products from the given source."""
+def _iter_products(
+    input_path: Optional[Path],
+    source_type: str,
+    base_url: str,
+    currency: str = "USD",
+    columns: Optional[Mapping[str, str]] = None,
+    query: Optional[str] = None,
+    errors: Optional[ImportErrors] = None,
+) -> Iterator[Product]:
+    """Stream products from the given source (empty when there is none)."""
     if input_path is None or source_type == "none":
-        return []
-    if source_type == "csv":
-        return import_csv(input_path)
-    if source_type == "json":
-        return import_json(input_path)
-    if source_type == "shopify_csv":
-        return import_shopify_csv(input_path, base_url=base_url, currency=currency)
-    return []
+        return iter(())
+    return iter_products(
+        input_path,
+        source_type,
+        base_url=base_url,
+        currency=currency,
+        columns=columns,
+        query=query,
+        errors=errors,
+    )
 
 
 def build_artifacts(
@@ -65,10 +91,18 @@ def build_artifacts(
     input_shopify_csv: Optional[Path] = None,
     templates_dir: Optional[Path] = None,
     currency: str = "USD",
+    input_jsonl: Optional[Path] = None,
+    cache: Optional[CatalogCache] = None,
+    input_parquet: Optional[Path] = None,
+    input_arrow: Optional[Path] = None,
+    input_sqlite: Optional[Path] = None,
+    input_google_merchant: Optional[Path] = None,
 ) -> list[str]:
     """Build all llmindex artifacts and return list of written file paths.
 
-    This is the shared build logic used by both `generate` and `watch`.
+    This is the shared build logic used by both `generate` and `watch`. With
+    `cache`, an unchanged product source is loaded from the catalog cache
+    instead of being re-imported.
     """
     try:
         yaml_config = load_yaml_config(config_path)
@@ -90,8 +124,18 @@ def build_artifacts(
         input_path, source_type = input_csv, "csv"
     elif input_json:
         input_path, source_type = input_json, "json"
+    elif input_jsonl:
+        input_path, source_type = input_jsonl, "jsonl"
     elif input_shopify_csv:
         input_path, source_type = input_shopify_csv, "shopify_csv"
+    elif input_google_merchant:
+        input_path, source_type = input_google_merchant, "google_merchant"
+    elif input_parquet:
+        input_path, source_type = input_parquet, "parquet"
+    elif input_arrow:
+        input_path, source_type = input_arrow, "arrow"
+    elif input_sqlite:
+        input_path, source_type = input_sqlite, "sqlite"
     else:
         input_path, source_type = _resolve_input_source(config_path)
 
@@ -102,26 +146,35 @@ def build_artifacts(
         topics=topics_value,
     )
 
-    products = _import_products(input_path, source_type, url_value, currency)
-
-    written: list[str] = []
-
-    # Manifest
-    manifest = generate_manifest(site_config, has_feed=len(products) > 0)
-    manifest_path = str(output_dir / ".well-known" / "llmindex.json")
-    write_manifest(manifest, manifest_path)
-    written.append(manifest_path)
-
-    # Pages
-    page_paths = write_pages(products, site_config, str(output_dir), templates_dir=templates_dir)
-    written.extend(page_paths)
-
-    # Feed
-    if products:
-        feed_path = write_feed(products, str(output_dir))
-        written.append(feed_path)
+    errors = ImportErrors()
+
+    def load() -> Iterable[Product]:
+        return _iter_products(
+            input_path,
+            source_type,
+            url_value,
+            currency,
+            yaml_config.columns,
+            yaml_config.query,
+            errors=errors,
+        )
 
-    return written
+    products: Optional[Iterable[Product]] = None
+    if cache is not None and input_path is not None:
+        options = {
+            "base_url": url_value,
+            "currency": currency,
+            "columns": yaml_config.columns,
+            "query": yaml_config.query,
+        }
+        try:
+            products, _ = cached_products(cache, input_path, source_type, options, load, errors)
+        except UnsafeCacheError as e:
+            console.print(f"  [yellow]![/yellow] Cache skipped ({e})")
+    if products is None:
+        products = load()
+    result = write_catalog(products, site_config, str(output_dir), templates_dir=templates_dir)
+    return result.written
 
 
 def collect_watch_paths(config_path: Path) -> list[Path]:
@@ -129,14 +182,18 @@ def collect_watch_paths(config_path: Path) -> list[Path]:
 
     Watches:
     - The config file itself (llmindex.yaml)
-    - Product source files (products.csv, products.json, etc.)
+    - Product source files (products.csv, products.json, products.db, etc.),
+      plus a SQLite database's -wal file, where recent commits land first
     - Template files (*.j2) if templates_dir is set
     """
     paths: list[Path] = [config_path.resolve()]
 
-    input_path, _ = _resolve_input_source(config_path)
+    input_path, source_type = _resolve_input_source(config_path)
     if input_path is not None:
         paths.append(input_path.resolve())
+        wal = input_path.with_name(input_path.name + "-wal")
+        if source_type == "sqlite" and wal.is_file():
+            paths.append(wal.resolve())
 
     # Watch template files in the config directory
     config_dir = config_path.parent
@@ -152,8 +209,14 @@ def run_watch(
     output_dir: Path,
     templates_dir: Optional[Path] = None,
     currency: str = "USD",
+    cache: bool = True,
 ) -> None:
-    """Start the file watcher loop. Blocks until interrupted."""
+    """Start the file watcher loop. Blocks until interrupted.
+
+    With `cache`, parsed catalogs are kept in `.llmindex-cache/` next to the
+    config so rebuilds triggered by config or template edits skip the import
+    (the directory must be private to the current user, see CatalogCache).
+    """
     try:
         from watchfiles import watch  # type: ignore[import-not-found]
     except ModuleNotFoundError as e:
@@ -163,6 +226,7 @@ def run_watch(
         ) from e
 
     watch_paths = collect_watch_paths(config_path)
+    catalog_cache = CatalogCache(config_path.parent / CACHE_DIR_NAME) if cache else None
 
     # Determine directories to watch (watchfiles watches directories)
     watch_dirs: set[Path] = set()
@@ -180,7 +244,11 @@ def run_watch(
     console.print("\n[bold]Initial build...[/bold]")
     try:
         written = build_artifacts(
-            config_path, output_dir, templates_dir=templates_dir, currency=currency
+            config_path,
+            output_dir,
+            templates_dir=templates_dir,
+            currency=currency,
+            cache=catalog_cache,
         )
         for f in written:
             console.print(f"  [green]✓[/green] {f}")
@@ -191,10 +259,36 @@ def run_watch(
     console.print("\n[dim]Watching for changes... (Ctrl+C to stop)[/dim]\n")
 
     # Filter function: only trigger on watched files
-    watched_suffixes = {".yaml", ".yml", ".csv", ".json", ".j2"}
+    watched_suffixes = {
+        ".yaml",
+        ".yml",
+        ".csv",
+        ".json",
+        ".jsonl",
+        ".xml",
+        ".tsv",
+        ".parquet",
+        ".arrow",
+        ".feather",
+        ".db",
+        ".sqlite",
+        ".sqlite3",
+        # SQLite commits in WAL mode (the -shm index also changes on reads, so not watched)
+        ".db-wal",
+        ".sqlite-wal",
+        ".sqlite3-wal",
+        ".j2",
+        *COMPRESSION_SUFFIXES,
+    }
+    ignored_roots = [output_dir.resolve()]
+    if catalog_cache is not None:
+        ignored_roots.append(catalog_cache.root.resolve())
 
     def _should_trigger(changed_path: Path) -> bool:
         resolved = changed_path.resolve()
+        # Our own output and cache writes must not trigger a rebuild loop
+        if any(resolved.is_relative_to(root) for root in ignored_roots):
+            return False
         # Exact match
         if resolved in {p.resolve() for p in watch_paths}:
             return True
@@ -213,7 +307,11 @@ def run_watch(
         console.print("[bold]Rebuilding...[/bold]")
         try:
             written = build_artifacts(
-                config_path, output_dir, templates_dir=templates_dir, currency=currency
+                config_path,
+                output_dir,
+                templates_dir=templates_dir,
+                currency=currency,
+                cache=catalog_cache,
             )
             for f in written:
                 console.print(f"  [green]✓[/green] {f}")
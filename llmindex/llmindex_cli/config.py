@@ -11,6 +11,11 @@ from typing import Any
 
 import yaml
 
+from llmindex.llmindex_cli.models import Product
+
+# Product fields that can be remapped to a differently named source column
+_MAPPABLE_FIELDS = tuple(name for name in Product.model_fields if name != "price_range")
+
 
 class ConfigError(RuntimeError):
     """Raised when a YAML config cannot be read or validated."""
@@ -22,6 +27,8 @@ class LLMIndexYamlConfig:
     base_url: str | None = None
     language: str | None = None
     topics: list[str] | None = None
+    columns: dict[str, str] | None = None
+    query: str | None = None
 
 
 def _parse_topics(value: Any) -> list[str] | None:
@@ -36,6 +43,24 @@ def _parse_topics(value: Any) -> list[str] | None:
     raise ConfigError("topics must be a list of strings or a comma-separated string")
 
 
+def _parse_columns(value: Any) -> dict[str, str] | None:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise ConfigError("columns must be a mapping of product field to source column")
+    columns: dict[str, str] = {}
+    for field_name, source in value.items():
+        if field_name not in _MAPPABLE_FIELDS:
+            raise ConfigError(
+                f"columns: unknown product field '{field_name}' "
+                f"(expected one of: {', '.join(_MAPPABLE_FIELDS)})"
+            )
+        if not isinstance(source, str) or not source.strip():
+            raise ConfigError(f"columns.{field_name} must be a non-empty string")
+        columns[field_name] = source.strip()
+    return columns or None
+
+
 def load_yaml_config(path: Path) -> LLMIndexYamlConfig:
     """Load `llmindex.yaml`-style config from disk.
 
@@ -44,6 +69,8 @@ def load_yaml_config(path: Path) -> LLMIndexYamlConfig:
       - base_url: str
       - language: str
       - topics: list[str] | "a,b,c"
+      - columns: {product_field: source_column}  (source column remapping)
+      - query: str  (SQL selecting the products from a SQLite source)
     """
     if not path.exists():
         raise ConfigError(f"Config file not found: {path}")
@@ -64,6 +91,8 @@ def load_yaml_config(path: Path) -> LLMIndexYamlConfig:
     base_url = raw.get("base_url")
     language = raw.get("language")
     topics = _parse_topics(raw.get("topics"))
+    columns = _parse_columns(raw.get("columns"))
+    query = raw.get("query")
 
     if site_name is not None and not isinstance(site_name, str):
         raise ConfigError("site_name must be a string")
@@ -71,10 +100,14 @@ def load_yaml_config(path: Path) -> LLMIndexYamlConfig:
         raise ConfigError("base_url must be a string")
     if language is not None and not isinstance(language, str):
         raise ConfigError("language must be a string")
+    if query is not None and (not isinstance(query, str) or not query.strip()):
+        raise ConfigError("query must be a non-empty string")
 
     return LLMIndexYamlConfig(
         site_name=site_name.strip() if isinstance(site_name, str) else None,
         base_url=base_url.strip() if isinstance(base_url, str) else None,
         language=language.strip() if isinstance(language, str) else None,
         topics=topics,
+        columns=columns,
+        query=query.strip() if isinstance(query, str) else None,
     )
@@ -0,0 +1,233 @@
+"""Build all llmindex artifacts from a product stream in a single pass."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from llmindex.llmindex_cli.generators.compress import (
+    Precompressor,
+    remove_stale_siblings,
+    sibling_paths,
+)
+from llmindex.llmindex_cli.generators.delta import DeltaResult, DeltaWriter
+from llmindex.llmindex_cli.generators.delta_archive import (
+    DEFAULT_RETENTION,
+    DeltaArchive,
+    parse_retention,
+)
+from llmindex.llmindex_cli.generators.feed import FeedWriter, ShardSize
+from llmindex.llmindex_cli.generators.manifest import generate_manifest, write_manifest
+from llmindex.llmindex_cli.generators.pages import ProductsPage, write_pages
+from llmindex.llmindex_cli.generators.staging import Staging
+from llmindex.llmindex_cli.models import Product, ProductTable, SiteConfig
+from llmindex.llmindex_cli.stats import RunStats
+
+
+@dataclass
+class CatalogResult:
+    """Paths and counts produced by write_catalog."""
+
+    product_count: int
+    manifest_path: str
+    page_paths: list[str] = field(default_factory=list)
+    feed_path: Optional[str] = None
+    shard_paths: list[str] = field(default_factory=list)
+    compressed_paths: list[str] = field(default_factory=list)
+    delta: Optional[DeltaResult] = None
+    delta_archive_paths: list[str] = field(default_factory=list)
+
+    @property
+    def artifacts(self) -> list[str]:
+        """Written files, without their compressed siblings."""
+        paths = [self.manifest_path, *self.page_paths]
+        if self.feed_path:
+            paths.append(self.feed_path)
+        if self.delta is not None and self.delta.path:
+            paths.append(self.delta.path)
+        return paths + self.shard_paths + self.delta_archive_paths
+
+    @property
+    def written(self) -> list[str]:
+        return self.artifacts + self.compressed_paths
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of the current process in bytes (None if unsupported)."""
+    try:
+        import resource
+    except ModuleNotFoundError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _consume_timed(
+    products: Iterable[Product] | ProductTable,
+    feed: FeedWriter,
+    page: ProductsPage,
+    stats: RunStats,
+) -> None:
+    # Time spent waiting for the next product is import time; the rest of each
+    # iteration is split into the feed writer's own timings and the products page
+    clock = time.perf_counter
+    feed_before = stats.serialize_seconds + stats.write_seconds
+    consumed = 0.0
+    start = clock()
+    for p in products:
+        produced = clock()
+        stats.import_seconds += produced - start
+        feed.write(p)
+        page.add(p)
+        start = clock()
+        consumed += start - produced
+    stats.import_seconds += clock() - start
+    stats.pages_seconds += consumed - (stats.serialize_seconds + stats.write_seconds - feed_before)
+
+
+def write_catalog(
+    products: Iterable[Product] | ProductTable,
+    config: SiteConfig,
+    output_dir: str,
+    templates_dir: Optional[Path] = None,
+    stream: bool = False,
+    stats: Optional[RunStats] = None,
+    shard_size: Optional[ShardSize] = None,
+    precompress: tuple[str, ...] = (),
+    delta: bool = False,
+    delta_buckets: Optional[str] = None,
+    delta_retention: Optional[timedelta] = None,
+    delta_snapshot: Optional[str] = None,
+) -> CatalogResult:
+    """Write manifest, /llm pages and products.jsonl from a product stream.
+
+    `products` is consumed exactly once: each product is written to the feed
+    and added to the products page as it arrives, so importers can hand over
+    a generator and the catalog is never materialized as a list.
+
+    With `stream=True` the products page spills its per-category groups to a
+    temporary directory inside `output_dir` (on disk rather than a possibly
+    RAM-backed system temp dir), keeping memory flat regardless of catalog size.
+
+    `stats` receives the import, feed and page timings (see llmindex_cli.stats).
+    With `shard_size` the feed is split into shards listed in feed-index.json,
+    which the manifest references instead of products.jsonl. `precompress`
+    codecs ("gzip", "br", "zstd") get a compressed sibling of every artifact,
+    produced while it is written (see generators.compress). With `delta`, the
+    build is compared with the previous one and products-delta.jsonl lists
+    what changed (see generators.delta); the previous build is remembered in
+    `delta_snapshot`, outside `output_dir`. `delta_buckets` ("hourly" or
+    "daily", implies `delta`) also keeps the deltas of the last
+    `delta_retention` in time buckets listed in delta-index.json (see
+    generators.delta_archive).
+
+    Nothing in `output_dir` changes until every artifact is complete: they are
+    written under temporary names and moved into place together at the end
+    (see generators.staging), so a failing import leaves the previous build
+    as it was.
+    """
+    spill_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    if stream:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        spill_dir = tempfile.TemporaryDirectory(prefix=".llmindex-spill-", dir=output_dir)
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    archive: Optional[DeltaArchive] = None
+    if delta_buckets is not None:
+        retention = delta_retention or parse_retention(DEFAULT_RETENTION)
+        archive = DeltaArchive(output_dir, delta_buckets, retention, config.get_base_url())
+    delta_writer = DeltaWriter(output_dir, now, delta_snapshot) if delta or archive else None
+    delta_result: Optional[DeltaResult] = None
+    compressor = Precompressor(precompress) if precompress else None
+    staging = Staging(compressor)
+    try:
+        page = ProductsPage(config, spill_dir=Path(spill_dir.name) if spill_dir else None)
+        with FeedWriter(
+            output_dir,
+            stats=stats,
+            shard_size=shard_size,
+            base_url=config.get_base_url(),
+            delta=delta_writer,
+            staging=staging,
+        ) as feed:
+            if stats is None:
+                for p in products:
+                    feed.write(p)
+                    page.add(p)
+            else:
+                _consume_timed(products, feed, page, stats)
+
+        if delta_writer is not None:
+            start = time.perf_counter()
+            delta_result = delta_writer.finish(staging=staging)
+            if archive is not None:
+                archive.update(delta_result, staging=staging)
+            if stats is not None:
+                stats.write_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        manifest = generate_manifest(
+            config,
+            has_feed=feed.count > 0,
+            feed_index=shard_size is not None,
+            feed_updated_at=delta_result.feed_updated_at if delta_result else now,
+            delta_since=delta_result.since if delta_result else None,
+            delta_index=archive is not None,
+        )
+        manifest_path = str(Path(output_dir) / ".well-known" / "llmindex.json")
+        write_manifest(manifest, manifest_path, staging=staging)
+
+        page_paths = write_pages(
+            page, config, output_dir, templates_dir=templates_dir, staging=staging
+        )
+        if stats is not None:
+            stats.pages_seconds += time.perf_counter() - start
+            stats.products = feed.count
+
+        # Wait for the siblings still compressing on the thread pool, then publish
+        start = time.perf_counter()
+        if compressor is not None:
+            compressor.close()
+        staging.publish()
+        if stats is not None:
+            stats.write_seconds += time.perf_counter() - start
+    except BaseException:
+        if compressor is not None:
+            with contextlib.suppress(Exception):
+                compressor.close()
+        staging.discard()
+        raise
+    finally:
+        if spill_dir is not None:
+            spill_dir.cleanup()
+
+    result = CatalogResult(
+        product_count=feed.count,
+        manifest_path=manifest_path,
+        page_paths=page_paths,
+        feed_path=str(feed.path) if feed.count else None,
+        shard_paths=[str(feed.feed_dir / Path(s["url"]).name) for s in feed.shards],
+        delta=delta_result,
+        delta_archive_paths=archive.written if archive is not None else [],
+    )
+    result.compressed_paths = [
+        str(sibling)
+        for path in result.artifacts
+        for sibling in sibling_paths(Path(path), precompress)
+    ]
+    remove_stale_siblings(result.artifacts, precompress)
+    if stats is not None:
+        extra = [manifest_path, *page_paths, *result.compressed_paths, *result.delta_archive_paths]
+        if delta_result is not None and delta_result.path:
+            extra.append(delta_result.path)
+        stats.bytes_written += sum(Path(p).stat().st_size for p in extra)
+    return result
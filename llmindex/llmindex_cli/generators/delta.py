@@ -0,0 +1,280 @@
+"""Delta feed (products-delta.jsonl) from build-to-build snapshots.
+
+`generate --delta` keeps a snapshot of the previous build: every product id
+with a digest of its feed line. It is stored outside the output directory,
+which stays publishable as-is: in the user cache directory
+(`~/.cache/llmindex/snapshots/`), named after the output directory's absolute
+path, or wherever `--snapshot` points. Each
+build compares the products it writes against that snapshot and writes
+products-delta.jsonl with the lines of added and changed products, followed
+by a tombstone line for each removed id:
+
+    {"id": "SKU-9", "deleted": true, "updated_at": "2026-10-18T09:00:00Z"}
+
+The digest leaves out `updated_at`, which many importers set to the import
+time, so only real content changes end up in the delta. The manifest links
+the delta as `products-delta.jsonl?since=<previous feed_updated_at>`: a
+consumer that synced at or after `since` applies it to reach
+`feed_updated_at`, anyone older re-downloads the full feed. A build without
+changes keeps the previous delta, `since` and `feed_updated_at`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Optional
+
+from llmindex.llmindex_cli.generators.compress import PRECOMPRESS_CODECS
+from llmindex.llmindex_cli.generators.json_backend import dumps_line
+from llmindex.llmindex_cli.generators.staging import Staging
+
+DELTA_NAME = "products-delta.jsonl"
+SNAPSHOT_VERSION = 1
+# Where earlier versions kept the snapshot, inside the output directory
+_LEGACY_SNAPSHOT_NAME = ".llmindex-snapshot"
+
+# After a JSON header line, the snapshot holds every digest, then every id's
+# length in characters (little-endian uint32), then all ids as one UTF-8 string
+DIGEST_SIZE = 8
+# The updated_at key as written by dumps_line, by default and when compact
+_UPDATED_AT_KEYS = (b', "updated_at": "', b',"updated_at":"')
+# Deltas up to this size are collected in memory before being written
+_SPOOL_BYTES = 8 << 20
+
+
+def user_cache_dir() -> Path:
+    """llmindex's per-user cache directory: $XDG_CACHE_HOME/llmindex or ~/.cache/llmindex.
+
+    On Windows, %LOCALAPPDATA%\\llmindex.
+    """
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "llmindex"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "llmindex"
+
+
+def default_snapshot_path(output_dir: str | Path) -> Path:
+    """Snapshot path for builds into `output_dir`, in the user cache directory.
+
+    If the cache directory is inside `output_dir` (e.g. `-o ~`), the snapshot
+    is kept next to the output directory instead.
+    """
+    output = Path(output_dir).resolve()
+    key = hashlib.sha256(str(output).encode("utf-8")).hexdigest()
+    path = user_cache_dir() / "snapshots" / f"{key[:16]}.snapshot"
+    if path.resolve().is_relative_to(output):
+        path = output.parent / f".{output.name}.llmindex-snapshot"
+    return path
+
+
+def content_digest(line: bytes) -> bytes:
+    """Digest of a serialized feed line, ignoring its `updated_at` value."""
+    # `,"` and `, "` cannot occur inside a JSON string (the quote would be
+    # escaped), so the first match is the updated_at key itself
+    for key in _UPDATED_AT_KEYS:
+        start = line.find(key)
+        if start != -1:
+            break
+    else:
+        return hashlib.blake2b(line, digest_size=DIGEST_SIZE).digest()
+    end = line.find(b'"', start + len(key)) + 1
+    digest = hashlib.blake2b(line[:start], digest_size=DIGEST_SIZE)
+    digest.update(line[end:])
+    return digest.digest()
+
+
+@dataclass
+class Snapshot:
+    """Product id -> content digest of one build, with its feed timestamps."""
+
+    feed_updated_at: str
+    delta_since: Optional[str] = None
+    digests: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional[Snapshot]:
+        """Read a snapshot written by `save`; None if `path` does not exist."""
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            header_end = data.index(b"\n")
+            header = json.loads(data[:header_end])
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported version {header.get('version')!r}")
+            count = header["count"]
+            pos = header_end + 1
+            digests = data[pos : pos + count * DIGEST_SIZE]
+            pos += count * DIGEST_SIZE
+            lengths = array("I")
+            lengths.frombytes(data[pos : pos + count * lengths.itemsize])
+            if sys.byteorder == "big":
+                lengths.byteswap()
+            pos += count * lengths.itemsize
+            ids = data[pos:].decode("utf-8")
+            if len(digests) != count * DIGEST_SIZE or sum(lengths) != len(ids):
+                raise ValueError("truncated")
+        except (ValueError, KeyError) as e:
+            raise ValueError(
+                f"Invalid delta snapshot {path} ({e}); delete it to start a new baseline"
+            ) from e
+        offsets = [0, *itertools.accumulate(lengths)]
+        return cls(
+            header["feed_updated_at"],
+            header.get("delta_since"),
+            {
+                ids[start:end]: digests[i * DIGEST_SIZE : (i + 1) * DIGEST_SIZE]
+                for i, (start, end) in enumerate(zip(offsets, offsets[1:]))
+            },
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot atomically."""
+        path = Path(path)
+        header = {
+            "version": SNAPSHOT_VERSION,
+            "feed_updated_at": self.feed_updated_at,
+            "delta_since": self.delta_since,
+            "count": len(self.digests),
+        }
+        lengths = array("I", map(len, self.digests))
+        if sys.byteorder == "big":
+            lengths.byteswap()
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(b"".join(self.digests.values()))
+                f.write(lengths.tobytes())
+                f.write("".join(self.digests).encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+@dataclass
+class DeltaResult:
+    """Outcome of a delta build: what the manifest should reference."""
+
+    feed_updated_at: str
+    since: Optional[str] = None
+    path: Optional[str] = None
+    changed: int = 0
+    removed: int = 0
+    # True if there was no previous snapshot and this build is the new baseline
+    baseline: bool = False
+
+
+class DeltaWriter:
+    """Collects the digests of one build and writes the delta against the last one.
+
+    Call `add()` with every serialized feed line, then `finish()` once the
+    feed is complete. `now` becomes `feed_updated_at` if anything changed.
+    The snapshot is read from and saved to `snapshot_path` (default:
+    default_snapshot_path), which must lie outside `output_dir`.
+    """
+
+    def __init__(
+        self, output_dir: str, now: str, snapshot_path: Optional[str | Path] = None
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / "llm" / "feed" / DELTA_NAME
+        self.snapshot_path = Path(snapshot_path or default_snapshot_path(output_dir))
+        if self.snapshot_path.resolve().is_relative_to(self.output_dir.resolve()):
+            raise ValueError(
+                f"Delta snapshot {self.snapshot_path} must be outside the output directory"
+            )
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy = self.output_dir / _LEGACY_SNAPSHOT_NAME
+        if legacy.exists():
+            # Move it out so the output directory can be published as-is
+            if self.snapshot_path.exists():
+                legacy.unlink()
+            else:
+                shutil.move(legacy, self.snapshot_path)
+        self.now = now
+        self.previous = Snapshot.load(self.snapshot_path)
+        self.digests: dict[str, bytes] = {}
+        self.changed = 0
+        self._spool: Optional[IO[bytes]] = None
+
+    def add(self, product_id: str, line: bytes) -> None:
+        digest = content_digest(line)
+        self.digests[product_id] = digest
+        if self.previous is None or self.previous.digests.get(product_id) == digest:
+            return
+        if self._spool is None:
+            self._spool = tempfile.SpooledTemporaryFile(_SPOOL_BYTES, dir=self.snapshot_path.parent)
+        self._spool.write(line)
+        self._spool.write(b"\n")
+        self.changed += 1
+
+    def finish(self, staging: Optional[Staging] = None) -> DeltaResult:
+        """Write products-delta.jsonl (if anything changed) and the new snapshot.
+
+        With `staging`, both are only put in place when it is published.
+        """
+        owned = staging is None
+        staging = staging if staging is not None else Staging()
+        previous = self.previous
+        try:
+            if previous is None:
+                # No baseline: nothing to diff against, drop any old delta
+                self._remove_delta(staging)
+                result = DeltaResult(self.now, baseline=True)
+            else:
+                removed = [i for i in previous.digests if i not in self.digests]
+                if self.changed or removed:
+                    self._write_delta(removed, staging)
+                    result = DeltaResult(
+                        self.now,
+                        previous.feed_updated_at,
+                        str(self.path),
+                        self.changed,
+                        len(removed),
+                    )
+                else:
+                    result = self._keep_delta(previous, staging)
+        finally:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+        snapshot = Snapshot(result.feed_updated_at, result.since, self.digests)
+        snapshot.save(staging.stage(self.snapshot_path))
+        if owned:
+            staging.publish()
+        return result
+
+    def _write_delta(self, removed: list[str], staging: Staging) -> None:
+        with staging.open(self.path) as f:
+            if self._spool is not None:
+                self._spool.seek(0)
+                while block := self._spool.read(1 << 20):
+                    f.write(block)
+            for product_id in removed:
+                tombstone = {"id": product_id, "deleted": True, "updated_at": self.now}
+                f.write(dumps_line(tombstone))
+                f.write(b"\n")
+
+    def _keep_delta(self, previous: Snapshot, staging: Staging) -> DeltaResult:
+        if previous.delta_since is None or not self.path.exists():
+            self._remove_delta(staging)
+            return DeltaResult(previous.feed_updated_at)
+        if staging.codecs:
+            # Rewrite so the siblings match this build's codecs
+            staging.write_bytes(self.path, self.path.read_bytes())
+        return DeltaResult(previous.feed_updated_at, previous.delta_since, str(self.path))
+
+    def _remove_delta(self, staging: Staging) -> None:
+        for suffix in ("", *PRECOMPRESS_CODECS.values()):
+            staging.remove(self.path.with_name(DELTA_NAME + suffix))
@@ -0,0 +1,257 @@
+"""Time-bucketed archive of delta feeds for static hosting.
+
+A static host cannot answer `products-delta.jsonl?since=...`, so
+`generate --delta-buckets hourly|daily` also keeps every build's delta in
+bucket files under llm/feed/delta/ (`2026-10-18T09.jsonl` per hour or
+`2026-10-18.jsonl` per day) and lists them in llm/feed/delta-index.json:
+
+    {"updated_at": ..., "granularity": "hourly", "earliest": ...,
+     "buckets": [{"url", "start", "end", "rows", "bytes", "sha256"}, ...]}
+
+A build's delta lines are merged into the bucket holding its build time, one
+line per product id with the latest change winning. An agent that synced at
+T, with T >= `earliest`, fetches the buckets whose `end` is after T and
+applies them in order; replaying changes it already has is harmless. An agent
+that synced before `earliest` re-downloads the full feed.
+
+Hourly buckets are rolled up into one daily bucket once their UTC day is
+over, and buckets that ended more than `retention` ago are dropped, moving
+`earliest` forward, so the archive stays bounded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from llmindex.llmindex_cli.generators.compress import sibling_paths, stale_siblings
+from llmindex.llmindex_cli.generators.delta import DeltaResult
+from llmindex.llmindex_cli.generators.json_backend import dumps_pretty
+from llmindex.llmindex_cli.generators.staging import Staging
+
+DELTA_INDEX_NAME = "delta-index.json"
+DELTA_DIR_NAME = "delta"
+
+GRANULARITIES = {"hourly": timedelta(hours=1), "daily": timedelta(days=1)}
+DEFAULT_RETENTION = "7d"
+
+_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+_BUCKET_NAME = {"hourly": "%Y-%m-%dT%H.jsonl", "daily": "%Y-%m-%d.jsonl"}
+# A bucket file or one of its precompressed siblings
+_BUCKET_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}(?:T\d{2})?\.jsonl)(\.gz|\.br|\.zst)?$")
+_RETENTION_UNITS = {"h": timedelta(hours=1), "d": timedelta(days=1), "w": timedelta(weeks=1)}
+
+
+def parse_retention(value: str) -> timedelta:
+    """Parse a retention window such as "48h", "7d" or "2w"."""
+    match = re.fullmatch(r"\s*(\d+)\s*([hdwHDW])\s*", value)
+    if match is None or int(match.group(1)) < 1:
+        raise ValueError(f"Invalid retention {value!r}: use hours, days or weeks (48h, 7d, 2w)")
+    return int(match.group(1)) * _RETENTION_UNITS[match.group(2).lower()]
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.strptime(value, _TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def _format_time(value: datetime) -> str:
+    return value.strftime(_TIME_FORMAT)
+
+
+def _floor(value: datetime, granularity: str) -> datetime:
+    if granularity == "daily":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class _Bucket:
+    start: datetime
+    end: datetime
+    name: str
+    entry: Optional[dict] = None  # index entry of the file on disk
+    lines: Optional[dict[str, bytes]] = None  # new content (id -> line) to write
+
+
+class DeltaArchive:
+    """Maintains llm/feed/delta/ and delta-index.json across builds.
+
+    `update()` is called once per `--delta` build with that build's
+    DeltaResult; the existing index is the archive's state.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        granularity: str,
+        retention: timedelta,
+        base_url: Optional[str] = None,
+    ) -> None:
+        if granularity not in GRANULARITIES:
+            raise ValueError(
+                f"Unknown delta bucket granularity {granularity!r}: use "
+                f"{' or '.join(GRANULARITIES)}"
+            )
+        if retention < GRANULARITIES[granularity]:
+            raise ValueError(f"Delta retention must be at least one {granularity} bucket")
+        self.feed_dir = Path(output_dir) / "llm" / "feed"
+        self.bucket_dir = self.feed_dir / DELTA_DIR_NAME
+        self.index_path = self.feed_dir / DELTA_INDEX_NAME
+        self.granularity = granularity
+        self.retention = retention
+        self.base_url = base_url
+        self.written: list[str] = []
+
+    def update(
+        self,
+        delta: DeltaResult,
+        staging: Optional[Staging] = None,
+        clock: Optional[datetime] = None,
+    ) -> str:
+        """Add `delta`'s changes, roll up and expire buckets, write the index.
+
+        `clock` (default: now) decides which days are over and which buckets
+        are past retention. Returns the path of delta-index.json; `written`
+        lists the files written by this update. With `staging`, files are
+        only written and removed when it is published.
+        """
+        owned = staging is None
+        staging = staging if staging is not None else Staging()
+        earliest, buckets = self._load(delta)
+        if (delta.changed or delta.removed) and delta.path:
+            delta_path = staging.path(Path(delta.path))
+            self._add(buckets, _parse_time(delta.feed_updated_at), delta_path)
+
+        clock = clock or datetime.now(timezone.utc)
+        if self.granularity == "hourly":
+            buckets = self._roll_up(buckets, clock)
+        cutoff = clock - self.retention
+        for bucket in [b for b in buckets if b.end <= cutoff]:
+            buckets.remove(bucket)
+            earliest = max(earliest, bucket.end)
+
+        self._write(buckets, earliest, delta.feed_updated_at, staging)
+        if owned:
+            staging.publish()
+        return str(self.index_path)
+
+    def _load(self, delta: DeltaResult) -> tuple[datetime, list[_Bucket]]:
+        """`earliest` and the buckets of the existing index, or of a new archive."""
+        index = None
+        if not delta.baseline:
+            try:
+                index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                index = None
+        if index is None or index.get("granularity") != self.granularity:
+            # A new archive covers the changes since the previous build, if known
+            return _parse_time(delta.since or delta.feed_updated_at), []
+        buckets = []
+        for entry in index["buckets"]:
+            name = Path(entry["url"]).name
+            if (self.bucket_dir / name).exists():
+                start, end = _parse_time(entry["start"]), _parse_time(entry["end"])
+                buckets.append(_Bucket(start, end, name, entry))
+        return _parse_time(index["earliest"]), buckets
+
+    def _add(self, buckets: list[_Bucket], now: datetime, delta_path: Path) -> None:
+        bucket = next((b for b in buckets if b.start <= now < b.end), None)
+        if bucket is None:
+            start = _floor(now, self.granularity)
+            name = start.strftime(_BUCKET_NAME[self.granularity])
+            bucket = _Bucket(start, start + GRANULARITIES[self.granularity], name, lines={})
+            buckets.append(bucket)
+            buckets.sort(key=lambda b: b.start)
+        elif bucket.lines is None:
+            bucket.lines = self._read(bucket)
+        with delta_path.open("rb") as f:
+            _merge_lines(bucket.lines, f)
+
+    def _roll_up(self, buckets: list[_Bucket], clock: datetime) -> list[_Bucket]:
+        """Merge the hourly buckets of each finished UTC day into one daily bucket."""
+        today = _floor(clock, "daily")
+        rolled: list[_Bucket] = []
+        days: dict[datetime, dict[str, bytes]] = {}
+        for bucket in buckets:
+            day = _floor(bucket.start, "daily")
+            if bucket.end - bucket.start >= GRANULARITIES["daily"] or day >= today:
+                rolled.append(bucket)
+                continue
+            if day not in days:
+                days[day] = {}
+                name = day.strftime(_BUCKET_NAME["daily"])
+                rolled.append(_Bucket(day, day + GRANULARITIES["daily"], name, lines=days[day]))
+            _merge_lines(days[day], self._content(bucket))
+        return rolled
+
+    def _content(self, bucket: _Bucket) -> list[bytes]:
+        if bucket.lines is not None:
+            return list(bucket.lines.values())
+        return (self.bucket_dir / bucket.name).read_bytes().splitlines()
+
+    def _read(self, bucket: _Bucket) -> dict[str, bytes]:
+        lines: dict[str, bytes] = {}
+        _merge_lines(lines, self._content(bucket))
+        return lines
+
+    def _write(
+        self,
+        buckets: list[_Bucket],
+        earliest: datetime,
+        updated_at: str,
+        staging: Staging,
+    ) -> None:
+        codecs = staging.codecs
+        for bucket in buckets:
+            path = self.bucket_dir / bucket.name
+            if bucket.lines is None and any(not p.exists() for p in sibling_paths(path, codecs)):
+                # Unchanged, but written before these codecs were requested
+                bucket.lines = self._read(bucket)
+            if bucket.lines is None:
+                continue
+            data = b"".join(line + b"\n" for line in bucket.lines.values())
+            staging.write_bytes(path, data)
+            self.written.append(str(path))
+            url = f"{DELTA_DIR_NAME}/{bucket.name}"
+            bucket.entry = {
+                "url": f"{self.base_url}/llm/feed/{url}" if self.base_url else url,
+                "start": _format_time(bucket.start),
+                "end": _format_time(bucket.end),
+                "rows": len(bucket.lines),
+                "bytes": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+
+        keep = {b.name for b in buckets}
+        for path in self.bucket_dir.glob("*"):
+            match = _BUCKET_RE.match(path.name)
+            if match and match.group(1) not in keep:
+                staging.remove(path)
+        for sibling in stale_siblings([self.bucket_dir / b.name for b in buckets], codecs):
+            staging.remove(sibling)
+
+        index = {
+            "updated_at": updated_at,
+            "granularity": self.granularity,
+            "earliest": _format_time(earliest),
+            "buckets": [b.entry for b in buckets],
+        }
+        content = dumps_pretty(index)
+        staging.write_text(self.index_path, content)
+        self.written.append(str(self.index_path))
+
+
+def _merge_lines(lines: dict[str, bytes], new_lines: Iterable[bytes]) -> None:
+    """Add delta lines to `lines` (id -> line); a later line for an id replaces it."""
+    for line in new_lines:
+        line = line.rstrip(b"\r\n")
+        if line:
+            product_id = json.loads(line)["id"]
+            lines.pop(product_id, None)
+            lines[product_id] = line
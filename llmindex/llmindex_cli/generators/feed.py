@@ -1,51 +1,334 @@
-"""Generate products.jsonl feed."""
+"""Generate products.jsonl feed.
+
+Large catalogs can be split into shards (products-00001.jsonl, ...) of at
+most N rows or N bytes each, listed in feed-index.json with each shard's
+URL, row count, byte size, updated_at range and SHA-256, so consumers can
+fetch shards in parallel and re-fetch only the ones that changed.
+"""
 
 from __future__ import annotations
 
-import json
+import hashlib
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Any, Optional
+
+from llmindex.llmindex_cli.generators.compress import PRECOMPRESS_CODECS
+from llmindex.llmindex_cli.generators.delta import DeltaWriter
+from llmindex.llmindex_cli.generators.json_backend import dumps_line, dumps_pretty
+from llmindex.llmindex_cli.generators.staging import Staging
+from llmindex.llmindex_cli.models import Product, ProductRow, ProductTable
+from llmindex.llmindex_cli.stats import RunStats
+
+FEED_NAME = "products.jsonl"
+FEED_INDEX_NAME = "feed-index.json"
+SHARD_NAME = "products-{:05d}.jsonl"
+# A shard or one of its precompressed siblings
+_SHARD_RE = re.compile(r"^(products-\d{5,}\.jsonl)(\.gz|\.br|\.zst)?$")
+
+_BYTE_UNITS = {
+    "b": 1,
+    "kb": 10**3,
+    "mb": 10**6,
+    "gb": 10**9,
+    "kib": 2**10,
+    "mib": 2**20,
+    "gib": 2**30,
+}
 
-from llmindex.llmindex_cli.models import Product
 
+def feed_record(p: Product | ProductRow) -> dict:
+    """Return the products.jsonl object for one product (spec key order, no nulls)."""
+    obj: dict = {
+        "id": p.id,
+        "title": p.title,
+        "url": p.url,
+        "availability": p.availability,
+        "updated_at": p.updated_at,
+    }
+    if p.image_url:
+        obj["image_url"] = p.image_url
+    if p.price is not None and p.currency:
+        obj["price"] = p.price
+        obj["currency"] = p.currency
+    if p.price_range:
+        obj["price_range"] = p.price_range.model_dump()
+    if p.brand:
+        obj["brand"] = p.brand
+    if p.category:
+        obj["category"] = p.category
+    return obj
 
-def generate_feed(products: list[Product]) -> str:
-    """Generate JSONL content from a list of Product models.
+
+def feed_line_bytes(p: Product | ProductRow) -> bytes:
+    """Serialize one Product as a UTF-8 products.jsonl line (without the trailing newline).
+
+    Uses orjson when installed (see generators.json_backend).
+    """
+    return dumps_line(feed_record(p))
+
+
+def feed_line(p: Product | ProductRow) -> str:
+    """Serialize one Product as a products.jsonl line (without the trailing newline)."""
+    return feed_line_bytes(p).decode("utf-8")
+
+
+def generate_feed(products: Iterable[Product] | ProductTable) -> str:
+    """Generate JSONL content from Product models or a ProductTable.
 
     Each line is a JSON object with fields matching the spec.
     """
-    lines = []
-    for p in products:
-        obj: dict = {
-            "id": p.id,
-            "title": p.title,
-            "url": p.url,
-            "availability": p.availability,
-            "updated_at": p.updated_at,
+    lines = [feed_line(p) for p in products]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+@dataclass(frozen=True)
+class ShardSize:
+    """Maximum size of one feed shard: `limit` rows, or `limit` bytes."""
+
+    limit: int
+    unit: str = "rows"
+
+    @classmethod
+    def parse(cls, value: str) -> ShardSize:
+        """Parse "50000" (rows) or a byte size with a unit ("64MB", "512KiB")."""
+        match = re.fullmatch(r"\s*(\d+)\s*([a-zA-Z]*)\s*", value)
+        unit = match.group(2).lower() if match else ""
+        if match is None or (unit and unit not in _BYTE_UNITS) or int(match.group(1)) < 1:
+            raise ValueError(
+                f"Invalid shard size {value!r}: use a row count (50000) or a byte size "
+                "(64MB, 512KiB)"
+            )
+        if not unit:
+            return cls(int(match.group(1)))
+        return cls(int(match.group(1)) * _BYTE_UNITS[unit], "bytes")
+
+    def full(self, rows: int, size: int, line_bytes: int) -> bool:
+        """True if a shard of `rows` rows and `size` bytes cannot take another line."""
+        if rows == 0:
+            return False
+        if self.unit == "rows":
+            return rows >= self.limit
+        return size + line_bytes > self.limit
+
+
+@dataclass
+class _Shard:
+    path: Path
+    fh: IO[bytes]
+    rows: int = 0
+    bytes: int = 0
+    sha256: Any = field(default_factory=hashlib.sha256)
+    min_updated_at: Optional[str] = None
+    max_updated_at: Optional[str] = None
+
+    def write(self, line: bytes, updated_at: str) -> None:
+        self.fh.write(line)
+        self.sha256.update(line)
+        self.rows += 1
+        self.bytes += len(line)
+        # Feed timestamps share one ISO 8601 UTC format, so they order as strings
+        if self.min_updated_at is None or updated_at < self.min_updated_at:
+            self.min_updated_at = updated_at
+        if self.max_updated_at is None or updated_at > self.max_updated_at:
+            self.max_updated_at = updated_at
+
+    def entry(self, base_url: Optional[str]) -> dict:
+        name = self.path.name
+        return {
+            "url": f"{base_url}/llm/feed/{name}" if base_url else name,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "min_updated_at": self.min_updated_at,
+            "max_updated_at": self.max_updated_at,
+            "sha256": self.sha256.hexdigest(),
         }
-        if p.image_url:
-            obj["image_url"] = p.image_url
-        if p.price is not None and p.currency:
-            obj["price"] = p.price
-            obj["currency"] = p.currency
-        if p.price_range:
-            obj["price_range"] = p.price_range.model_dump()
-        if p.brand:
-            obj["brand"] = p.brand
-        if p.category:
-            obj["category"] = p.category
-
-        lines.append(json.dumps(obj, ensure_ascii=False))
 
-    return "\n".join(lines) + "\n" if lines else ""
 
+def feed_index(shards: list[dict]) -> dict:
+    """Build the feed-index.json object for the given shard entries."""
+    return {
+        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "total_rows": sum(s["rows"] for s in shards),
+        "total_bytes": sum(s["bytes"] for s in shards),
+        "shards": shards,
+    }
+
+
+class FeedWriter:
+    """Write output_dir/llm/feed/products.jsonl one product at a time.
+
+    The file is only created once the first product arrives, so an empty
+    catalog leaves no feed behind. With `stats`, serialization and write time
+    and the bytes written are recorded.
+
+    With `shard_size`, products are written to products-00001.jsonl, ... and
+    `path` is the feed-index.json written on close; shard URLs are absolute
+    under `base_url` when given. Files of the other layout left by an earlier
+    run, or a whole feed once the catalog is empty, are removed, so the feed
+    directory always matches the manifest.
+
+    Files are written under temporary names and only replace the previous
+    feed once the `with` block exits without an error (see
+    generators.staging). With `staging`, publishing is left to its owner,
+    who may also precompress every file as it is written. With `delta`,
+    every line is also handed to the DeltaWriter (see generators.delta).
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        stats: Optional[RunStats] = None,
+        shard_size: Optional[ShardSize] = None,
+        base_url: Optional[str] = None,
+        delta: Optional[DeltaWriter] = None,
+        staging: Optional[Staging] = None,
+    ) -> None:
+        self.feed_dir = Path(output_dir) / "llm" / "feed"
+        self.path = self.feed_dir / (FEED_INDEX_NAME if shard_size else FEED_NAME)
+        self.count = 0
+        self.shard_size = shard_size
+        self.base_url = base_url
+        self.shards: list[dict] = []
+        self._fh: Optional[IO[bytes]] = None
+        self._shard: Optional[_Shard] = None
+        self._stats = stats
+        self._delta = delta
+        self._staging = staging if staging is not None else Staging()
+        self._owns_staging = staging is None
+
+    def write(self, product: Product | ProductRow) -> None:
+        if self._stats is None:
+            line = feed_line_bytes(product)
+            self._write_line(line, product.updated_at)
+            if self._delta is not None:
+                self._delta.add(product.id, line)
+        else:
+            start = time.perf_counter()
+            line = feed_line_bytes(product)
+            serialized = time.perf_counter()
+            self._write_line(line, product.updated_at)
+            if self._delta is not None:
+                self._delta.add(product.id, line)
+            self._stats.serialize_seconds += serialized - start
+            self._stats.write_seconds += time.perf_counter() - serialized
+        self.count += 1
+
+    def _open(self, path: Path) -> IO[bytes]:
+        return self._staging.open(path)
+
+    def _write_line(self, line: bytes, updated_at: str) -> None:
+        if self.shard_size is None:
+            if self._fh is None:
+                self._fh = self._open(self.path)
+            self._fh.write(line)
+            self._fh.write(b"\n")
+            return
+
+        data = line + b"\n"
+        shard = self._shard
+        if shard is None or self.shard_size.full(shard.rows, shard.bytes, len(data)):
+            self._close_shard()
+            path = self.feed_dir / SHARD_NAME.format(len(self.shards) + 1)
+            shard = self._shard = _Shard(path, self._open(path))
+        shard.write(data, updated_at)
+
+    def _close_shard(self) -> None:
+        if self._shard is not None:
+            self._shard.fh.close()
+            self.shards.append(self._shard.entry(self.base_url))
+            self._shard = None
+
+    def _remove_stale(self) -> None:
+        keep = {Path(s["url"]).name for s in self.shards}
+        for path in self.feed_dir.glob("products-*"):
+            match = _SHARD_RE.match(path.name)
+            if match and match.group(1) not in keep:
+                self._staging.remove(path)
+        stale = [FEED_NAME if self.shard_size else FEED_INDEX_NAME]
+        if self.count == 0:
+            stale.append(self.path.name)
+        for name in stale:
+            for suffix in ("", *PRECOMPRESS_CODECS.values()):
+                self._staging.remove(self.feed_dir / (name + suffix))
+
+    def close(self) -> None:
+        start = time.perf_counter()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        elif self._shard is not None:
+            self._close_shard()
+            index = dumps_pretty(feed_index(self.shards))
+            self._staging.write_text(self.path, index)
+        self._remove_stale()
+        if self._stats is not None and self.count:
+            self._stats.write_seconds += time.perf_counter() - start
+            self._stats.bytes_written += self._staging.path(self.path).stat().st_size
+            self._stats.bytes_written += sum(s["bytes"] for s in self.shards)
+        if self._owns_staging:
+            self._staging.publish()
+
+    def _abort(self) -> None:
+        for fh in (self._fh, self._shard.fh if self._shard is not None else None):
+            if fh is not None:
+                fh.close()
+        self._fh = self._shard = None
+        if self._owns_staging:
+            self._staging.discard()
+
+    def __enter__(self) -> FeedWriter:
+        return self
+
+    def __exit__(self, exc_type: object, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._abort()
+
+
+def stream_feed(products: Iterable[Product] | ProductTable, out: IO[bytes]) -> int:
+    """Write products.jsonl lines to a binary stream (e.g. stdout) as products arrive.
+
+    Returns the number of products written. The stream is flushed but not closed.
+    """
+    count = 0
+    for p in products:
+        out.write(feed_line_bytes(p))
+        out.write(b"\n")
+        count += 1
+    out.flush()
+    return count
+
+
+def write_feed(
+    products: Iterable[Product] | ProductTable,
+    output_dir: str,
+    shard_size: Optional[ShardSize] = None,
+    base_url: Optional[str] = None,
+) -> str:
+    """Stream products.jsonl to output_dir/llm/feed/, one line per product.
+
+    With `shard_size`, writes products-NNNNN.jsonl shards and returns the path
+    of their feed-index.json instead (see FeedWriter).
+    """
+    if shard_size is not None:
+        with FeedWriter(output_dir, shard_size=shard_size, base_url=base_url) as feed:
+            for p in products:
+                feed.write(p)
+        return str(feed.path)
 
-def write_feed(products: list[Product], output_dir: str) -> str:
-    """Generate and write products.jsonl to output_dir/llm/feed/."""
     feed_dir = Path(output_dir) / "llm" / "feed"
     feed_dir.mkdir(parents=True, exist_ok=True)
 
-    path = feed_dir / "products.jsonl"
-    content = generate_feed(products)
-    path.write_text(content, encoding="utf-8")
+    path = feed_dir / FEED_NAME
+    with path.open("wb") as f:
+        for p in products:
+            f.write(feed_line_bytes(p))
+            f.write(b"\n")
 
     return str(path)
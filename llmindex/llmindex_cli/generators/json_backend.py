@@ -0,0 +1,98 @@
+"""JSON serialization for generated artifacts, using orjson when installed.
+
+Serializing feed lines dominates `generate` once import is done, so when the
+optional `orjson` package is installed (`pip install 'llmindex[fast]'`) it
+is used automatically; otherwise the standard library is. Both backends
+produce the same bytes. The reference format is `json.dumps(obj,
+ensure_ascii=False)`: feed lines have a space after `,` and `:` and
+non-ASCII text is written as UTF-8, and pretty output uses a two-space
+indent. orjson only writes compact lines (no spaces), so it serializes feed
+lines only when compact output is asked for with LLMINDEX_COMPACT_JSON=1;
+pretty output always uses it. orjson writes floats below 1e-4 or from 1e16
+up without Python's exponent form ("1e-05", "1e+16") and NaN/Infinity as
+null, so values like these, and anything orjson cannot serialize, go
+through the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable
+
+
+def _load_orjson() -> Any:
+    if os.environ.get("LLMINDEX_JSON_BACKEND", "").lower() == "json":
+        return None
+    try:
+        import orjson  # type: ignore[import-not-found]
+    except ModuleNotFoundError:
+        return None
+    return orjson
+
+
+_orjson = _load_orjson()
+
+# "orjson" or "json": the backend dumps_line()/dumps_pretty() use by default
+JSON_BACKEND = "orjson" if _orjson is not None else "json"
+# Whether dumps_line() leaves out the spaces after "," and ":" by default
+COMPACT_JSON = os.environ.get("LLMINDEX_COMPACT_JSON", "").lower() in ("1", "true", "yes")
+
+
+def _orjson_safe(value: Any) -> bool:
+    """True if orjson serializes `value` exactly like json.dumps."""
+    for v in value.values() if type(value) is dict else value:
+        t = type(v)
+        if t is float:
+            if not (v == 0.0 or 1e-4 <= abs(v) < 1e16):
+                return False
+        elif (t is dict or t is list) and not _orjson_safe(v):
+            return False
+    return True
+
+
+def _json_line(obj: Any, compact: bool) -> bytes:
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _orjson_line(obj: Any, compact: bool) -> bytes:
+    if compact and _orjson_safe(obj):
+        try:
+            return _orjson.dumps(obj)
+        except _orjson.JSONEncodeError:
+            pass
+    return _json_line(obj, compact)
+
+
+def _json_pretty(obj: Any) -> str:
+    return json.dumps(obj, indent=2, ensure_ascii=False) + "\n"
+
+
+def _orjson_pretty(obj: Any) -> str:
+    if _orjson_safe(obj):
+        try:
+            return _orjson.dumps(
+                obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_APPEND_NEWLINE
+            ).decode()
+        except _orjson.JSONEncodeError:
+            pass
+    return _json_pretty(obj)
+
+
+_LINE: dict[str, Callable[[Any, bool], bytes]] = {"json": _json_line, "orjson": _orjson_line}
+_PRETTY: dict[str, Callable[[Any], str]] = {"json": _json_pretty, "orjson": _orjson_pretty}
+
+
+def dumps_line(obj: Any, backend: str = JSON_BACKEND, compact: bool = COMPACT_JSON) -> bytes:
+    """Serialize `obj` as one UTF-8 JSON line (without the newline).
+
+    With `compact`, there are no spaces after "," and ":".
+    """
+    return _LINE[backend](obj, compact)
+
+
+def dumps_pretty(obj: Any, backend: str = JSON_BACKEND) -> str:
+    """Serialize `obj` as two-space indented JSON with a trailing newline."""
+    return _PRETTY[backend](obj)
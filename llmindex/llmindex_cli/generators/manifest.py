@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
+from typing import Optional
 
+from llmindex.llmindex_cli.generators.json_backend import dumps_pretty
+from llmindex.llmindex_cli.generators.staging import Staging
 from llmindex.llmindex_cli.models import SiteConfig
 
 
-def generate_manifest(config: SiteConfig, has_feed: bool = True) -> dict:
-    """Build the llmindex.json manifest dict from a SiteConfig."""
+def generate_manifest(
+    config: SiteConfig,
+    has_feed: bool = True,
+    feed_index: bool = False,
+    feed_updated_at: Optional[str] = None,
+    delta_since: Optional[str] = None,
+    delta_index: bool = False,
+) -> dict:
+    """Build the llmindex.json manifest dict from a SiteConfig.
+
+    With `feed_index`, the feed is sharded and `feeds` references its
+    feed-index.json instead of a single products.jsonl. `feed_updated_at`
+    defaults to now; with `delta_since`, `feeds` also references
+    products-delta.jsonl with the changes since that time (see generators.delta),
+    and with `delta_index` the delta-index.json of the time-bucketed delta
+    archive (see generators.delta_archive).
+    """
     base = config.get_base_url()
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -32,18 +49,33 @@ def generate_manifest(config: SiteConfig, has_feed: bool = True) -> dict:
     }
 
     if has_feed:
-        manifest["feed_updated_at"] = now
-        manifest["feeds"] = {
-            "products_jsonl": f"{base}/llm/feed/products.jsonl",
-        }
+        manifest["feed_updated_at"] = feed_updated_at or now
+        if feed_index:
+            manifest["feeds"] = {"products_jsonl_index": f"{base}/llm/feed/feed-index.json"}
+        else:
+            manifest["feeds"] = {"products_jsonl": f"{base}/llm/feed/products.jsonl"}
+        if delta_since:
+            manifest["feeds"]["products_jsonl_delta"] = (
+                f"{base}/llm/feed/products-delta.jsonl?since={delta_since}"
+            )
+        if delta_index:
+            manifest["feeds"]["products_jsonl_delta_index"] = f"{base}/llm/feed/delta-index.json"
 
     return manifest
 
 
-def write_manifest(manifest: dict, output_path: str) -> None:
-    """Serialize manifest to JSON and write to file."""
+def write_manifest(manifest: dict, output_path: str, staging: Optional[Staging] = None) -> None:
+    """Serialize manifest to JSON and write to file.
+
+    With `staging`, the file (and its compressed siblings) is only put in
+    place when the staging is published.
+    """
     from pathlib import Path
 
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    content = dumps_pretty(manifest)
+    if staging is not None:
+        staging.write_text(path, content)
+    else:
+        path.write_text(content, encoding="utf-8")
@@ -2,37 +2,104 @@
 
 from __future__ import annotations
 
+import io
+import shutil
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Optional
-
-from llmindex.llmindex_cli.models import Product, SiteConfig
-
-
-def generate_products_page(products: list[Product], config: SiteConfig) -> str:
-    """Generate products.md with grouped product listing."""
-    lines = [f"# {config.name} — Products\n"]
-
-    # Group by category
-    categories: dict[str, list[Product]] = {}
-    for p in products:
+from typing import IO, Optional
+
+from llmindex.llmindex_cli.generators.staging import Staging
+from llmindex.llmindex_cli.models import Product, ProductRow, ProductTable, SiteConfig
+
+
+def _product_line(p: Product | ProductRow) -> str:
+    avail = (
+        "In Stock"
+        if p.availability == "in_stock"
+        else ("Pre-order" if p.availability == "preorder" else "Out of Stock")
+    )
+    if p.price is not None and p.currency:
+        price_str = f"{p.currency} {p.price:.2f}"
+    elif p.price_range is not None:
+        pr = p.price_range
+        price_str = f"{pr.currency} {pr.min:.2f}–{pr.max:.2f}"
+    else:
+        price_str = "Price on request"
+    return f"- **[{p.title}]({p.url})** — {price_str} ({avail})"
+
+
+class ProductsPage:
+    """Incrementally build products.md while products stream past.
+
+    Only the rendered listing line is kept per product (grouped by category),
+    never the Product model itself. With `spill_dir` set, buffered lines are
+    appended to one file per category every `max_buffered` products, so memory
+    stays bounded by the buffer size and the number of categories.
+    """
+
+    def __init__(
+        self,
+        config: SiteConfig,
+        spill_dir: Optional[Path] = None,
+        max_buffered: int = 10_000,
+    ) -> None:
+        self.config = config
+        self._categories: dict[str, list[str]] = {}
+        self._spill_dir = spill_dir
+        self._spill_files: dict[str, Path] = {}
+        self._max_buffered = max_buffered
+        self._buffered = 0
+
+    def add(self, p: Product | ProductRow) -> None:
         cat = p.category or "Other"
-        categories.setdefault(cat, []).append(p)
-
-    for cat in sorted(categories):
-        lines.append(f"\n## {cat}\n")
-        for p in categories[cat]:
-            avail = (
-                "In Stock"
-                if p.availability == "in_stock"
-                else ("Pre-order" if p.availability == "preorder" else "Out of Stock")
-            )
-            if p.price is not None and p.currency:
-                price_str = f"{p.currency} {p.price:.2f}"
-            else:
-                price_str = "Price on request"
-            lines.append(f"- **[{p.title}]({p.url})** — {price_str} ({avail})")
-
-    return "\n".join(lines) + "\n"
+        self._categories.setdefault(cat, []).append(_product_line(p))
+        if self._spill_dir is not None:
+            self._buffered += 1
+            if self._buffered >= self._max_buffered:
+                self._spill()
+
+    def _spill(self) -> None:
+        assert self._spill_dir is not None
+        for cat, lines in self._categories.items():
+            if not lines:
+                continue
+            path = self._spill_files.get(cat)
+            if path is None:
+                path = self._spill_dir / f"{len(self._spill_files):06d}.md"
+                self._spill_files[cat] = path
+            with path.open("a", encoding="utf-8", newline="") as f:
+                for line in lines:
+                    f.write("\n")
+                    f.write(line)
+            lines.clear()
+        self._buffered = 0
+
+    def write_to(self, f: IO[str]) -> None:
+        """Write the rendered page to an open text stream."""
+        f.write(f"# {self.config.name} — Products\n")
+        for cat in sorted(self._categories):
+            f.write(f"\n\n## {cat}\n")
+            spilled = self._spill_files.get(cat)
+            if spilled is not None:
+                with spilled.open(encoding="utf-8", newline="") as src:
+                    shutil.copyfileobj(src, f)
+            for line in self._categories[cat]:
+                f.write("\n")
+                f.write(line)
+        f.write("\n")
+
+    def render(self) -> str:
+        buf = io.StringIO()
+        self.write_to(buf)
+        return buf.getvalue()
+
+
+def generate_products_page(products: Iterable[Product] | ProductTable, config: SiteConfig) -> str:
+    """Generate products.md with grouped product listing (from Products or a ProductTable)."""
+    page = ProductsPage(config)
+    for p in products:
+        page.add(p)
+    return page.render()
 
 
 def generate_policies_page(config: SiteConfig) -> str:
@@ -128,12 +195,19 @@ Primary language: {config.language}
 
 
 def write_pages(
-    products: list[Product],
+    products: Iterable[Product] | ProductsPage,
     config: SiteConfig,
     output_dir: str,
     templates_dir: Optional[Path] = None,
+    staging: Optional[Staging] = None,
 ) -> list[str]:
-    """Generate all /llm pages and write to output_dir/llm/."""
+    """Generate all /llm pages and write to output_dir/llm/.
+
+    `products` may be an already-filled ProductsPage when the catalog was
+    consumed in a single streaming pass (see generators.catalog). With
+    `staging`, pages are written through it (see generators.staging) and
+    only put in place when it is published.
+    """
     base = Path(output_dir) / "llm"
     base.mkdir(parents=True, exist_ok=True)
 
@@ -165,17 +239,34 @@ def write_pages(
             if rendered is not None:
                 templates[name] = rendered
 
+    if isinstance(products, ProductsPage):
+        products_page = products
+    else:
+        products_page = ProductsPage(config)
+        for p in products:
+            products_page.add(p)
+
+    products_path = base / "products.md"
+    if staging is not None:
+        with io.TextIOWrapper(staging.open(products_path), encoding="utf-8") as f:
+            products_page.write_to(f)
+    else:
+        with products_path.open("w", encoding="utf-8") as f:
+            products_page.write_to(f)
+    written = [str(products_path)]
+
     pages = {
-        "products.md": generate_products_page(products, config),
         "policies.md": templates.get("policies") or generate_policies_page(config),
         "faq.md": templates.get("faq") or generate_faq_page(config),
         "about.md": templates.get("about") or generate_about_page(config),
     }
 
-    written = []
     for filename, content in pages.items():
         path = base / filename
-        path.write_text(content, encoding="utf-8")
+        if staging is not None:
+            staging.write_text(path, content)
+        else:
+            path.write_text(content, encoding="utf-8")
         written.append(str(path))
 
     return written
@@ -0,0 +1,91 @@
+"""Publish a build's artifacts together, once the whole build has succeeded.
+
+write_catalog writes every artifact (and its precompressed siblings) under a
+temporary name next to its final path, e.g. llm/feed/.products.jsonl.<pid>.tmp,
+and defers removing stale files. Only when the product stream and all other
+artifacts are complete does `publish()` rename them into place with
+os.replace and remove what is stale. A build that fails midway (malformed
+input, a --max-errors abort) calls `discard()` instead, leaving the previous
+output exactly as it was. Each rename is atomic, so a server publishing the
+output directory never serves a half-written file.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import IO, Optional
+
+from llmindex.llmindex_cli.generators.compress import Precompressor, sibling_paths
+
+
+class Staging:
+    """Artifacts written under temporary names until `publish()`.
+
+    With `precompress`, everything written through `open()`, `write_bytes()`
+    and `write_text()` also gets its compressed siblings (see
+    generators.compress); call `precompress.close()` before `publish()`.
+    """
+
+    def __init__(self, precompress: Optional[Precompressor] = None) -> None:
+        self.precompress = precompress
+        # final path -> (temporary path, [(temporary sibling, final sibling)])
+        self._staged: dict[Path, tuple[Path, list[tuple[Path, Path]]]] = {}
+        self._removed: list[Path] = []
+
+    @property
+    def codecs(self) -> tuple[str, ...]:
+        return self.precompress.codecs if self.precompress is not None else ()
+
+    def stage(self, path: Path, codecs: tuple[str, ...] = ()) -> Path:
+        """Return the temporary path to write `path` (and its `codecs` siblings) to."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        siblings = list(zip(sibling_paths(tmp, codecs), sibling_paths(path, codecs)))
+        self._staged[path] = (tmp, siblings)
+        return tmp
+
+    def path(self, path: Path) -> Path:
+        """Where the new content of `path` is until it is published."""
+        staged = self._staged.get(Path(path))
+        return staged[0] if staged is not None else Path(path)
+
+    def open(self, path: Path) -> IO[bytes]:
+        """Open `path` for writing, under its temporary name."""
+        tmp = self.stage(path, self.codecs)
+        if self.precompress is not None:
+            return self.precompress.open(tmp)
+        return tmp.open("wb")
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        with self.open(path) as f:
+            f.write(data)
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.write_bytes(path, text.encode("utf-8"))
+
+    def remove(self, path: Path) -> None:
+        """Delete `path`, if it exists, when the build is published."""
+        self._removed.append(Path(path))
+
+    def publish(self) -> None:
+        """Move every staged file into place, then delete the removed ones."""
+        for path, (tmp, siblings) in self._staged.items():
+            for sibling, final in siblings:
+                os.replace(sibling, final)
+            os.replace(tmp, path)
+        for path in self._removed:
+            if path not in self._staged:
+                path.unlink(missing_ok=True)
+        self._staged.clear()
+        self._removed.clear()
+
+    def discard(self) -> None:
+        """Delete every staged file; the published output stays unchanged."""
+        for tmp, siblings in self._staged.values():
+            tmp.unlink(missing_ok=True)
+            for sibling, _ in siblings:
+                sibling.unlink(missing_ok=True)
+        self._staged.clear()
+        self._removed.clear()
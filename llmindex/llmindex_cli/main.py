@@ -4,24 +4,51 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import sys
+from collections.abc import Iterable
 from importlib.metadata import version as pkg_version
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
+import click
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-
-from llmindex.importers.csv_importer import import_csv
-from llmindex.importers.json_importer import import_json
-from llmindex.importers.shopify_importer import import_shopify_csv
+from typer.core import TyperCommand
+
+from llmindex.importers.compression import is_stdin
+from llmindex.importers.csv_importer import CSV_ENGINES
+from llmindex.importers.errors import DEFAULT_MAX_SAMPLES, ImportErrors
+from llmindex.importers.merge import DEFAULT_MAX_IN_MEMORY, MERGE_POLICIES, merge_products
+from llmindex.importers.site_importer import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PER_HOST,
+    DEFAULT_TIMEOUT,
+    CrawlCounts,
+    ResponseCache,
+    iter_site,
+)
+from llmindex.importers.sources import STDIN_SOURCE_TYPES, iter_products
+from llmindex.llmindex_cli.cache import (
+    CACHE_DIR_NAME,
+    CatalogCache,
+    UnsafeCacheError,
+    cached_products,
+)
 from llmindex.llmindex_cli.config import ConfigError, load_yaml_config
-from llmindex.llmindex_cli.generators.feed import write_feed
-from llmindex.llmindex_cli.generators.manifest import generate_manifest, write_manifest
-from llmindex.llmindex_cli.generators.pages import write_pages
-from llmindex.llmindex_cli.models import SiteConfig
+from llmindex.llmindex_cli.generators.catalog import peak_rss_bytes, write_catalog
+from llmindex.llmindex_cli.generators.compress import check_codecs, parse_codecs
+from llmindex.llmindex_cli.generators.delta_archive import (
+    DEFAULT_RETENTION,
+    GRANULARITIES,
+    parse_retention,
+)
+from llmindex.llmindex_cli.generators.feed import ShardSize, stream_feed
+from llmindex.llmindex_cli.models import Product, SiteConfig
+from llmindex.llmindex_cli.stats import RunStats
 from llmindex.llmindex_cli.validators import validate_all
 
 app = typer.Typer(
@@ -30,6 +57,8 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 console = Console()
+# For commands whose stdout is data (e.g. `feed`)
+err_console = Console(stderr=True)
 verify_app = typer.Typer(help="Generate and check domain verification challenges.")
 app.add_typer(verify_app, name="verify")
 sign_app = typer.Typer(help="Sign and verify manifest signatures (EdDSA JWS).")
@@ -485,8 +514,202 @@ def init(
     )
 
 
-@app.command()
+_RAW_ARGS = "llmindex.raw_args"
+
+
+class _OrderedInputsCommand(TyperCommand):
+    """Remembers the raw arguments, so repeated --input-* flags keep their order."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        ctx.meta[_RAW_ARGS] = list(args)
+        return super().parse_args(ctx, args)
+
+
+def _ordered_inputs(
+    raw_args: Optional[list[str]], inputs: dict[str, Optional[list[Path]]]
+) -> list[tuple[Path, str]]:
+    """Return (path, source type) for every --input-* value in command-line order.
+
+    `inputs` maps source type to the paths given for it. Without `raw_args`
+    the sources are taken type by type.
+    """
+    flags = {f"--input-{kind.replace('_', '-')}": kind for kind in inputs}
+    flags["-i"] = "csv"
+    remaining = {kind: list(paths or ()) for kind, paths in inputs.items()}
+
+    ordered: list[tuple[Path, str]] = []
+    args = iter(raw_args or ())
+    for arg in args:
+        if arg == "--":
+            break
+        name = arg.split("=", 1)[0] if arg.startswith("--") else arg[:2]
+        kind = flags.get(name)
+        if kind is None or not remaining[kind]:
+            continue
+        if arg == name:  # value is the next argument
+            next(args, None)
+        ordered.append((remaining[kind].pop(0), kind))
+
+    # Anything not located in raw_args (e.g. called without them)
+    for kind, paths in remaining.items():
+        ordered.extend((path, kind) for path in paths)
+    return ordered
+
+
+def _choice(value: str, choices: tuple[str, ...], flag: str, out: Console) -> str:
+    """Normalise a choice option, exiting with an error if it is not one of `choices`."""
+    value = value.strip().lower()
+    if value not in choices:
+        out.print(f"[red]Error:[/red] {flag} must be one of: {', '.join(choices)}")
+        raise typer.Exit(1)
+    return value
+
+
+def _check_inputs(provided: list[tuple[Path, str]], out: Console) -> None:
+    """Exit with an error for a missing input file or an unsupported '-' (stdin)."""
+    for input_path, source_type in provided:
+        if is_stdin(input_path):
+            if source_type not in STDIN_SOURCE_TYPES:
+                flag = f"--input-{source_type.replace('_', '-')}"
+                out.print(f"[red]Error:[/red] {flag} cannot read from stdin ('-')")
+                raise typer.Exit(1)
+        elif not input_path.exists():
+            out.print(f"[red]Error:[/red] Input file not found: {input_path}")
+            raise typer.Exit(1)
+    if sum(is_stdin(input_path) for input_path, _ in provided) > 1:
+        out.print("[red]Error:[/red] Only one input can read from stdin ('-')")
+        raise typer.Exit(1)
+
+
+def _source_name(path: Path) -> str:
+    return "stdin" if is_stdin(path) else path.name
+
+
+def _load_products(
+    provided: list[tuple[Path, str]],
+    options: dict,
+    workers: int,
+    merge: str,
+    merge_buffer: int,
+    errors: ImportErrors,
+    stats: Optional[RunStats] = None,
+    cache: bool = False,
+    out: Console = console,
+) -> Iterable[Product]:
+    """Stream the products of every input, merged by id when there are several."""
+    sources = []
+    for input_path, source_type in provided:
+        # With several inputs, samples say which file a rejected record came from
+        source_errors = errors
+        if len(provided) > 1:
+            source_errors = errors.with_source(_source_name(input_path))
+
+        def load(
+            input_path: Path = input_path,
+            source_type: str = source_type,
+            errors: ImportErrors = source_errors,
+        ) -> Iterable[Product]:
+            return iter_products(
+                input_path, source_type, workers=workers, errors=errors, stats=stats, **options
+            )
+
+        label = f" {_source_name(input_path)}" if len(provided) > 1 else ""
+        if cache and is_stdin(input_path):
+            out.print(f"  Cache{label}: skipped (stdin)")
+            source = load()
+        elif cache:
+            try:
+                source, hit = cached_products(
+                    CatalogCache(), input_path, source_type, options, load, source_errors
+                )
+            except UnsafeCacheError as e:
+                out.print(f"  [yellow]![/yellow] Cache{label}: skipped ({e})")
+                source = load()
+            else:
+                out.print(f"  Cache{label}: {'hit' if hit else 'miss'} ({CACHE_DIR_NAME}/)")
+        else:
+            source = load()
+        sources.append(source)
+        if stats is not None and not is_stdin(input_path):
+            stats.bytes_read += input_path.stat().st_size
+
+    if len(sources) == 1:
+        return sources[0]
+    out.print(f"  Merge: {merge} (deduplicated by id)")
+    return merge_products(sources, merge, max_in_memory=merge_buffer)
+
+
+def _silence_stdout() -> None:
+    # Point stdout at devnull so the interpreter's final flush cannot raise
+    # BrokenPipeError again (see the "Note on SIGPIPE" in the signal docs)
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except (OSError, ValueError):  # no real file descriptor, e.g. under CliRunner
+        pass
+
+
+def _report_import_errors(
+    errors: ImportErrors, errors_json: Optional[Path], out: Console = console
+) -> None:
+    """Print rejected-record counts per error type and write the --errors-json report."""
+    if errors_json is not None:
+        errors.write_json(errors_json)
+    if not errors.total:
+        return
+
+    table = Table(title=f"Rejected records: {errors.total}")
+    table.add_column("Error", style="bold")
+    table.add_column("Count", justify="right")
+    for kind, count in errors.counts.most_common():
+        table.add_row(kind, str(count))
+    out.print(table)
+    if errors_json is not None:
+        out.print(f"  Error report: {errors_json}")
+
+
+def _per_second(value: float, seconds: float) -> float:
+    return value / seconds if seconds > 0 else 0.0
+
+
+def _report_stats(stats: RunStats, stats_json: Optional[Path], show: bool) -> None:
+    """Print the per-stage timing table (--stats) and write the --stats-json report."""
+    stats.finish()
+    if stats_json is not None:
+        stats.write_json(stats_json)
+    if not show:
+        return
+
+    mib = 1024 * 1024
+    rows_per_s = _per_second(stats.rows_parsed, stats.import_seconds)
+    mib_per_s = _per_second(stats.bytes_read / mib, stats.import_seconds)
+    products_per_s = _per_second(stats.products, stats.serialize_seconds)
+
+    table = Table(title="Generate stats")
+    table.add_column("Stage", style="bold")
+    table.add_column("Time", justify="right")
+    table.add_column("Detail")
+    for name, seconds, detail in [
+        (
+            "Import",
+            stats.import_seconds,
+            f"{stats.bytes_read / mib:,.1f} MiB read, {rows_per_s:,.0f} rows/s, "
+            f"{mib_per_s:,.1f} MiB/s",
+        ),
+        ("  read + parse", stats.parse_seconds, f"{stats.rows_parsed:,} rows parsed"),
+        ("  validate", stats.validate_seconds, f"{stats.rows_rejected:,} rows rejected"),
+        ("Serialize", stats.serialize_seconds, f"{products_per_s:,.0f} products/s"),
+        ("Write feed", stats.write_seconds, f"{stats.bytes_written / mib:,.1f} MiB written"),
+        ("Pages + manifest", stats.pages_seconds, ""),
+        ("Total", stats.total_seconds, f"{stats.products:,} products"),
+    ]:
+        table.add_row(name, f"{seconds:.3f}s", detail)
+    console.print(table)
+
+
+@app.command(cls=_OrderedInputsCommand)
 def generate(
+    ctx: typer.Context,
     config_path: Optional[Path] = typer.Option(
         None,
         "--config",
@@ -498,14 +721,66 @@ def generate(
     url: Optional[str] = typer.Option(
         None, "--url", "-u", help="Canonical HTTPS URL of the site (overrides config.base_url)"
     ),
-    input_csv: Optional[Path] = typer.Option(
-        None, "--input-csv", "-i", help="Path to products CSV file"
+    input_csv: Optional[list[Path]] = typer.Option(
+        None, "--input-csv", "-i", help="Path to products CSV file (repeatable)"
     ),
-    input_json: Optional[Path] = typer.Option(
-        None, "--input-json", help="Path to products JSON file (array of objects)"
+    input_json: Optional[list[Path]] = typer.Option(
+        None, "--input-json", help="Path to products JSON file (array of objects) (repeatable)"
     ),
-    input_shopify_csv: Optional[Path] = typer.Option(
-        None, "--input-shopify-csv", help="Path to Shopify product export CSV"
+    input_jsonl: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-jsonl",
+        help=(
+            "Path to products JSONL/NDJSON file (one object per line, e.g. a previous feed) "
+            "(repeatable)"
+        ),
+    ),
+    input_shopify_csv: Optional[list[Path]] = typer.Option(
+        None, "--input-shopify-csv", help="Path to Shopify product export CSV (repeatable)"
+    ),
+    input_google_merchant: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-google-merchant",
+        help="Path to Google Merchant Center feed (TSV or RSS/Atom XML) (repeatable)",
+    ),
+    input_parquet: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-parquet",
+        help="Path to products Parquet file (requires the [arrow] extra) (repeatable)",
+    ),
+    input_arrow: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-arrow",
+        help="Path to products Arrow IPC / Feather file (requires the [arrow] extra) (repeatable)",
+    ),
+    input_sqlite: Optional[list[Path]] = typer.Option(
+        None, "--input-sqlite", help="Path to a SQLite database holding the catalog (repeatable)"
+    ),
+    merge: str = typer.Option(
+        "last-wins",
+        "--merge",
+        help=(
+            "How products with the same id from several inputs are merged: last-wins "
+            "(the input given last) or newest (latest updated_at)."
+        ),
+        case_sensitive=False,
+    ),
+    merge_buffer: int = typer.Option(
+        DEFAULT_MAX_IN_MEMORY,
+        "--merge-buffer",
+        min=1,
+        help=(
+            "Distinct products merged in memory before spilling to an on-disk "
+            "external sort (default: 250000)."
+        ),
+    ),
+    query: Optional[str] = typer.Option(
+        None,
+        "--query",
+        help=(
+            "SQL query selecting products from --input-sqlite (overrides config.query; "
+            "default: SELECT * FROM products)."
+        ),
     ),
     templates_dir: Optional[Path] = typer.Option(
         None,
@@ -530,6 +805,115 @@ def generate(
     currency: str = typer.Option(
         "USD", "--currency", help="Default currency for Shopify imports (default: USD)"
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Worker processes for parallel CSV parsing and validation (default: 1)",
+    ),
+    csv_engine: str = typer.Option(
+        "python",
+        "--csv-engine",
+        help=(
+            "CSV parser for --input-csv: python (stdlib csv) or arrow (multithreaded "
+            "pyarrow reader, requires the [arrow] extra)."
+        ),
+        case_sensitive=False,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=(
+            "Constant-memory mode for very large catalogs: spill products.md groups to "
+            "disk and report peak RSS at the end of the run."
+        ),
+    ),
+    precompress: Optional[str] = typer.Option(
+        None,
+        "--precompress",
+        help=(
+            "Also write compressed siblings (.gz/.br/.zst) of the feed, pages and manifest, "
+            "e.g. gzip,br,zstd (br needs the [brotli] extra, zstd the [zstd] extra)."
+        ),
+    ),
+    shard_size: Optional[str] = typer.Option(
+        None,
+        "--shard-size",
+        help=(
+            "Split the feed into products-NNNNN.jsonl shards of at most this many rows "
+            "(e.g. 50000) or bytes (e.g. 64MB), listed in llm/feed/feed-index.json."
+        ),
+    ),
+    delta: bool = typer.Option(
+        False,
+        "--delta",
+        help=(
+            "Write llm/feed/products-delta.jsonl with the products added, changed or "
+            "removed since the previous --delta build."
+        ),
+    ),
+    snapshot: Optional[Path] = typer.Option(
+        None,
+        "--snapshot",
+        help=(
+            "Where --delta remembers the previous build, outside the output directory "
+            "(default: ~/.cache/llmindex/snapshots/, keyed by output directory)."
+        ),
+    ),
+    delta_buckets: Optional[str] = typer.Option(
+        None,
+        "--delta-buckets",
+        help=(
+            "Also keep each build's delta in hourly or daily bucket files listed in "
+            "llm/feed/delta-index.json, for static hosts (implies --delta)."
+        ),
+    ),
+    delta_retention: str = typer.Option(
+        DEFAULT_RETENTION,
+        "--delta-retention",
+        help="Drop delta buckets older than this, e.g. 48h, 7d or 2w (default: 7d).",
+    ),
+    trusted_input: bool = typer.Option(
+        False,
+        "--trusted-input",
+        help=(
+            "Skip per-product validation for input that is already valid, e.g. a "
+            "products.jsonl written by a previous run."
+        ),
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help=(
+            "Reuse the parsed catalog from .llmindex-cache/ in the working directory "
+            "when the input file and import options are unchanged."
+        ),
+    ),
+    max_errors: Optional[int] = typer.Option(
+        None,
+        "--max-errors",
+        min=0,
+        help="Abort (exit 1) once more than this many input records have been rejected.",
+    ),
+    error_samples: int = typer.Option(
+        DEFAULT_MAX_SAMPLES,
+        "--error-samples",
+        min=0,
+        help="Rejected records printed (and kept in the report) per error type (default: 5).",
+    ),
+    errors_json: Optional[Path] = typer.Option(
+        None,
+        "--errors-json",
+        help="Write a JSON report of rejected records (counts and samples per error type).",
+    ),
+    show_stats: bool = typer.Option(
+        False,
+        "--stats",
+        help="Print rows/s, bytes/s and per-stage timings (parse, validate, serialize, write).",
+    ),
+    stats_json: Optional[Path] = typer.Option(
+        None, "--stats-json", help="Write the throughput counters and stage timings as JSON."
+    ),
 ) -> None:
     """Generate llmindex artifacts (manifest, /llm pages, optional product feed).
 
@@ -562,16 +946,48 @@ def generate(
         )
         raise typer.Exit(1)
 
-    # Allow zero or one input source
-    inputs = [input_csv, input_json, input_shopify_csv]
-    provided = [x for x in inputs if x is not None]
-    if len(provided) > 1:
-        console.print("[red]Error:[/red] Provide only one input source")
-        raise typer.Exit(1)
+    csv_engine = _choice(csv_engine, CSV_ENGINES, "--csv-engine", console)
+    merge = _choice(merge, MERGE_POLICIES, "--merge", console)
+    shards = None
+    if shard_size is not None:
+        try:
+            shards = ShardSize.parse(shard_size)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] --shard-size: {e}")
+            raise typer.Exit(1) from e
+    codecs: tuple[str, ...] = ()
+    if precompress is not None:
+        try:
+            codecs = parse_codecs(precompress)
+            check_codecs(codecs)
+        except (ModuleNotFoundError, ValueError) as e:
+            console.print(f"[red]Error:[/red] --precompress: {e}")
+            raise typer.Exit(1) from e
 
-    input_path = provided[0] if provided else None
-    if input_path is not None and not input_path.exists():
-        console.print(f"[red]Error:[/red] Input file not found: {input_path}")
+    retention = None
+    if delta_buckets is not None:
+        delta_buckets = _choice(delta_buckets, tuple(GRANULARITIES), "--delta-buckets", console)
+        try:
+            retention = parse_retention(delta_retention)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] --delta-retention: {e}")
+            raise typer.Exit(1) from e
+
+    # Zero or more input sources, merged in command-line order
+    inputs = {
+        "csv": input_csv,
+        "json": input_json,
+        "jsonl": input_jsonl,
+        "shopify_csv": input_shopify_csv,
+        "google_merchant": input_google_merchant,
+        "parquet": input_parquet,
+        "arrow": input_arrow,
+        "sqlite": input_sqlite,
+    }
+    provided = _ordered_inputs(ctx.meta.get(_RAW_ARGS), inputs)
+    _check_inputs(provided, console)
+    if query is not None and not input_sqlite:
+        console.print("[red]Error:[/red] --query requires --input-sqlite")
         raise typer.Exit(1)
 
     if not url_value.startswith("https://"):
@@ -588,59 +1004,335 @@ def generate(
     )
 
     console.print(f"[bold]Generating llmindex artifacts for {site_value}[/bold]")
-    console.print(f"  Source: {input_path or '(none)'}")
+    console.print(f"  Source: {', '.join(str(p) for p, _ in provided) or '(none)'}")
     console.print(f"  Output: {output_dir}")
 
-    # Import products from the appropriate source
-    if input_path is None:
-        products = []
+    # Stream products from the appropriate source(s)
+    import_errors = ImportErrors(max_samples=error_samples, max_errors=max_errors)
+    stats = RunStats() if show_stats or stats_json is not None else None
+    if not provided:
+        products = iter(())
         console.print(
             "  [yellow]![/yellow] No product input provided. Generating manifest + pages only."
         )
-    elif input_csv is not None:
-        products = import_csv(input_csv)
-    elif input_json is not None:
-        products = import_json(input_json)
-    elif input_shopify_csv is not None:
-        products = import_shopify_csv(input_shopify_csv, base_url=url_value, currency=currency)
     else:
-        products = []
-
-    console.print(f"  Imported: {len(products)} products")
-
-    if input_path is not None and not products:
-        console.print("[yellow]Warning:[/yellow] No products imported. Generating without feed.")
-
-    # Generate manifest
-    manifest = generate_manifest(site_config, has_feed=len(products) > 0)
-    manifest_path = str(output_dir / ".well-known" / "llmindex.json")
-    write_manifest(manifest, manifest_path)
-    console.print(f"  [green]✓[/green] {manifest_path}")
+        options = {
+            "base_url": url_value,
+            "currency": currency,
+            "columns": yaml_config.columns if yaml_config else None,
+            "trusted": trusted_input,
+            "csv_engine": csv_engine,
+            "query": query or (yaml_config.query if yaml_config else None),
+        }
+        products = _load_products(
+            provided,
+            options,
+            workers=workers,
+            merge=merge,
+            merge_buffer=merge_buffer,
+            errors=import_errors,
+            stats=stats,
+            cache=cache,
+        )
 
-    # Generate pages
+    # Generate feed, pages and manifest in a single pass over the products
     try:
-        page_paths = write_pages(
+        result = write_catalog(
             products,
             site_config,
             str(output_dir),
             templates_dir=templates_dir,
+            stream=stream,
+            stats=stats,
+            shard_size=shards,
+            precompress=codecs,
+            delta=delta,
+            delta_buckets=delta_buckets,
+            delta_retention=retention,
+            delta_snapshot=str(snapshot) if snapshot is not None else None,
         )
-    except ModuleNotFoundError as e:
+    except (ModuleNotFoundError, ValueError) as e:
+        _report_import_errors(import_errors, errors_json)
+        if stats is not None:
+            _report_stats(stats, stats_json, show=False)
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
-    for p in page_paths:
-        console.print(f"  [green]✓[/green] {p}")
 
-    # Generate feed
-    if products:
-        feed_path = write_feed(products, str(output_dir))
-        console.print(f"  [green]✓[/green] {feed_path}")
+    console.print(f"  Imported: {result.product_count} products")
+    _report_import_errors(import_errors, errors_json)
+    if stats is not None:
+        _report_stats(stats, stats_json, show=show_stats)
+
+    if provided and not result.product_count:
+        console.print("[yellow]Warning:[/yellow] No products imported. Generating without feed.")
+
+    if result.delta is not None and (result.delta.changed or result.delta.removed):
+        console.print(
+            f"  Delta: {result.delta.changed} added/changed, {result.delta.removed} removed "
+            f"since {result.delta.since}"
+        )
+
+    for p in result.written:
+        console.print(f"  [green]✓[/green] {p}")
 
     console.print(
-        f"\n[bold green]Done![/bold green] Generated "
-        f"{4 + (1 if products else 0) + 1} files in {output_dir}/"
+        f"\n[bold green]Done![/bold green] Generated {len(result.written)} files in {output_dir}/"
     )
 
+    if stream:
+        peak = peak_rss_bytes()
+        if peak is not None:
+            console.print(f"  Peak RSS: {peak / (1024 * 1024):.1f} MB")
+
+
+@app.command(cls=_OrderedInputsCommand)
+def feed(
+    ctx: typer.Context,
+    config_path: Optional[Path] = typer.Option(
+        None,
+        "--config",
+        help="Path to llmindex.yaml config (uses base_url, columns and query).",
+    ),
+    input_csv: Optional[list[Path]] = typer.Option(
+        None, "--input-csv", "-i", help="Path to products CSV file, or - for stdin (repeatable)"
+    ),
+    input_json: Optional[list[Path]] = typer.Option(
+        None, "--input-json", help="Path to products JSON file, or - for stdin (repeatable)"
+    ),
+    input_jsonl: Optional[list[Path]] = typer.Option(
+        None, "--input-jsonl", help="Path to products JSONL file, or - for stdin (repeatable)"
+    ),
+    input_shopify_csv: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-shopify-csv",
+        help="Path to Shopify product export CSV, or - for stdin (repeatable)",
+    ),
+    input_google_merchant: Optional[list[Path]] = typer.Option(
+        None,
+        "--input-google-merchant",
+        help="Path to Google Merchant Center feed (TSV or XML), or - for stdin (repeatable)",
+    ),
+    input_parquet: Optional[list[Path]] = typer.Option(
+        None, "--input-parquet", help="Path to products Parquet file (repeatable)"
+    ),
+    input_arrow: Optional[list[Path]] = typer.Option(
+        None, "--input-arrow", help="Path to products Arrow IPC / Feather file (repeatable)"
+    ),
+    input_sqlite: Optional[list[Path]] = typer.Option(
+        None, "--input-sqlite", help="Path to a SQLite database holding the catalog (repeatable)"
+    ),
+    merge: str = typer.Option(
+        "last-wins",
+        "--merge",
+        help="How products with the same id from several inputs are merged: last-wins or newest.",
+        case_sensitive=False,
+    ),
+    merge_buffer: int = typer.Option(
+        DEFAULT_MAX_IN_MEMORY,
+        "--merge-buffer",
+        min=1,
+        help="Distinct products merged in memory before spilling to disk (default: 250000).",
+    ),
+    query: Optional[str] = typer.Option(
+        None, "--query", help="SQL query selecting products from --input-sqlite."
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", "-u", help="Store URL for Shopify product URLs (overrides config.base_url)"
+    ),
+    currency: str = typer.Option(
+        "USD", "--currency", help="Default currency for Shopify imports (default: USD)"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Worker processes for parallel CSV parsing (default: 1)"
+    ),
+    csv_engine: str = typer.Option(
+        "python",
+        "--csv-engine",
+        help="CSV parser for --input-csv: python or arrow (requires the [arrow] extra).",
+        case_sensitive=False,
+    ),
+    trusted_input: bool = typer.Option(
+        False, "--trusted-input", help="Skip per-product validation for already-valid input."
+    ),
+    max_errors: Optional[int] = typer.Option(
+        None,
+        "--max-errors",
+        min=0,
+        help="Abort (exit 1) once more than this many input records have been rejected.",
+    ),
+    error_samples: int = typer.Option(
+        DEFAULT_MAX_SAMPLES,
+        "--error-samples",
+        min=0,
+        help="Rejected records printed (and kept in the report) per error type (default: 5).",
+    ),
+    errors_json: Optional[Path] = typer.Option(
+        None, "--errors-json", help="Write a JSON report of rejected records."
+    ),
+) -> None:
+    """Write the products.jsonl feed to stdout as products are imported.
+
+    Messages and warnings go to stderr, and `-` reads an input from stdin, so
+    the command can sit in a pipeline:
+
+        zcat products.csv.gz | llmindex feed --input-csv - | gzip > products.jsonl.gz
+    """
+    yaml_config = None
+    if config_path is not None:
+        try:
+            yaml_config = load_yaml_config(config_path)
+        except ConfigError as e:
+            err_console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+
+    csv_engine = _choice(csv_engine, CSV_ENGINES, "--csv-engine", err_console)
+    merge = _choice(merge, MERGE_POLICIES, "--merge", err_console)
+    inputs = {
+        "csv": input_csv,
+        "json": input_json,
+        "jsonl": input_jsonl,
+        "shopify_csv": input_shopify_csv,
+        "google_merchant": input_google_merchant,
+        "parquet": input_parquet,
+        "arrow": input_arrow,
+        "sqlite": input_sqlite,
+    }
+    provided = _ordered_inputs(ctx.meta.get(_RAW_ARGS), inputs)
+    if not provided:
+        err_console.print("[red]Error:[/red] Provide at least one --input-* source")
+        raise typer.Exit(1)
+    _check_inputs(provided, err_console)
+    if query is not None and not input_sqlite:
+        err_console.print("[red]Error:[/red] --query requires --input-sqlite")
+        raise typer.Exit(1)
+
+    options = {
+        "base_url": url or (yaml_config.base_url if yaml_config else None) or "https://example.com",
+        "currency": currency,
+        "columns": yaml_config.columns if yaml_config else None,
+        "trusted": trusted_input,
+        "csv_engine": csv_engine,
+        "query": query or (yaml_config.query if yaml_config else None),
+    }
+    import_errors = ImportErrors(max_samples=error_samples, max_errors=max_errors)
+    products = _load_products(
+        provided,
+        options,
+        workers=workers,
+        merge=merge,
+        merge_buffer=merge_buffer,
+        errors=import_errors,
+        out=err_console,
+    )
+    try:
+        count = stream_feed(products, click.get_binary_stream("stdout"))
+    except (ModuleNotFoundError, ValueError) as e:
+        _report_import_errors(import_errors, errors_json, err_console)
+        err_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other Unix tools
+        _silence_stdout()
+        raise typer.Exit(1) from None
+
+    _report_import_errors(import_errors, errors_json, err_console)
+    err_console.print(f"Wrote {count} products to stdout")
+
+
+@app.command("import-site")
+def import_site(
+    sitemap: str = typer.Option(
+        ..., "--sitemap", help="URL of the site's sitemap.xml (or sitemap index)."
+    ),
+    output: Path = typer.Option(
+        Path("-"), "--output", "-o", help="Products JSONL file to write (default: - for stdout)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", min=1, help="Pages fetched at once (default: 8)."
+    ),
+    per_host: int = typer.Option(
+        DEFAULT_PER_HOST, "--per-host", min=1, help="Pages fetched at once per host (default: 4)."
+    ),
+    delay: float = typer.Option(
+        0.0, "--delay", min=0.0, help="Seconds between requests to the same host (default: 0)."
+    ),
+    timeout: float = typer.Option(
+        DEFAULT_TIMEOUT, "--timeout", min=0.1, help="Per-request timeout in seconds (default: 30)."
+    ),
+    limit: Optional[int] = typer.Option(
+        None, "--limit", min=1, help="Crawl at most this many pages of the sitemap."
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Keep responses on disk and re-crawl with conditional requests.",
+    ),
+    cache_dir: Path = typer.Option(
+        Path(CACHE_DIR_NAME) / "http", "--cache-dir", help="Response cache directory."
+    ),
+    max_errors: Optional[int] = typer.Option(
+        None,
+        "--max-errors",
+        min=0,
+        help="Abort (exit 1) once more than this many pages or products have been rejected.",
+    ),
+    error_samples: int = typer.Option(
+        DEFAULT_MAX_SAMPLES,
+        "--error-samples",
+        min=0,
+        help="Rejected records printed (and kept in the report) per error type (default: 5).",
+    ),
+    errors_json: Optional[Path] = typer.Option(
+        None, "--errors-json", help="Write a JSON report of rejected pages and products."
+    ),
+) -> None:
+    """Crawl a site's sitemap and import the schema.org Product JSON-LD of its pages.
+
+    Writes products.jsonl lines (to stdout by default), ready for
+    `llmindex generate --input-jsonl`. Requires the [crawl] extra:
+    pip install 'llmindex[crawl]'
+    """
+    if urlparse(sitemap).scheme not in ("http", "https"):
+        err_console.print(f"[red]Error:[/red] --sitemap must be an http(s) URL, got: {sitemap}")
+        raise typer.Exit(1)
+
+    counts = CrawlCounts()
+    import_errors = ImportErrors(max_samples=error_samples, max_errors=max_errors)
+    products = iter_site(
+        sitemap,
+        concurrency=concurrency,
+        per_host=per_host,
+        delay=delay,
+        timeout=timeout,
+        cache=ResponseCache(cache_dir) if cache else None,
+        limit=limit,
+        counts=counts,
+        errors=import_errors,
+    )
+    try:
+        if is_stdin(output):
+            count = stream_feed(products, click.get_binary_stream("stdout"))
+        else:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with output.open("wb") as f:
+                count = stream_feed(products, f)
+    except (ModuleNotFoundError, ValueError) as e:
+        _report_import_errors(import_errors, errors_json, err_console)
+        err_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except BrokenPipeError:
+        _silence_stdout()
+        raise typer.Exit(1) from None
+
+    _report_import_errors(import_errors, errors_json, err_console)
+    err_console.print(
+        f"Crawled {counts.pages} pages from {counts.sitemaps} sitemaps: "
+        f"{counts.fetched} fetched, {counts.not_modified} not modified, "
+        f"{counts.cached} from cache, {counts.failed} failed, "
+        f"{counts.no_products} without products"
+    )
+    err_console.print(f"Wrote {count} products to {'stdout' if is_stdin(output) else output}")
+
 
 @app.command()
 def watch(
@@ -660,6 +1352,11 @@ def watch(
     currency: str = typer.Option(
         "USD", "--currency", help="Default currency for Shopify imports (default: USD)"
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse the parsed catalog across rebuilds while the product source is unchanged.",
+    ),
 ) -> None:
     """Watch source files and rebuild artifacts on change.
 
@@ -679,7 +1376,9 @@ def watch(
         raise typer.Exit(1) from e
 
     try:
-        run_watch(config_path, output_dir, templates_dir=templates_dir, currency=currency)
+        run_watch(
+            config_path, output_dir, templates_dir=templates_dir, currency=currency, cache=cache
+        )
     except ModuleNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
@@ -697,7 +1396,10 @@ def version() -> None:
 def validate(
     manifest: Path = typer.Argument(..., help="Path to llmindex.json manifest file"),
     feed: Optional[Path] = typer.Option(
-        None, "--feed", "-f", help="Path to products.jsonl feed file (auto-detected if omitted)"
+        None,
+        "--feed",
+        "-f",
+        help="Path to products.jsonl or feed-index.json (auto-detected if omitted)",
     ),
     check_urls: bool = typer.Option(
         False,
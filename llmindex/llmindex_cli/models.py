@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+_NAN = float("nan")
+
+_AVAILABILITY_ALIASES = {
+    "in stock": "in_stock",
+    "out of stock": "out_of_stock",
+    "pre-order": "preorder",
+    "pre order": "preorder",
+}
+
 
 class Product(BaseModel):
     """A single product entry for the products.jsonl feed."""
@@ -26,13 +37,8 @@ class Product(BaseModel):
     @field_validator("availability", mode="before")
     @classmethod
     def normalize_availability(cls, v: str) -> str:
-        mapping = {
-            "in stock": "in_stock",
-            "out of stock": "out_of_stock",
-            "pre-order": "preorder",
-            "pre order": "preorder",
-        }
-        return mapping.get(v.lower().strip(), v.strip())
+        v = v.strip()
+        return _AVAILABILITY_ALIASES.get(v.lower(), v)
 
 
 class PriceRange(BaseModel):
@@ -45,6 +51,167 @@ class PriceRange(BaseModel):
 Product.model_rebuild()
 
 
+class _EncodedColumn:
+    """Dictionary-encoded string column: a code per row into a list of distinct values."""
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: list[Optional[str]] = [None]
+        self._index: dict[Optional[str], int] = {None: 0}
+
+    def append(self, value: Optional[str]) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        return self.values[self.codes[i]]
+
+    def __getstate__(self) -> tuple[array, list[Optional[str]]]:
+        return self.codes, self.values
+
+    def __setstate__(self, state: tuple[array, list[Optional[str]]]) -> None:
+        self.codes, self.values = state
+        self._index = {value: code for code, value in enumerate(self.values)}
+
+
+class ProductTable:
+    """Columnar in-memory product store, an alternative to list[Product].
+
+    Each Product field is stored as a column: `price` in an array of doubles
+    (NaN for None), low-cardinality strings (currency, availability, brand,
+    category, updated_at) dictionary-encoded, and the per-product strings in
+    plain lists. Iterating yields ProductRow views with Product's attributes,
+    so a table can be passed wherever an iterable of products is accepted.
+    """
+
+    def __init__(self, products: Iterable[Product] = ()) -> None:
+        self._id: list[str] = []
+        self._title: list[str] = []
+        self._url: list[str] = []
+        self._image_url: list[Optional[str]] = []
+        self._price = array("d")
+        self._currency = _EncodedColumn()
+        self._availability = _EncodedColumn()
+        self._brand = _EncodedColumn()
+        self._category = _EncodedColumn()
+        self._updated_at = _EncodedColumn()
+        self._price_range: dict[int, PriceRange] = {}  # sparse: few products have one
+        self.extend(products)
+
+    def append(self, p: Product | ProductRow) -> None:
+        if p.price_range is not None:
+            self._price_range[len(self._id)] = p.price_range
+        self._id.append(p.id)
+        self._title.append(p.title)
+        self._url.append(p.url)
+        self._image_url.append(p.image_url)
+        self._price.append(_NAN if p.price is None else p.price)
+        self._currency.append(p.currency)
+        self._availability.append(p.availability)
+        self._brand.append(p.brand)
+        self._category.append(p.category)
+        self._updated_at.append(p.updated_at)
+
+    def extend(self, products: Iterable[Product | ProductRow]) -> None:
+        for p in products:
+            self.append(p)
+
+    def __len__(self) -> int:
+        return len(self._id)
+
+    def __getitem__(self, i: int) -> ProductRow:
+        n = len(self._id)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("ProductTable index out of range")
+        return ProductRow(self, i)
+
+    def __iter__(self) -> Iterator[ProductRow]:
+        for i in range(len(self._id)):
+            yield ProductRow(self, i)
+
+
+class ProductRow:
+    """Read-only view of one ProductTable row, exposing the Product attributes."""
+
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: ProductTable, i: int) -> None:
+        self._table = table
+        self._i = i
+
+    @property
+    def id(self) -> str:
+        return self._table._id[self._i]
+
+    @property
+    def title(self) -> str:
+        return self._table._title[self._i]
+
+    @property
+    def url(self) -> str:
+        return self._table._url[self._i]
+
+    @property
+    def image_url(self) -> Optional[str]:
+        return self._table._image_url[self._i]
+
+    @property
+    def price(self) -> Optional[float]:
+        value = self._table._price[self._i]
+        return None if value != value else value  # NaN marks a missing price
+
+    @property
+    def currency(self) -> Optional[str]:
+        return self._table._currency[self._i]
+
+    @property
+    def price_range(self) -> Optional[PriceRange]:
+        return self._table._price_range.get(self._i)
+
+    @property
+    def availability(self) -> str:
+        return self._table._availability[self._i]
+
+    @property
+    def brand(self) -> Optional[str]:
+        return self._table._brand[self._i]
+
+    @property
+    def category(self) -> Optional[str]:
+        return self._table._category[self._i]
+
+    @property
+    def updated_at(self) -> str:
+        return self._table._updated_at[self._i]
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the row as a dict, like Product.model_dump()."""
+        data = {name: getattr(self, name) for name in Product.model_fields}
+        if data["price_range"] is not None:
+            data["price_range"] = data["price_range"].model_dump()
+        return data
+
+    def to_product(self) -> Product:
+        return Product(**self.model_dump())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Product, ProductRow)):
+            return self.model_dump() == other.model_dump()
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ProductRow(id={self.id!r}, title={self.title!r})"
+
+
 class Entity(BaseModel):
     name: str = Field(min_length=1)
     canonical_url: str  # HTTPS URL
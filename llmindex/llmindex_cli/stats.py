@@ -0,0 +1,81 @@
+"""Throughput counters and per-stage timings of a `generate` run.
+
+A RunStats is handed to the importers (via validate_records) and to
+write_catalog, which add to it as products flow through:
+
+- import: time spent producing products (reading, parsing and validating the
+  input, and merging several inputs), with the input bytes and rows parsed;
+- validate: the part of import spent in Product validation;
+- serialize / write: turning products into feed lines and writing them;
+- pages: building the products page and writing the pages and manifest.
+
+Collection is opt-in: with no RunStats nothing is timed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class RunStats:
+    """Counters and timings (seconds) of one run; see the module docstring."""
+
+    bytes_read: int = 0
+    rows_parsed: int = 0
+    rows_rejected: int = 0
+    products: int = 0
+    bytes_written: int = 0
+    import_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    write_seconds: float = 0.0
+    pages_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._started = time.perf_counter()
+
+    def finish(self) -> None:
+        """Record the wall time since the RunStats was created."""
+        self.total_seconds = time.perf_counter() - self._started
+
+    @property
+    def parse_seconds(self) -> float:
+        """Import time not spent validating: reading, parsing and merging."""
+        return max(self.import_seconds - self.validate_seconds, 0.0)
+
+    def stages(self) -> dict[str, float]:
+        """Seconds per stage, in pipeline order."""
+        return {
+            "import": self.import_seconds,
+            "parse": self.parse_seconds,
+            "validate": self.validate_seconds,
+            "serialize": self.serialize_seconds,
+            "write": self.write_seconds,
+            "pages": self.pages_seconds,
+        }
+
+    def report(self) -> dict[str, Any]:
+        """JSON-serialisable summary, including rows/s and bytes/s of the import."""
+        seconds = self.import_seconds
+        return {
+            "total_seconds": round(self.total_seconds, 6),
+            "bytes_read": self.bytes_read,
+            "rows_parsed": self.rows_parsed,
+            "rows_rejected": self.rows_rejected,
+            "products": self.products,
+            "bytes_written": self.bytes_written,
+            "rows_per_second": round(self.rows_parsed / seconds, 1) if seconds else None,
+            "bytes_per_second": round(self.bytes_read / seconds, 1) if seconds else None,
+            "stages": {name: round(value, 6) for name, value in self.stages().items()},
+        }
+
+    def write_json(self, path: Path) -> None:
+        """Write report() to `path` as indented JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n")
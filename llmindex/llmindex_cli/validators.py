@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit
 
 import jsonschema
 
+from llmindex.llmindex_cli.generators.feed import FEED_INDEX_NAME, FEED_NAME, feed_record
+from llmindex.llmindex_cli.models import Product, ProductTable
+
 # Schema path relative to project root
 _SCHEMA_DIR = Path(__file__).resolve().parent.parent.parent / "spec" / "schemas"
 
@@ -202,6 +207,19 @@ def validate_manifest(manifest_path: str | Path) -> ValidationResult:
     return result
 
 
+def _product_line_validator(result: ValidationResult) -> Optional[jsonschema.Draft7Validator]:
+    """Load the product_line schema from definitions (records an error if missing)."""
+    schema_path = _SCHEMA_DIR / "llmindex-0.1.schema.json"
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    product_schema = schema.get("definitions", {}).get("product_line")
+
+    if not product_schema:
+        result.add_error("product_line schema not found in definitions")
+        return None
+
+    return jsonschema.Draft7Validator(product_schema)
+
+
 def validate_feed(feed_path: str | Path) -> ValidationResult:
     """Validate a products.jsonl feed file line by line."""
     result = ValidationResult(valid=True)
@@ -211,17 +229,10 @@ def validate_feed(feed_path: str | Path) -> ValidationResult:
         result.add_error(f"File not found: {path}")
         return result
 
-    # Load product_line schema from definitions
-    schema_path = _SCHEMA_DIR / "llmindex-0.1.schema.json"
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    product_schema = schema.get("definitions", {}).get("product_line")
-
-    if not product_schema:
-        result.add_error("product_line schema not found in definitions")
+    validator = _product_line_validator(result)
+    if validator is None:
         return result
 
-    validator = jsonschema.Draft7Validator(product_schema)
-
     lines = path.read_text(encoding="utf-8").strip().split("\n")
     if not lines or (len(lines) == 1 and not lines[0].strip()):
         result.add_error("Feed file is empty")
@@ -250,6 +261,82 @@ def validate_feed(feed_path: str | Path) -> ValidationResult:
     return result
 
 
+def validate_feed_index(index_path: str | Path) -> ValidationResult:
+    """Validate a sharded feed: its feed-index.json and every shard it lists.
+
+    Shards are looked up next to the index by file name; their row count,
+    byte size and SHA-256 must match the index.
+    """
+    result = ValidationResult(valid=True)
+    path = Path(index_path)
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        result.add_error(f"File not found: {path}")
+        return result
+    except json.JSONDecodeError as e:
+        result.add_error(f"{path.name}: Invalid JSON — {e}")
+        return result
+
+    shards = index.get("shards") if isinstance(index, dict) else None
+    if not isinstance(shards, list) or not shards:
+        result.add_error(f"{path.name}: 'shards' must be a non-empty array")
+        return result
+
+    total_rows = 0
+    for i, shard in enumerate(shards, 1):
+        if not isinstance(shard, dict) or not isinstance(shard.get("url"), str):
+            result.add_error(f"{path.name}: shards[{i}] has no url")
+            continue
+        shard_path = path.parent / Path(urlsplit(shard["url"]).path).name
+        if not shard_path.exists():
+            result.add_error(f"{path.name}: shard not found: {shard_path.name}")
+            continue
+        data = shard_path.read_bytes()
+        rows = data.count(b"\n")
+        total_rows += rows
+        expected = {"rows": rows, "bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+        for key, actual in expected.items():
+            if shard.get(key) != actual:
+                result.add_error(
+                    f"{shard_path.name}: {key} is {actual!r}, index says {shard.get(key)!r}"
+                )
+        shard_result = validate_feed(shard_path)
+        result.errors.extend(f"{shard_path.name}: {e}" for e in shard_result.errors)
+        result.valid = result.valid and shard_result.valid
+
+    if index.get("total_rows") != total_rows:
+        result.add_error(
+            f"{path.name}: total_rows is {index.get('total_rows')!r}, shards hold {total_rows}"
+        )
+    if result.valid:
+        result.warnings.append(f"Validated {total_rows} product lines in {len(shards)} shards")
+    return result
+
+
+def validate_products(products: Iterable[Product] | ProductTable) -> ValidationResult:
+    """Validate in-memory products against the product_line schema.
+
+    Checks the same objects the feed generator would write, so a list of
+    Products or a ProductTable can be verified before anything hits disk.
+    """
+    result = ValidationResult(valid=True)
+    validator = _product_line_validator(result)
+    if validator is None:
+        return result
+
+    count = 0
+    for count, product in enumerate(products, 1):
+        for error in validator.iter_errors(feed_record(product)):
+            field_path = ".".join(str(p) for p in error.absolute_path) or "(root)"
+            result.add_error(f"Product {count} ({product.id}): {field_path} — {error.message}")
+
+    if result.valid:
+        result.warnings.append(f"Validated {count} products")
+
+    return result
+
+
 def validate_all(
     manifest_path: str | Path,
     feed_path: Optional[str | Path] = None,
@@ -265,23 +352,23 @@ def validate_all(
         combined.valid = False
 
     # Validate feed if provided or auto-detected
+    if not feed_path:
+        # Try to auto-detect the feed relative to the manifest, in the sibling
+        # structure ../llm/feed/ (a sharded feed's index first)
+        feed_dir = Path(manifest_path).resolve().parent.parent / "llm" / "feed"
+        for name in (FEED_INDEX_NAME, FEED_NAME):
+            if (feed_dir / name).exists():
+                feed_path = feed_dir / name
+                combined.warnings.append(f"Auto-detected feed: {feed_path}")
+                break
     if feed_path:
-        feed_result = validate_feed(feed_path)
+        if Path(feed_path).suffix == ".json":
+            feed_result = validate_feed_index(feed_path)
+        else:
+            feed_result = validate_feed(feed_path)
         combined.errors.extend(feed_result.errors)
         combined.warnings.extend(feed_result.warnings)
         if not feed_result.valid:
             combined.valid = False
-    else:
-        # Try to auto-detect feed relative to manifest
-        manifest_dir = Path(manifest_path).resolve().parent
-        # Look for feed in sibling structure: ../llm/feed/products.jsonl
-        possible_feed = manifest_dir.parent / "llm" / "feed" / "products.jsonl"
-        if possible_feed.exists():
-            combined.warnings.append(f"Auto-detected feed: {possible_feed}")
-            feed_result = validate_feed(possible_feed)
-            combined.errors.extend(feed_result.errors)
-            combined.warnings.extend(feed_result.warnings)
-            if not feed_result.valid:
-                combined.valid = False
 
     return combined
@@ -0,0 +1,157 @@
+"""Tests for the parsed-catalog cache."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+import yaml
+
+from llmindex.importers.csv_importer import import_csv, iter_csv
+from llmindex.importers.errors import ImportAbortedError, ImportErrors
+from llmindex.llmindex_cli import cache as cache_module
+from llmindex.llmindex_cli.cache import CatalogCache, UnsafeCacheError, cached_products
+from llmindex.llmindex_cli.commands import watch as watch_module
+from llmindex.llmindex_cli.commands.watch import build_artifacts
+from llmindex.llmindex_cli.models import ProductTable
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "sample_data" / "sample.csv"
+OPTIONS = {"currency": "USD"}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CatalogCache:
+    return CatalogCache(tmp_path / "cache")
+
+
+class TestCatalogCache:
+    def test_miss_then_hit(self, cache: CatalogCache):
+        products, hit = cached_products(
+            cache, SAMPLE_CSV, "csv", OPTIONS, lambda: iter_csv(SAMPLE_CSV), ImportErrors()
+        )
+        assert not hit
+        assert list(products) == import_csv(SAMPLE_CSV)
+
+        def fail():
+            raise AssertionError("importer called on a cache hit")
+
+        products, hit = cached_products(cache, SAMPLE_CSV, "csv", OPTIONS, fail, ImportErrors())
+        assert hit
+        assert list(products) == import_csv(SAMPLE_CSV)
+
+    def test_entry_is_written_in_blocks(self, cache: CatalogCache, monkeypatch):
+        monkeypatch.setattr(cache_module, "BLOCK_ROWS", 3)
+        products = import_csv(SAMPLE_CSV)
+        cache.put("k", products)
+        catalog = cache.get("k")
+        assert catalog is not None
+        assert list(catalog) == products
+
+    def test_hit_replays_rejected_records(self, cache: CatalogCache, tmp_path: Path):
+        source = tmp_path / "products.csv"
+        bad = "".join(f"P{i},,https://example.com/{i},1,USD,in_stock\n" for i in range(2, 40))
+        source.write_text(
+            "id,title,url,price,currency,availability\n"
+            "P1,Good,https://example.com/1,1,USD,in_stock\n" + bad
+        )
+        first = ImportErrors()
+        products, hit = cached_products(
+            cache, source, "csv", OPTIONS, lambda: iter_csv(source, errors=first), first
+        )
+        assert [p.id for p in products] == ["P1"]
+        assert first.mirror is None
+        # The entry keeps counts and samples, not every rejected record
+        catalog = cache.get(cache.key(source, "csv", OPTIONS))
+        assert catalog is not None
+        [kind] = catalog.rejected["kinds"].values()
+        assert (kind["count"], len(kind["samples"])) == (38, 5)
+
+        second = ImportErrors(max_errors=0)
+        products, hit = cached_products(
+            cache, source, "csv", OPTIONS, lambda: iter_csv(source, errors=second), second
+        )
+        assert hit
+        with pytest.raises(ImportAbortedError):
+            list(products)
+        assert second.report()["kinds"] == first.report()["kinds"]
+
+    def test_refuses_shared_directory(self, cache: CatalogCache):
+        cache.root.mkdir(mode=0o777)
+        cache.root.chmod(0o777)
+        with pytest.raises(UnsafeCacheError):
+            cache.get("abc")
+
+    def test_key_covers_content_type_and_options(self, cache: CatalogCache, tmp_path: Path):
+        source = tmp_path / "products.csv"
+        source.write_bytes(SAMPLE_CSV.read_bytes())
+        key = cache.key(source, "csv", OPTIONS)
+        assert cache.key(source, "csv", dict(OPTIONS)) == key
+        assert cache.key(source, "shopify_csv", OPTIONS) != key
+        assert cache.key(source, "csv", {"currency": "EUR"}) != key
+        source.write_bytes(SAMPLE_CSV.read_bytes() + b"\n")
+        assert cache.key(source, "csv", OPTIONS) != key
+
+    def test_key_covers_sqlite_wal(self, cache: CatalogCache, tmp_path: Path):
+        db = tmp_path / "products.db"
+        writer = sqlite3.connect(db)
+        try:
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+            with writer:
+                writer.execute("CREATE TABLE products (id, title, url)")
+            key = cache.key(db, "sqlite", OPTIONS)
+            # A commit that only reaches the -wal file still changes the key
+            with writer:
+                writer.execute("INSERT INTO products VALUES ('P1', 'T', 'https://x.com/1')")
+            assert cache.key(db, "sqlite", OPTIONS) != key
+        finally:
+            writer.close()
+
+    def test_partial_import_not_cached(self, cache: CatalogCache):
+        def load():
+            return iter_csv(SAMPLE_CSV)
+
+        products, _ = cached_products(cache, SAMPLE_CSV, "csv", OPTIONS, load, ImportErrors())
+        next(iter(products))
+        _, hit = cached_products(cache, SAMPLE_CSV, "csv", OPTIONS, load, ImportErrors())
+        assert not hit
+
+    def test_corrupt_entry_is_dropped(self, cache: CatalogCache):
+        cache.root.mkdir()
+        (cache.root / "abc.pickle").write_bytes(b"not a pickle")
+        assert cache.get("abc") is None
+        assert not (cache.root / "abc.pickle").exists()
+
+    def test_lru_eviction(self, cache: CatalogCache):
+        table = ProductTable(import_csv(SAMPLE_CSV))
+        cache.put("a", table)
+        size = (cache.root / "a.pickle").stat().st_size
+        cache.max_bytes = size * 2
+        cache.put("b", table)
+        os.utime(cache.root / "a.pickle", (1, 1))
+        os.utime(cache.root / "b.pickle", (2, 2))
+        assert cache.get("a") is not None  # refreshes "a", so "b" is now least recent
+        cache.put("c", table)
+        assert sorted(p.stem for p in cache.root.glob("*.pickle")) == ["a", "c"]
+
+
+class TestBuildArtifactsCache:
+    def test_rebuild_uses_cache(self, tmp_path: Path, monkeypatch):
+        config_path = tmp_path / "llmindex.yaml"
+        config_path.write_text(
+            yaml.safe_dump({"site_name": "TestSite", "base_url": "https://example.com"})
+        )
+        (tmp_path / "products.csv").write_bytes(SAMPLE_CSV.read_bytes())
+        cache = CatalogCache(tmp_path / ".llmindex-cache")
+
+        build_artifacts(config_path, tmp_path / "first", cache=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source re-imported")
+
+        monkeypatch.setattr(watch_module, "iter_products", fail)
+        build_artifacts(config_path, tmp_path / "second", cache=cache)
+        for rel in ("llm/feed/products.jsonl", "llm/products.md"):
+            assert (tmp_path / "second" / rel).read_text() == (tmp_path / "first" / rel).read_text()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
 import importlib.util
 import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 import pytest
@@ -15,6 +18,7 @@ from llmindex.llmindex_cli.main import app
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 SAMPLE_CSV = PROJECT_ROOT / "llmindex" / "sample_data" / "sample.csv"
 SAMPLE_JSON = PROJECT_ROOT / "llmindex" / "sample_data" / "sample.json"
+SAMPLE_MERCHANT = PROJECT_ROOT / "llmindex" / "sample_data" / "sample_merchant.xml"
 ECOMMERCE_MANIFEST = PROJECT_ROOT / "spec" / "examples" / "ecommerce" / "llmindex.json"
 
 
@@ -57,6 +61,136 @@ class TestCLIGenerate:
         assert (output_dir / "llm" / "about.md").exists()
         assert (output_dir / "llm" / "feed" / "products.jsonl").exists()
 
+    def test_generate_stream_reports_peak_rss(self, runner: CliRunner, tmp_path: Path):
+        output_dir = tmp_path / "dist"
+        result = runner.invoke(
+            app,
+            [
+                "generate",
+                "--site",
+                "CLI Test Store",
+                "--url",
+                "https://example.com",
+                "--input-csv",
+                str(SAMPLE_CSV),
+                "--output-dir",
+                str(output_dir),
+                "--stream",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Imported: 20 products" in result.output
+        assert "Peak RSS:" in result.output
+        assert (output_dir / "llm" / "feed" / "products.jsonl").exists()
+
+    def test_generate_input_jsonl_round_trip(self, runner: CliRunner, tmp_path: Path):
+        first = tmp_path / "first"
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        result = runner.invoke(
+            app, [*args, "--input-csv", str(SAMPLE_CSV), "--output-dir", str(first)]
+        )
+        assert result.exit_code == 0, result.output
+        feed = first / "llm" / "feed" / "products.jsonl"
+
+        second = tmp_path / "second"
+        result = runner.invoke(
+            app, [*args, "--input-jsonl", str(feed), "--output-dir", str(second)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Imported: 20 products" in result.output
+        assert (second / "llm" / "feed" / "products.jsonl").read_text() == feed.read_text()
+
+    def test_generate_input_parquet(self, runner: CliRunner, tmp_path: Path):
+        pa_csv = pytest.importorskip("pyarrow.csv")
+        import pyarrow.parquet as pq
+
+        parquet = tmp_path / "products.parquet"
+        pq.write_table(pa_csv.read_csv(SAMPLE_CSV), parquet)
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        outputs = {}
+        for flag, path in [("--input-csv", SAMPLE_CSV), ("--input-parquet", parquet)]:
+            out = tmp_path / flag.strip("-")
+            result = runner.invoke(app, [*args, flag, str(path), "--output-dir", str(out)])
+            assert result.exit_code == 0, result.output
+            assert "Imported: 20 products" in result.output
+            outputs[flag] = (out / "llm" / "feed" / "products.jsonl").read_text()
+        assert outputs["--input-parquet"] == outputs["--input-csv"]
+
+    def test_generate_csv_engine(self, runner: CliRunner, tmp_path: Path):
+        pytest.importorskip("pyarrow")
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        args += ["--input-csv", str(SAMPLE_CSV)]
+        feeds = []
+        for engine in ("python", "arrow"):
+            out = tmp_path / engine
+            result = runner.invoke(app, [*args, "--csv-engine", engine, "--output-dir", str(out)])
+            assert result.exit_code == 0, result.output
+            feeds.append((out / "llm" / "feed" / "products.jsonl").read_text())
+        assert feeds[0] == feeds[1]
+
+        result = runner.invoke(app, [*args, "--csv-engine", "pandas"])
+        assert result.exit_code == 1
+        assert "--csv-engine must be one of: python, arrow" in result.output
+
+    def test_generate_input_sqlite(self, runner: CliRunner, tmp_path: Path):
+        db = tmp_path / "shop.db"
+        with closing(sqlite3.connect(db)) as conn, conn:
+            conn.execute("CREATE TABLE items (sku, name, link, state)")
+            conn.executemany(
+                "INSERT INTO items VALUES (?, ?, ?, ?)",
+                [(1, "One", "https://x.com/1", "in_stock"), (2, "Two", "https://x.com/2", "")],
+            )
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        query = "SELECT sku AS id, name AS title, link AS url, state AS availability FROM items"
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, [*args, "--input-sqlite", str(db), "--query", query, "--output-dir", str(out)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Imported: 2 products" in result.output
+
+        result = runner.invoke(app, [*args, "--input-sqlite", str(db)])
+        assert result.exit_code == 1
+        assert "no such table: products" in result.output
+
+        result = runner.invoke(app, [*args, "--input-csv", str(SAMPLE_CSV), "--query", query])
+        assert result.exit_code == 1
+        assert "--query requires --input-sqlite" in result.output
+
+    def test_generate_trusted_input(self, runner: CliRunner, tmp_path: Path):
+        first = tmp_path / "first"
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        result = runner.invoke(
+            app, [*args, "--input-csv", str(SAMPLE_CSV), "--output-dir", str(first)]
+        )
+        assert result.exit_code == 0, result.output
+        feed = first / "llm" / "feed" / "products.jsonl"
+
+        second = tmp_path / "second"
+        result = runner.invoke(
+            app,
+            [*args, "--input-jsonl", str(feed), "--trusted-input", "--output-dir", str(second)],
+        )
+        assert result.exit_code == 0, result.output
+        assert (second / "llm" / "feed" / "products.jsonl").read_text() == feed.read_text()
+        assert (second / "llm" / "products.md").read_text() == (
+            first / "llm" / "products.md"
+        ).read_text()
+
+    def test_generate_cache(self, runner: CliRunner, tmp_path: Path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        args += ["--input-csv", str(SAMPLE_CSV), "--cache"]
+        first = runner.invoke(app, [*args, "--output-dir", "first"])
+        assert first.exit_code == 0, first.output
+        assert "Cache: miss" in first.output
+        second = runner.invoke(app, [*args, "--output-dir", "second"])
+        assert second.exit_code == 0, second.output
+        assert "Cache: hit" in second.output
+        assert "Imported: 20 products" in second.output
+        feed = Path("llm", "feed", "products.jsonl")
+        assert (Path("second") / feed).read_text() == (Path("first") / feed).read_text()
+
     def test_generate_missing_required_args(self, runner: CliRunner):
         result = runner.invoke(app, ["generate", "--input-csv", str(SAMPLE_CSV)])
         assert result.exit_code == 1
@@ -97,25 +231,211 @@ class TestCLIGenerate:
         assert result.exit_code == 1
         assert "Input file not found" in result.output
 
-    def test_generate_rejects_multiple_inputs(self, runner: CliRunner, tmp_path: Path):
+    def test_generate_merges_multiple_inputs(self, runner: CliRunner, tmp_path: Path):
+        update = tmp_path / "update.jsonl"
+        update.write_text(
+            json.dumps(
+                {
+                    "id": "P001",
+                    "title": "Trail Runner Pro v2",
+                    "url": "https://acme.com/products/trail-runner-pro",
+                    "availability": "out_of_stock",
+                    "updated_at": "2020-01-01T00:00:00Z",
+                }
+            )
+            + "\n"
+        )
+        args = ["generate", "--site", "CLI Test Store", "--url", "https://example.com"]
+        titles = {}
+        for order, merge in [("csv-first", "last-wins"), ("jsonl-first", "last-wins")]:
+            inputs = ["--input-csv", str(SAMPLE_CSV), "--input-json", str(SAMPLE_JSON)]
+            if order == "csv-first":
+                inputs += ["--input-jsonl", str(update)]
+            else:
+                inputs = ["--input-jsonl", str(update), *inputs]
+            out = tmp_path / order
+            result = runner.invoke(
+                app, [*args, *inputs, "--merge", merge, "--output-dir", str(out)]
+            )
+            assert result.exit_code == 0, result.output
+            assert "Merge: last-wins" in result.output
+            assert "Imported: 23 products" in result.output
+            feed = (out / "llm" / "feed" / "products.jsonl").read_text().splitlines()
+            titles[order] = json.loads(feed[0])["title"]
+        # last-wins follows command-line order, not flag type
+        assert titles == {"csv-first": "Trail Runner Pro v2", "jsonl-first": "Trail Runner Pro"}
+
+        result = runner.invoke(
+            app,
+            [*args, "--input-csv", str(SAMPLE_CSV), "--input-jsonl", str(update)]
+            + ["--merge", "newest", "--output-dir", str(tmp_path / "newest")],
+        )
+        assert result.exit_code == 0, result.output
+        feed = (tmp_path / "newest" / "llm" / "feed" / "products.jsonl").read_text()
+        assert json.loads(feed.splitlines()[0])["title"] == "Trail Runner Pro"
+
+    def test_generate_rejects_unknown_merge_policy(self, runner: CliRunner):
+        result = runner.invoke(
+            app,
+            ["generate", "--site", "S", "--url", "https://example.com", "--merge", "oldest"],
+        )
+        assert result.exit_code == 1
+        assert "--merge must be one of: last-wins, newest" in result.output
+
+    def test_generate_reports_rejected_rows(self, runner: CliRunner, tmp_path: Path):
+        bad = tmp_path / "bad.csv"
+        rows = "".join(f"B{i},,https://example.com/b{i},1,in_stock\n" for i in range(20))
+        bad.write_text("id,title,url,price,availability\n" + rows)
+        report_path = tmp_path / "errors.json"
+        args = ["generate", "--site", "S", "--url", "https://example.com"]
+        args += ["--input-csv", str(SAMPLE_CSV), "--input-csv", str(bad)]
+        args += ["--error-samples", "2", "--errors-json", str(report_path)]
+
+        result = runner.invoke(app, [*args, "--output-dir", str(tmp_path / "dist")])
+        assert result.exit_code == 0, result.output
+        assert "Rejected records: 20" in result.output
+        report = json.loads(report_path.read_text())
+        kind = report["kinds"]["title: string_too_short"]
+        assert (report["total"], report["aborted"], kind["count"]) == (20, False, 20)
+        assert [(s["source"], s["ref"]) for s in kind["samples"]] == [
+            ("bad.csv", "Row 2"),
+            ("bad.csv", "Row 3"),
+        ]
+
+        result = runner.invoke(
+            app, [*args, "--max-errors", "5", "--output-dir", str(tmp_path / "aborted")]
+        )
+        assert result.exit_code == 1
+        assert "Import aborted: more than 5 invalid records" in result.output
+        report = json.loads(report_path.read_text())
+        assert (report["total"], report["aborted"], report["max_errors"]) == (6, True, 5)
+
+    def test_generate_stats(self, runner: CliRunner, tmp_path: Path):
+        stats_path = tmp_path / "stats.json"
+        result = runner.invoke(
+            app,
+            ["generate", "--site", "S", "--url", "https://example.com"]
+            + ["--input-csv", str(SAMPLE_CSV), "--input-json", str(SAMPLE_JSON), "--stats"]
+            + ["--stats-json", str(stats_path), "--output-dir", str(tmp_path / "dist")],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Generate stats" in result.output
+        assert "rows/s" in result.output
+        report = json.loads(stats_path.read_text())
+        assert report["rows_parsed"] == 23
+        assert report["bytes_read"] == SAMPLE_CSV.stat().st_size + SAMPLE_JSON.stat().st_size
+        assert report["products"] == 23
+        assert set(report["stages"]) >= {"parse", "validate", "serialize", "write"}
+
+    def test_generate_shard_size(self, runner: CliRunner, tmp_path: Path):
+        args = ["generate", "--site", "S", "--url", "https://example.com", "-i", str(SAMPLE_CSV)]
+        output_dir = tmp_path / "dist"
+        result = runner.invoke(app, [*args, "-o", str(output_dir), "--shard-size", "8"])
+        assert result.exit_code == 0, result.output
+        index = json.loads((output_dir / "llm" / "feed" / "feed-index.json").read_text())
+        assert [s["rows"] for s in index["shards"]] == [8, 8, 4]
+        result = runner.invoke(app, ["validate", str(output_dir / ".well-known" / "llmindex.json")])
+        assert result.exit_code == 0, result.output
+
+        result = runner.invoke(app, [*args, "-o", str(output_dir), "--shard-size", "8 parsecs"])
+        assert result.exit_code == 1
+        assert "Invalid shard size" in result.output
+
+    def test_generate_precompress(self, runner: CliRunner, tmp_path: Path):
+        args = ["generate", "--site", "S", "--url", "https://example.com", "-i", str(SAMPLE_CSV)]
+        output_dir = tmp_path / "dist"
+        result = runner.invoke(app, [*args, "-o", str(output_dir), "--precompress", "gzip"])
+        assert result.exit_code == 0, result.output
+        feed = output_dir / "llm" / "feed" / "products.jsonl"
+        assert (
+            gzip.decompress(feed.with_name("products.jsonl.gz").read_bytes()) == feed.read_bytes()
+        )
+        assert (output_dir / ".well-known" / "llmindex.json.gz").exists()
+
+        result = runner.invoke(app, [*args, "-o", str(output_dir), "--precompress", "gzip,lzma"])
+        assert result.exit_code == 1
+        assert "Unknown precompress codec 'lzma'" in result.output
+
+    def test_generate_delta(self, runner: CliRunner, tmp_path: Path):
+        csv_path = tmp_path / "products.csv"
+        rows = SAMPLE_CSV.read_text().splitlines()
+        csv_path.write_text("\n".join(rows) + "\n")
+        args = ["generate", "--site", "S", "--url", "https://example.com", "-i", str(csv_path)]
+        output_dir = tmp_path / "dist"
+        args += ["-o", str(output_dir), "--delta", "--snapshot", str(tmp_path / "snapshot")]
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert "Delta:" not in result.output
+
+        csv_path.write_text("\n".join(rows[:-1]) + "\n")
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+        assert "Delta: 0 added/changed, 1 removed" in result.output
+        manifest = json.loads((output_dir / ".well-known" / "llmindex.json").read_text())
+        assert "products-delta.jsonl?since=" in manifest["feeds"]["products_jsonl_delta"]
+
+    def test_generate_delta_buckets(self, runner: CliRunner, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        args = ["generate", "--site", "S", "--url", "https://example.com", "-i", str(SAMPLE_CSV)]
+        args += ["-o", str(tmp_path / "dist")]
+        result = runner.invoke(app, [*args, "--delta-buckets", "hourly", "--delta-retention", "2d"])
+        assert result.exit_code == 0, result.output
+        index = json.loads((tmp_path / "dist" / "llm" / "feed" / "delta-index.json").read_text())
+        assert (index["granularity"], index["buckets"]) == ("hourly", [])
+
+        result = runner.invoke(app, [*args, "--delta-buckets", "weekly"])
+        assert result.exit_code == 1
+        assert "--delta-buckets must be one of: hourly, daily" in result.output
+        result = runner.invoke(app, [*args, "--delta-buckets", "daily", "--delta-retention", "2"])
+        assert result.exit_code == 1
+        assert "Invalid retention" in result.output
+
+    def test_generate_delta_into_working_directory(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+        args = ["generate", "--site", "S", "--url", "https://example.com", "-i", str(SAMPLE_CSV)]
+        for _ in range(2):
+            result = runner.invoke(app, [*args, "-o", ".", "--delta"])
+            assert result.exit_code == 0, result.output
+        # The user cache directory is inside the output: the snapshot goes next to it
+        assert (tmp_path.parent / f".{tmp_path.name}.llmindex-snapshot").exists()
+
+    def test_generate_input_from_stdin(self, runner: CliRunner, tmp_path: Path):
+        args = ["generate", "--site", "S", "--url", "https://example.com"]
+        result = runner.invoke(
+            app,
+            [*args, "--input-csv", "-", "--output-dir", str(tmp_path / "dist")],
+            input=SAMPLE_CSV.read_bytes(),
+        )
+        assert result.exit_code == 0, result.output
+        assert "Imported: 20 products" in result.output
+
+        result = runner.invoke(app, [*args, "--input-sqlite", "-"])
+        assert result.exit_code == 1
+        assert "--input-sqlite cannot read from stdin ('-')" in result.output
+
+    def test_generate_with_google_merchant(self, runner: CliRunner, tmp_path: Path):
+        output_dir = tmp_path / "dist"
         result = runner.invoke(
             app,
             [
                 "generate",
                 "--site",
-                "CLI Test Store",
+                "S",
                 "--url",
-                "https://example.com",
-                "--input-csv",
-                str(SAMPLE_CSV),
-                "--input-json",
-                str(SAMPLE_JSON),
+                "https://acme.com",
+                "--input-google-merchant",
+                str(SAMPLE_MERCHANT),
                 "--output-dir",
-                str(tmp_path / "out"),
+                str(output_dir),
             ],
         )
-        assert result.exit_code == 1
-        assert "Provide only one input source" in result.output
+        assert result.exit_code == 0, result.output
+        assert "Imported: 3 products" in result.output
+        lines = (output_dir / "llm" / "feed" / "products.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["price"] == 129.99
 
     def test_generate_uses_yaml_config_no_product_mode(self, runner: CliRunner):
         with runner.isolated_filesystem():
@@ -328,3 +648,39 @@ class TestCLIVerify:
         )
         assert result.exit_code == 1
         assert "httpx is required for HTTP checks" in result.output
+
+
+class TestCLIFeed:
+    def test_feed_writes_jsonl_to_stdout(self, runner: CliRunner, tmp_path: Path):
+        out = tmp_path / "dist"
+        result = runner.invoke(
+            app,
+            ["generate", "--site", "S", "--url", "https://example.com"]
+            + ["--input-csv", str(SAMPLE_CSV), "--output-dir", str(out)],
+        )
+        assert result.exit_code == 0, result.output
+        expected = (out / "llm" / "feed" / "products.jsonl").read_bytes()
+
+        runner = CliRunner(mix_stderr=False)
+        result = runner.invoke(app, ["feed", "--input-csv", "-"], input=SAMPLE_CSV.read_bytes())
+        assert result.exit_code == 0, result.stderr
+        assert result.stdout_bytes == expected
+        assert "Wrote 20 products to stdout" in result.stderr
+
+    def test_feed_merges_and_reports_errors(self, runner: CliRunner, tmp_path: Path):
+        bad = tmp_path / "bad.jsonl"
+        bad.write_text('{"id": "X1", "title": "", "url": "https://example.com/x"}\n')
+        runner = CliRunner(mix_stderr=False)
+        result = runner.invoke(
+            app,
+            ["feed", "--input-jsonl", "-", "--input-jsonl", str(bad), "--max-errors", "0"],
+            input='{"id": "A1", "title": "A", "url": "https://example.com/a"}\n',
+        )
+        assert result.exit_code == 1
+        assert "[warn] bad.jsonl Line 1:" in result.stderr
+        assert "Import aborted: more than 0 invalid records" in result.stderr
+
+    def test_feed_requires_an_input(self, runner: CliRunner):
+        result = runner.invoke(app, ["feed"])
+        assert result.exit_code == 1
+        assert "Provide at least one --input-* source" in result.output
@@ -1,12 +1,47 @@
 """Tests for CSV importer."""
 
+import csv
 from pathlib import Path
 
-from llmindex.importers.csv_importer import import_csv
+import pytest
+
+from llmindex.importers.csv_importer import (
+    _iter_csv_parallel,
+    _record_boundaries,
+    compile_row_getter,
+    import_csv,
+)
+from llmindex.llmindex_cli.models import Product
 
 SAMPLE_CSV = Path(__file__).resolve().parent.parent / "sample_data" / "sample.csv"
 
 
+def _legacy_import_csv(path: Path) -> tuple[list[Product], list[int]]:
+    """Reference DictReader implementation the compiled getter must match."""
+    products, bad_rows = [], []
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        for row_num, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                price_raw = row.get("price", "").strip()
+                products.append(
+                    Product(
+                        id=row.get("id", "").strip(),
+                        title=row.get("title", "").strip(),
+                        url=row.get("url", "").strip(),
+                        image_url=row.get("image_url", "").strip() or None,
+                        price=float(price_raw) if price_raw else None,
+                        currency=row.get("currency", "").strip() or None,
+                        availability=row.get("availability", "in_stock").strip(),
+                        brand=row.get("brand", "").strip() or None,
+                        category=row.get("category", "").strip() or None,
+                        updated_at=row.get("updated_at", "").strip(),
+                    )
+                )
+            except Exception:
+                bad_rows.append(row_num)
+    return products, bad_rows
+
+
 class TestCSVImporter:
     def test_import_sample_csv(self):
         products = import_csv(SAMPLE_CSV)
@@ -58,3 +93,223 @@ class TestCSVImporter:
         )
         products = import_csv(csv_file)
         assert len(products) >= 1  # at least the good row
+
+
+@pytest.fixture
+def tricky_csv(tmp_path):
+    """CSV with a BOM, quoted newlines/quotes/commas, blank lines and invalid rows."""
+    path = tmp_path / "tricky.csv"
+    titles = ["plain", 'with "quotes"', "multi\nline", "comma, here", '"\n"']
+    prices = ["1.50", "", "bad", "-1"]
+    with path.open("w", newline="", encoding="utf-8") as f:
+        f.write("\ufeff")
+        writer = csv.writer(f)
+        writer.writerow(["id", "title", "url", "price", "currency", "availability", "updated_at"])
+        for i in range(400):
+            if i % 37 == 0:
+                f.write("\n")
+            writer.writerow(
+                [
+                    f"P{i}",
+                    titles[i % len(titles)],
+                    f"https://example.com/p/{i}",
+                    prices[i % len(prices)],
+                    "USD",
+                    "in_stock",
+                    "2026-01-01T00:00:00Z",
+                ]
+            )
+    return path
+
+
+class TestParallelCSVImport:
+    def test_boundaries_are_record_aligned(self, tricky_csv):
+        boundaries = _record_boundaries(tricky_csv, 64)
+        data = tricky_csv.read_bytes()
+        assert boundaries[-1] == len(data)
+        for offset in boundaries[:-1]:
+            assert data[offset - 1 : offset] == b"\n"
+            # Each range must start outside a quoted field
+            assert data[:offset].count(b'"') % 2 == 0
+
+    @pytest.mark.parametrize("chunk_bytes", [64, 1024, 1 << 30])
+    def test_matches_sequential_import(self, tricky_csv, chunk_bytes, capsys):
+        sequential = import_csv(tricky_csv)
+        seq_err = capsys.readouterr().err
+        parallel = list(_iter_csv_parallel(tricky_csv, 2, chunk_bytes))
+        par_err = capsys.readouterr().err
+
+        assert [p.model_dump() for p in parallel] == [p.model_dump() for p in sequential]
+        assert par_err == seq_err
+        assert "Row 4:" in par_err
+
+    def test_stray_quote_in_unquoted_field(self, tmp_path, capsys):
+        # The inch mark flips the quote parity, misplacing later boundaries
+        path = tmp_path / "inch.csv"
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "title", "url", "price", "availability", "updated_at"])
+            for i in range(2000):
+                title = f"multi\nline {i}" if i % 7 == 0 else f"item {i}"
+                if i == 100:
+                    f.write(f'P{i},3" wide,https://example.com/p/{i},1,in_stock,\n')
+                    continue
+                writer.writerow([f"P{i}", title, f"https://example.com/p/{i}", "1", "in_stock", ""])
+
+        sequential = import_csv(path)
+        seq_err = capsys.readouterr().err
+        parallel = list(_iter_csv_parallel(path, 2, 4096))
+        par_err = capsys.readouterr().err
+
+        assert len(sequential) == 2000
+        assert [p.id for p in parallel] == [p.id for p in sequential]
+        assert par_err == seq_err == ""
+
+    def test_workers_option(self):
+        assert import_csv(SAMPLE_CSV, workers=2) == import_csv(SAMPLE_CSV)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        assert list(_iter_csv_parallel(path, 2, 16)) == []
+
+
+class TestCompiledRowGetter:
+    EDGE_CSV = (
+        "id,title,url,price,availability,updated_at,title,extra\n"
+        "P1,first,https://example.com/1,1.5,in_stock,2026-01-01T00:00:00Z,second,x\n"
+        "\n"
+        "P2,short,https://example.com/2\n"
+        "P3,a,https://example.com/3,2,preorder,2026-01-01T00:00:00Z,dup,y,overflow\n"
+        " P4 ,a,https://example.com/4, 3 ,in_stock,2026-01-01T00:00:00Z, padded ,z\n"
+    )
+
+    @pytest.mark.parametrize("content", ["sample", "edge"])
+    def test_matches_dictreader(self, tmp_path, content, capsys):
+        if content == "sample":
+            path = SAMPLE_CSV
+        else:
+            path = tmp_path / "edge.csv"
+            path.write_text(self.EDGE_CSV)
+        expected, bad_rows = _legacy_import_csv(path)
+        products = import_csv(path)
+        err = capsys.readouterr().err
+
+        assert [p.model_dump() for p in products] == [p.model_dump() for p in expected]
+        assert [int(line.split()[2].rstrip(":")) for line in err.splitlines()] == bad_rows
+
+    def test_duplicate_header_last_wins(self, tmp_path):
+        path = tmp_path / "edge.csv"
+        path.write_text(self.EDGE_CSV)
+        assert import_csv(path)[0].title == "second"
+
+    def test_missing_column_uses_default(self):
+        getter = compile_row_getter(["id"], ["id", "availability"], {"availability": "in_stock"})
+        assert getter([" P1 "]) == ["P1", "in_stock"]
+
+    def test_short_row_yields_none(self):
+        getter = compile_row_getter(["id", "title"], ["id", "title"])
+        assert getter(["P1"]) == ["P1", None]
+
+    def test_column_mapping(self, tmp_path):
+        path = tmp_path / "mapped.csv"
+        path.write_text(
+            "sku,name,link,availability,updated_at\n"
+            "P1,Widget,https://example.com/w,in_stock,2026-01-01T00:00:00Z\n"
+        )
+        columns = {"id": "sku", "title": "name", "url": "link"}
+        [product] = import_csv(path, columns=columns)
+        assert (product.id, product.title, product.url) == ("P1", "Widget", "https://example.com/w")
+        assert import_csv(path, workers=2, columns=columns) == [product]
+
+    def test_mapped_column_not_in_header(self, tmp_path):
+        path = tmp_path / "mapped.csv"
+        path.write_text("id,title\nP1,Widget\n")
+        with pytest.raises(ValueError, match="Column 'sku'"):
+            import_csv(path, columns={"id": "sku"})
+
+
+class TestArrowCSVEngine:
+    @pytest.fixture(autouse=True)
+    def _pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.mark.parametrize("path", sorted(SAMPLE_CSV.parent.glob("*.csv")), ids=lambda p: p.name)
+    def test_matches_default_engine_on_samples(self, path, capsys):
+        default = import_csv(path)
+        default_err = capsys.readouterr().err
+        arrow = import_csv(path, engine="arrow")
+        arrow_err = capsys.readouterr().err
+
+        strip = {"updated_at"}  # rows without one get the import time
+        assert [p.model_dump(exclude=strip) for p in arrow] == [
+            p.model_dump(exclude=strip) for p in default
+        ]
+        assert arrow_err == default_err
+
+    def test_matches_default_engine_on_invalid_rows(self, tricky_csv, capsys):
+        default = import_csv(tricky_csv)
+        default_err = capsys.readouterr().err
+        arrow = import_csv(tricky_csv, engine="arrow")
+
+        assert [p.model_dump() for p in arrow] == [p.model_dump() for p in default]
+        assert capsys.readouterr().err == default_err
+        assert "Row 4:" in default_err
+
+    def test_normalizes_and_checks_columns(self, tmp_path):
+        path = tmp_path / "checks.csv"
+        path.write_text(
+            "id,title,url,price,currency,availability,updated_at\n"
+            "P1, One ,https://example.com/1,1_000,,In Stock,\n"
+            "P2,Two,https://example.com/2,2,usd,in_stock,2026-01-01T00:00:00Z\n"
+            "P3,Three,https://example.com/3,-2,USD,in_stock,2026-01-01T00:00:00Z\n"
+            "P4,Four,https://example.com/4,4,EUR,pre-order,2026-01-01T00:00:00Z\n"
+        )
+        first, last = import_csv(path, engine="arrow")
+        assert (first.title, first.price, first.currency) == ("One", 1000.0, None)
+        assert first.availability == "in_stock"
+        assert first.updated_at.endswith("Z")
+        assert (last.id, last.availability) == ("P4", "preorder")
+
+    def test_compressed_and_mapped(self, tmp_path):
+        import gzip
+
+        path = tmp_path / "mapped.csv.gz"
+        path.write_bytes(
+            gzip.compress(
+                b"sku,name,link,availability,updated_at\n"
+                b"P1,Widget,https://example.com/w,in_stock,2026-01-01T00:00:00Z\n"
+            )
+        )
+        columns = {"id": "sku", "title": "name", "url": "link"}
+        assert import_csv(path, columns=columns, engine="arrow") == import_csv(
+            path, columns=columns
+        )
+        with pytest.raises(ValueError, match="Column 'code'"):
+            import_csv(path, columns={"id": "code"}, engine="arrow")
+
+    def test_row_with_wrong_cell_count_skipped(self, tmp_path, capsys):
+        path = tmp_path / "short.csv"
+        path.write_text(
+            "id,title,url,availability\nP1,a,https://example.com/1\nP2,b,https://example.com/2,in_stock\n"
+        )
+        assert [p.id for p in import_csv(path, engine="arrow")] == ["P2"]
+        assert "Skipped row with 3 cells (header has 4)" in capsys.readouterr().err
+
+    def test_row_numbers_after_skipped_row(self, tmp_path, capsys):
+        path = tmp_path / "skipped.csv"
+        path.write_text(
+            "id,title,url,availability\n"
+            "P1,a,https://example.com/1\n"
+            "P2,b,https://example.com/2,in_stock\n"
+            "P3,,https://example.com/3,in_stock\n"
+        )
+        assert [p.id for p in import_csv(path, engine="arrow")] == ["P2"]
+        # The default engine numbers the row with the empty title the same way
+        assert "Row 4:" in capsys.readouterr().err
+        import_csv(path)
+        assert "Row 4:" in capsys.readouterr().err
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            import_csv(SAMPLE_CSV, engine="pandas")
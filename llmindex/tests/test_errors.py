@@ -0,0 +1,132 @@
+"""Tests for aggregated importer error reporting."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from llmindex.importers.csv_importer import _iter_csv_parallel, iter_csv
+from llmindex.importers.errors import ImportAbortedError, ImportErrors, error_kinds
+from llmindex.importers.jsonl_importer import iter_jsonl
+from llmindex.llmindex_cli.models import Product
+
+HEADER = "id,title,url,price,availability\n"
+
+
+def _write_csv(path: Path, bad_titles: int, bad_prices: int, good: int = 3) -> Path:
+    lines = [HEADER]
+    for i in range(good):
+        lines.append(f"G{i},Good {i},https://example.com/g{i},9.99,in_stock\n")
+    for i in range(bad_titles):
+        lines.append(f"T{i},,https://example.com/t{i},9.99,in_stock\n")
+    for i in range(bad_prices):
+        lines.append(f"P{i},Bad price,https://example.com/p{i},-1,in_stock\n")
+    path.write_text("".join(lines))
+    return path
+
+
+class TestErrorKinds:
+    def test_validation_error_is_classified_per_field(self):
+        with pytest.raises(Exception) as exc_info:
+            Product(
+                id="X",
+                title="",
+                url="https://example.com/x",
+                price=-1,
+                availability="in_stock",
+                updated_at="2024-01-01T00:00:00Z",
+            )
+        assert error_kinds(exc_info.value) == [
+            "title: string_too_short",
+            "price: greater_than_equal",
+        ]
+
+    def test_other_exceptions_use_their_class_name(self):
+        assert error_kinds(ValueError("invalid JSON")) == ["ValueError"]
+
+
+class TestImportErrors:
+    def test_counts_every_record_but_samples_first_n(self, tmp_path: Path, capsys):
+        errors = ImportErrors(max_samples=2)
+        products = list(iter_csv(_write_csv(tmp_path / "p.csv", 10, 1), errors=errors))
+
+        assert len(products) == 3
+        assert errors.total == 11
+        assert errors.counts == {"title: string_too_short": 10, "price: greater_than_equal": 1}
+        report = errors.report()
+        samples = report["kinds"]["title: string_too_short"]["samples"]
+        assert [s["ref"] for s in samples] == ["Row 5", "Row 6"]
+        assert list(report["kinds"]) == ["title: string_too_short", "price: greater_than_equal"]
+        # Only sampled rows are echoed
+        assert capsys.readouterr().err.count("[warn]") == 3
+
+    def test_without_collector_every_row_is_printed(self, tmp_path: Path, capsys):
+        list(iter_csv(_write_csv(tmp_path / "p.csv", 10, 1)))
+        assert capsys.readouterr().err.count("[warn] Row") == 11
+
+    def test_max_errors_aborts_the_import(self, tmp_path: Path):
+        errors = ImportErrors(max_errors=4, echo=False)
+        with pytest.raises(ImportAbortedError, match="more than 4 invalid records"):
+            list(iter_csv(_write_csv(tmp_path / "p.csv", 10, 0), errors=errors))
+        assert errors.total == 5
+        assert errors.report()["aborted"] is True
+
+    def test_parallel_workers_report_kinds(self, tmp_path: Path):
+        path = _write_csv(tmp_path / "p.csv", 200, 50, good=500)
+        sequential = ImportErrors(echo=False)
+        parallel = ImportErrors(echo=False)
+        list(iter_csv(path, errors=sequential))
+        products = list(_iter_csv_parallel(path, 2, 4096, errors=parallel))
+        assert len(products) == 500
+        assert parallel.report() == sequential.report()
+
+    def test_with_source_shares_counts(self, tmp_path: Path):
+        path = tmp_path / "p.jsonl"
+        path.write_text('{"id": "A", "title": "A", "url": "https://example.com/a"}\nnot json\n')
+        errors = ImportErrors(echo=False)
+        list(iter_jsonl(path, errors=errors.with_source("p.jsonl")))
+
+        assert errors.total == 1
+        [sample] = errors.report()["kinds"]["ValueError"]["samples"]
+        assert (sample["source"], sample["ref"]) == ("p.jsonl", "Line 2")
+
+    def test_write_json(self, tmp_path: Path):
+        errors = ImportErrors(echo=False)
+        errors.record("Row 2", ["title: missing"], "title is required")
+        errors.write_json(tmp_path / "out" / "errors.json")
+
+        report = json.loads((tmp_path / "out" / "errors.json").read_text())
+        assert report == {
+            "total": 1,
+            "aborted": False,
+            "max_errors": None,
+            "kinds": {
+                "title: missing": {
+                    "count": 1,
+                    "samples": [{"ref": "Row 2", "message": "title is required"}],
+                }
+            },
+        }
+
+    @pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="needs pyarrow")
+    def test_arrow_engine_counts_malformed_rows(self, tmp_path: Path):
+        path = _write_csv(tmp_path / "p.csv", 1, 0)
+        with path.open("a") as f:
+            f.write("X1,too,many,cells,here,!\n")
+        errors = ImportErrors(echo=False)
+        products = list(iter_csv(path, engine="arrow", errors=errors))
+
+        assert len(products) == 3
+        assert errors.counts == {"title: string_too_short": 1, "cell_count": 1}
+
+    @pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="needs pyarrow")
+    def test_arrow_engine_aborts_on_malformed_rows(self, tmp_path: Path):
+        path = tmp_path / "p.csv"
+        path.write_text("id,title,url\n" + "".join(f"X{i},a,b,c\n" for i in range(10)))
+        errors = ImportErrors(max_errors=2, echo=False)
+        with pytest.raises(ImportAbortedError):
+            list(iter_csv(path, engine="arrow", errors=errors))
+        assert errors.total == 3
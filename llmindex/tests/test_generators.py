@@ -1,16 +1,37 @@
 """Tests for the generator output pipeline."""
 
+import gzip
+import hashlib
 import json
+import pickle
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import jsonschema
 import pytest
 
-from llmindex.importers.csv_importer import import_csv
-from llmindex.llmindex_cli.generators.feed import generate_feed, write_feed
+from llmindex.importers.csv_importer import import_csv, iter_csv
+from llmindex.llmindex_cli.generators.catalog import write_catalog
+from llmindex.llmindex_cli.generators.compress import Precompressor, parse_codecs
+from llmindex.llmindex_cli.generators.delta import (
+    DeltaResult,
+    Snapshot,
+    content_digest,
+    default_snapshot_path,
+)
+from llmindex.llmindex_cli.generators.delta_archive import DeltaArchive, parse_retention
+from llmindex.llmindex_cli.generators.feed import (
+    ShardSize,
+    feed_line_bytes,
+    feed_record,
+    generate_feed,
+    write_feed,
+)
+from llmindex.llmindex_cli.generators.json_backend import dumps_line, dumps_pretty
 from llmindex.llmindex_cli.generators.manifest import generate_manifest, write_manifest
-from llmindex.llmindex_cli.generators.pages import write_pages
-from llmindex.llmindex_cli.models import SiteConfig
+from llmindex.llmindex_cli.generators.pages import ProductsPage, generate_products_page, write_pages
+from llmindex.llmindex_cli.models import PriceRange, Product, ProductTable, SiteConfig
+from llmindex.llmindex_cli.stats import RunStats
 
 SAMPLE_CSV = Path(__file__).resolve().parent.parent / "sample_data" / "sample.csv"
 SCHEMA_PATH = (
@@ -33,6 +54,14 @@ def products():
     return import_csv(SAMPLE_CSV)
 
 
+@pytest.fixture
+def user_cache(tmp_path_factory, monkeypatch):
+    """A scratch user cache directory, where delta snapshots go by default."""
+    path = tmp_path_factory.mktemp("xdg-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))
+    return path
+
+
 @pytest.fixture
 def schema():
     return json.loads(SCHEMA_PATH.read_text())
@@ -101,6 +130,544 @@ class TestFeedGenerator:
         content = generate_feed([])
         assert content == ""
 
+    def test_line_format(self):
+        product = Product(
+            id="SKU-1",
+            title='Caf\u00e9 "Cr\u00e8me"',
+            url="https://example.com/p/1",
+            price=12.5,
+            currency="EUR",
+            availability="in_stock",
+            brand="Acme",
+            updated_at="2026-10-18T09:00:00Z",
+        )
+        # The format of json.dumps(record, ensure_ascii=False), whichever backend is used
+        assert feed_line_bytes(product) == (
+            '{"id": "SKU-1", "title": "Caf\u00e9 \\"Cr\u00e8me\\"", '
+            '"url": "https://example.com/p/1", "availability": "in_stock", '
+            '"updated_at": "2026-10-18T09:00:00Z", "price": 12.5, "currency": "EUR", '
+            '"brand": "Acme"}'
+        ).encode("utf-8")
+
+    def test_write_feed_accepts_generator(self, products, tmp_path):
+        path = write_feed(iter_csv(SAMPLE_CSV), str(tmp_path))
+        assert Path(path).read_text() == generate_feed(products)
+
+
+class TestJSONBackend:
+    """orjson, when installed, writes the same bytes as the stdlib encoder."""
+
+    @pytest.fixture(autouse=True)
+    def _orjson(self):
+        pytest.importorskip("orjson")
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            {"title": 'Caf\u00e9 "Cr\u00e8me" \\ \U0001f600 \u2028', "ctl": "a\x00\x1f\t\n\x7f"},
+            {"price": 12.0, "min": 0.0001, "max": 9999999999999998.0, "neg": -0.0, "n": 3},
+            {"tiny": 1e-05, "huge": 1e16, "nan": float("nan"), "inf": float("inf")},
+            {"range": {"min": 1e-7, "max": 2.5}, "list": [1e22, "x", None, True]},
+            {"big": 2**70},
+            {},
+        ],
+    )
+    def test_line_matches_stdlib(self, obj):
+        assert dumps_line(obj, "orjson") == dumps_line(obj, "json")
+        assert dumps_line(obj, "orjson", compact=True) == dumps_line(obj, "json", compact=True)
+        assert dumps_pretty(obj, "orjson") == dumps_pretty(obj, "json")
+
+    def test_feed_lines_match_stdlib(self, products):
+        products = [
+            *products,
+            products[0].model_copy(update={"price": 1e-05, "title": "\u5c71\u5cb3 \U0001f3d4"}),
+            products[1].model_copy(
+                update={"price_range": PriceRange(min=0, max=1e16, currency="USD")}
+            ),
+        ]
+        for p in products:
+            record = feed_record(p)
+            line = dumps_line(record, "orjson")
+            assert line == dumps_line(record, "json") == feed_line_bytes(p)
+            compact = dumps_line(record, "orjson", compact=True)
+            assert compact == dumps_line(record, "json", compact=True)
+            assert json.loads(compact) == json.loads(line)
+            assert list(json.loads(line)) == list(record)
+        assert feed_line_bytes(products[0]).startswith(b'{"id": "')
+
+    def test_manifest_matches_stdlib(self, config):
+        manifest = generate_manifest(
+            config.model_copy(update={"name": "B\u00e4ckerei M\u00fcller"})
+        )
+        assert dumps_pretty(manifest, "orjson") == dumps_pretty(manifest, "json")
+        assert (
+            dumps_pretty(manifest, "json")
+            == json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+        )
+
+
+class TestShardedFeed:
+    """--shard-size splits the feed into shards listed in feed-index.json."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("50000", ShardSize(50000)),
+            ("64MB", ShardSize(64_000_000, "bytes")),
+            ("512 KiB", ShardSize(524_288, "bytes")),
+        ],
+    )
+    def test_parse_shard_size(self, value, expected):
+        assert ShardSize.parse(value) == expected
+
+    @pytest.mark.parametrize("value", ["0", "-5", "10 rows", "1.5MB", ""])
+    def test_parse_shard_size_rejects(self, value):
+        with pytest.raises(ValueError, match="Invalid shard size"):
+            ShardSize.parse(value)
+
+    def test_shards_by_rows(self, products, tmp_path):
+        index_path = Path(
+            write_feed(products, str(tmp_path), ShardSize(8), base_url="https://x.com")
+        )
+        assert index_path.name == "feed-index.json"
+        index = json.loads(index_path.read_text())
+        assert [s["rows"] for s in index["shards"]] == [8, 8, 4]
+        assert index["total_rows"] == 20
+
+        first = index["shards"][0]
+        data = (index_path.parent / "products-00001.jsonl").read_bytes()
+        assert first["url"] == "https://x.com/llm/feed/products-00001.jsonl"
+        assert (first["bytes"], first["sha256"]) == (len(data), hashlib.sha256(data).hexdigest())
+        stamps = [p.updated_at for p in products[:8]]
+        assert (first["min_updated_at"], first["max_updated_at"]) == (min(stamps), max(stamps))
+
+        shards = sorted(index_path.parent.glob("products-*.jsonl"))
+        assert b"".join(p.read_bytes() for p in shards).decode() == generate_feed(products)
+
+    def test_shards_by_bytes(self, products, tmp_path):
+        limit = 1000
+        index_path = Path(write_feed(products, str(tmp_path), ShardSize(limit, "bytes")))
+        index = json.loads(index_path.read_text())
+        assert len(index["shards"]) > 1
+        assert all(s["bytes"] <= limit for s in index["shards"])
+        assert index["shards"][0]["url"] == "products-00001.jsonl"
+        assert index["total_bytes"] == len(generate_feed(products).encode())
+
+    def test_catalog_manifest_and_stale_files(self, config, products, schema, tmp_path):
+        feed_dir = tmp_path / "llm" / "feed"
+        write_catalog(products, config, str(tmp_path))
+        write_catalog(products, config, str(tmp_path), shard_size=ShardSize(5))
+        assert not (feed_dir / "products.jsonl").exists()
+        assert len(list(feed_dir.glob("products-*.jsonl"))) == 4
+
+        result = write_catalog(products, config, str(tmp_path), shard_size=ShardSize(10))
+        assert sorted(p.name for p in feed_dir.iterdir()) == [
+            "feed-index.json",
+            "products-00001.jsonl",
+            "products-00002.jsonl",
+        ]
+        assert result.feed_path == str(feed_dir / "feed-index.json")
+        assert len(result.written) == 8
+        manifest = json.loads(Path(result.manifest_path).read_text())
+        jsonschema.validate(manifest, schema)
+        assert manifest["feeds"] == {
+            "products_jsonl_index": "https://test-store.com/llm/feed/feed-index.json"
+        }
+
+        write_catalog(products, config, str(tmp_path))
+        assert sorted(p.name for p in feed_dir.iterdir()) == ["products.jsonl"]
+
+
+class TestPrecompress:
+    """--precompress writes .gz/.br/.zst siblings while the artifacts are written."""
+
+    def test_parse_codecs(self):
+        assert parse_codecs("gzip, br,zstd") == ("gzip", "br", "zstd")
+        assert parse_codecs("gz,brotli,zst,gzip") == ("gzip", "br", "zstd")
+        with pytest.raises(ValueError, match="Unknown precompress codec 'lzma'"):
+            parse_codecs("gzip,lzma")
+
+    def test_siblings_match_artifacts(self, config, products, tmp_path):
+        brotli = pytest.importorskip("brotli")
+        zstandard = pytest.importorskip("zstandard")
+        decompress = {
+            ".gz": gzip.decompress,
+            ".br": brotli.decompress,
+            ".zst": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+        }
+        stats = RunStats()
+        result = write_catalog(
+            products, config, str(tmp_path), stats=stats, precompress=("gzip", "br", "zstd")
+        )
+        assert len(result.compressed_paths) == 3 * len(result.artifacts)
+        for artifact in result.artifacts:
+            data = Path(artifact).read_bytes()
+            for suffix, decode in decompress.items():
+                assert decode(Path(artifact + suffix).read_bytes()) == data, artifact + suffix
+        assert stats.bytes_written == sum(Path(p).stat().st_size for p in result.written)
+
+    def test_blocks_keep_order_across_workers(self, tmp_path):
+        lines = [f'{{"id": "{i}", "title": "{"x" * (i % 97)}"}}\n'.encode() for i in range(60000)]
+        with Precompressor(["gzip"], workers=4) as compressor:
+            with compressor.open(tmp_path / "a.jsonl") as f:
+                for line in lines:
+                    f.write(line)
+            compressor.write_bytes(tmp_path / "b.jsonl", b"".join(lines[:10]))
+        assert gzip.decompress((tmp_path / "a.jsonl.gz").read_bytes()) == b"".join(lines)
+        assert gzip.decompress((tmp_path / "b.jsonl.gz").read_bytes()) == b"".join(lines[:10])
+        assert compressor.paths == [str(tmp_path / "a.jsonl.gz"), str(tmp_path / "b.jsonl.gz")]
+
+    def test_shards_and_stale_siblings(self, config, products, tmp_path):
+        feed_dir = tmp_path / "llm" / "feed"
+        write_catalog(products, config, str(tmp_path), precompress=("gzip",))
+        assert (feed_dir / "products.jsonl.gz").exists()
+
+        write_catalog(
+            products, config, str(tmp_path), shard_size=ShardSize(10), precompress=("gzip",)
+        )
+        assert sorted(p.name for p in feed_dir.iterdir()) == [
+            "feed-index.json",
+            "feed-index.json.gz",
+            "products-00001.jsonl",
+            "products-00001.jsonl.gz",
+            "products-00002.jsonl",
+            "products-00002.jsonl.gz",
+        ]
+        shard = feed_dir / "products-00002.jsonl"
+        assert (
+            gzip.decompress(shard.with_name(shard.name + ".gz").read_bytes()) == shard.read_bytes()
+        )
+
+        write_catalog(products, config, str(tmp_path), shard_size=ShardSize(10))
+        assert not list(tmp_path.rglob("*.gz"))
+
+
+@pytest.mark.usefixtures("user_cache")
+class TestDeltaFeed:
+    """--delta compares each build with the previous one's snapshot."""
+
+    def _build(self, products, config, tmp_path, **kwargs):
+        result = write_catalog(products, config, str(tmp_path), delta=True, **kwargs)
+        return result, json.loads(Path(result.manifest_path).read_text())
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_content_digest_ignores_updated_at(self, products, compact):
+        p = products[0]
+        restamped = p.model_copy(update={"updated_at": "2030-01-01T00:00:00Z"})
+        renamed = p.model_copy(update={"title": "Renamed"})
+        line, restamped_line, renamed_line = (
+            dumps_line(feed_record(q), compact=compact) for q in (p, restamped, renamed)
+        )
+        assert content_digest(line) == content_digest(restamped_line)
+        assert content_digest(line) != content_digest(renamed_line)
+
+    def test_snapshot_round_trip(self, tmp_path):
+        path = tmp_path / "snap"
+        Snapshot("2026-01-01T00:00:00Z", None, {"A": b"12345678", "\u5c71\n2": b"abcdefgh"}).save(
+            path
+        )
+        assert Snapshot.load(path) == Snapshot(
+            "2026-01-01T00:00:00Z", None, {"A": b"12345678", "\u5c71\n2": b"abcdefgh"}
+        )
+        assert Snapshot.load(tmp_path / "missing") is None
+        path.write_bytes(path.read_bytes()[:-3])
+        with pytest.raises(ValueError, match="Invalid delta snapshot"):
+            Snapshot.load(path)
+
+    def test_delta_between_builds(self, config, products, schema, tmp_path):
+        feed_dir = tmp_path / "llm" / "feed"
+        result, first = self._build(products, config, tmp_path)
+        assert result.delta.path is None
+        assert not (feed_dir / "products-delta.jsonl").exists()
+        assert "products_jsonl_delta" not in first["feeds"]
+        # The snapshot lives outside the output directory, which stays publishable
+        assert default_snapshot_path(tmp_path).exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".well-known", "llm"]
+
+        removed, changed, restamped, *rest = products
+        added = restamped.model_copy(update={"id": "NEW-1"})
+        second_products = [
+            changed.model_copy(update={"price": 1.5}),
+            restamped.model_copy(update={"updated_at": "2030-01-01T00:00:00Z"}),
+            *rest,
+            added,
+        ]
+        result, second = self._build(second_products, config, tmp_path, shard_size=ShardSize(8))
+        assert (result.delta.changed, result.delta.removed) == (2, 1)
+        lines = [
+            json.loads(line)
+            for line in (feed_dir / "products-delta.jsonl").read_text().splitlines()
+        ]
+        assert [line["id"] for line in lines] == [changed.id, "NEW-1", removed.id]
+        assert lines[0]["price"] == 1.5
+        assert lines[2] == {
+            "id": removed.id,
+            "deleted": True,
+            "updated_at": second["feed_updated_at"],
+        }
+        assert result.delta.path in result.written
+        jsonschema.validate(second, schema)
+        assert second["feeds"]["products_jsonl_delta"] == (
+            "https://test-store.com/llm/feed/products-delta.jsonl?since=" + first["feed_updated_at"]
+        )
+
+        # No changes: the previous delta, since and feed_updated_at stay
+        delta = (feed_dir / "products-delta.jsonl").read_bytes()
+        result, third = self._build(second_products, config, tmp_path, precompress=("gzip",))
+        assert (result.delta.changed, result.delta.removed) == (0, 0)
+        assert (feed_dir / "products-delta.jsonl").read_bytes() == delta
+        assert gzip.decompress((feed_dir / "products-delta.jsonl.gz").read_bytes()) == delta
+        assert third["feeds"]["products_jsonl_delta"] == second["feeds"]["products_jsonl_delta"]
+        assert third["feed_updated_at"] == second["feed_updated_at"]
+
+    def test_snapshot_option_and_legacy_location(self, config, products, tmp_path):
+        output_dir = tmp_path / "dist"
+        snapshot = tmp_path / "state" / "snap"
+        write_catalog(products, config, str(output_dir), delta=True, delta_snapshot=str(snapshot))
+        assert snapshot.exists()
+        with pytest.raises(ValueError, match="outside the output directory"):
+            write_catalog(
+                products,
+                config,
+                str(output_dir),
+                delta_buckets="daily",
+                delta_snapshot=str(output_dir / "snap"),
+            )
+
+        # A snapshot left in the output directory by earlier versions is moved out
+        snapshot.rename(output_dir / ".llmindex-snapshot")
+        result = write_catalog(
+            products[1:], config, str(output_dir), delta=True, delta_snapshot=str(snapshot)
+        )
+        assert result.delta.removed == 1
+        assert not (output_dir / ".llmindex-snapshot").exists()
+        assert snapshot.exists()
+
+    def test_default_snapshot_is_outside_output(self, user_cache, tmp_path, monkeypatch):
+        snapshot = default_snapshot_path(tmp_path)
+        assert snapshot.parent == user_cache / "llmindex" / "snapshots"
+        # A cache directory inside the output falls back to a sibling of the output
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "site" / ".cache"))
+        assert default_snapshot_path(tmp_path / "site") == tmp_path / ".site.llmindex-snapshot"
+
+    def test_snapshot_removed_starts_new_baseline(self, config, products, tmp_path):
+        self._build(products, config, tmp_path)
+        self._build(products[1:], config, tmp_path)
+        assert (tmp_path / "llm" / "feed" / "products-delta.jsonl").exists()
+        default_snapshot_path(tmp_path).unlink()
+        result, manifest = self._build(products, config, tmp_path)
+        assert result.delta.path is None
+        assert not (tmp_path / "llm" / "feed" / "products-delta.jsonl").exists()
+        assert "products_jsonl_delta" not in manifest["feeds"]
+
+
+@pytest.mark.usefixtures("user_cache")
+class TestDeltaArchive:
+    """--delta-buckets keeps recent deltas in hourly/daily buckets for static hosts."""
+
+    def _update(self, archive, tmp_path, at, lines=(), clock=None, **result):
+        delta_path = tmp_path / "products-delta.jsonl"
+        delta_path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+        delta = DeltaResult(at, path=str(delta_path), changed=len(lines), **result)
+        archive.update(delta, clock=clock or datetime.fromisoformat(at))
+        return json.loads(archive.index_path.read_text())
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("48h", timedelta(hours=48)), ("7d", timedelta(days=7)), ("2W", timedelta(weeks=2))],
+    )
+    def test_parse_retention(self, value, expected):
+        assert parse_retention(value) == expected
+
+    @pytest.mark.parametrize("value", ["0d", "7", "1.5d", "3m"])
+    def test_parse_retention_rejects(self, value):
+        with pytest.raises(ValueError, match="Invalid retention"):
+            parse_retention(value)
+
+    def test_hourly_buckets_roll_up_and_expire(self, tmp_path):
+        archive = DeltaArchive(str(tmp_path), "hourly", timedelta(days=7))
+        bucket_dir = tmp_path / "llm" / "feed" / "delta"
+        index = self._update(archive, tmp_path, "2026-10-17T09:10:00Z", baseline=True)
+        assert (index["earliest"], index["buckets"]) == ("2026-10-17T09:10:00Z", [])
+
+        a1, a2 = {"id": "A", "price": 1}, {"id": "A", "price": 2}
+        tombstone = {"id": "B", "deleted": True}
+        self._update(archive, tmp_path, "2026-10-17T09:40:00Z", [a1, tombstone])
+        index = self._update(archive, tmp_path, "2026-10-17T09:50:00Z", [a2])
+        [bucket] = index["buckets"]
+        assert (bucket["url"], bucket["start"], bucket["end"], bucket["rows"]) == (
+            "delta/2026-10-17T09.jsonl",
+            "2026-10-17T09:00:00Z",
+            "2026-10-17T10:00:00Z",
+            2,
+        )
+        data = (bucket_dir / "2026-10-17T09.jsonl").read_bytes()
+        assert [json.loads(line) for line in data.splitlines()] == [tombstone, a2]
+        assert (bucket["bytes"], bucket["sha256"]) == (len(data), hashlib.sha256(data).hexdigest())
+
+        self._update(archive, tmp_path, "2026-10-17T11:05:00Z", [{"id": "C"}])
+        # The next day, 2026-10-17's hours are merged into one daily bucket
+        index = self._update(archive, tmp_path, "2026-10-18T08:00:00Z", [{"id": "A", "price": 3}])
+        assert [(b["url"], b["rows"]) for b in index["buckets"]] == [
+            ("delta/2026-10-17.jsonl", 3),
+            ("delta/2026-10-18T08.jsonl", 1),
+        ]
+        assert sorted(p.name for p in bucket_dir.iterdir()) == [
+            "2026-10-17.jsonl",
+            "2026-10-18T08.jsonl",
+        ]
+        assert index["earliest"] == "2026-10-17T09:10:00Z"
+
+        # A week later, the 2026-10-17 bucket is past retention
+        later = datetime(2026, 10, 25, 9, tzinfo=timezone.utc)
+        index = self._update(archive, tmp_path, "2026-10-18T08:00:00Z", clock=later)
+        assert [b["url"] for b in index["buckets"]] == ["delta/2026-10-18.jsonl"]
+        assert index["earliest"] == "2026-10-18T00:00:00Z"
+        assert sorted(p.name for p in bucket_dir.iterdir()) == ["2026-10-18.jsonl"]
+
+    def test_new_baseline_or_granularity_resets(self, tmp_path):
+        archive = DeltaArchive(str(tmp_path), "daily", timedelta(days=7))
+        index = self._update(
+            archive, tmp_path, "2026-10-17T09:00:00Z", [{"id": "A"}], since="2026-10-16T09:00:00Z"
+        )
+        assert index["earliest"] == "2026-10-16T09:00:00Z"
+        assert [b["url"] for b in index["buckets"]] == ["delta/2026-10-17.jsonl"]
+
+        hourly = DeltaArchive(str(tmp_path), "hourly", timedelta(days=7))
+        index = self._update(hourly, tmp_path, "2026-10-17T10:00:00Z", since="2026-10-17T09:00:00Z")
+        assert (index["earliest"], index["buckets"]) == ("2026-10-17T09:00:00Z", [])
+        assert not list((tmp_path / "llm" / "feed" / "delta").iterdir())
+
+    def test_catalog_with_delta_buckets(self, config, products, schema, tmp_path):
+        write_catalog(products, config, str(tmp_path), delta_buckets="daily")
+        result = write_catalog(
+            products[1:], config, str(tmp_path), delta_buckets="daily", precompress=("gzip",)
+        )
+        manifest = json.loads(Path(result.manifest_path).read_text())
+        jsonschema.validate(manifest, schema)
+        assert manifest["feeds"]["products_jsonl_delta_index"] == (
+            "https://test-store.com/llm/feed/delta-index.json"
+        )
+        index = json.loads((tmp_path / "llm" / "feed" / "delta-index.json").read_text())
+        [bucket] = index["buckets"]
+        assert bucket["url"].startswith("https://test-store.com/llm/feed/delta/")
+        path = tmp_path / "llm" / "feed" / "delta" / Path(bucket["url"]).name
+        assert json.loads(path.read_text()) == {
+            "id": products[0].id,
+            "deleted": True,
+            "updated_at": manifest["feed_updated_at"],
+        }
+        assert gzip.decompress(path.with_name(path.name + ".gz").read_bytes()) == path.read_bytes()
+        assert str(path) in result.written
+
+        with pytest.raises(ValueError, match="at least one daily bucket"):
+            write_catalog(
+                products,
+                config,
+                str(tmp_path),
+                delta_buckets="daily",
+                delta_retention=timedelta(hours=2),
+            )
+
+
+class TestCatalogWriter:
+    """write_catalog consumes a product stream once and writes every artifact."""
+
+    def test_single_pass_matches_list_pipeline(self, config, products, tmp_path):
+        result = write_catalog(iter_csv(SAMPLE_CSV), config, str(tmp_path / "stream"))
+        write_pages(products, config, str(tmp_path / "list"))
+        write_feed(products, str(tmp_path / "list"))
+
+        assert result.product_count == 20
+        assert len(result.written) == 6
+        for rel in ("llm/products.md", "llm/feed/products.jsonl"):
+            assert (tmp_path / "stream" / rel).read_text() == (tmp_path / "list" / rel).read_text()
+
+    def test_consumes_iterator_once(self, config, tmp_path):
+        consumed = []
+
+        def stream():
+            for p in iter_csv(SAMPLE_CSV):
+                consumed.append(p.id)
+                yield p
+
+        write_catalog(stream(), config, str(tmp_path))
+        assert len(consumed) == 20
+
+    def test_stream_mode_matches_default(self, config, tmp_path):
+        write_catalog(iter_csv(SAMPLE_CSV), config, str(tmp_path / "default"))
+        write_catalog(iter_csv(SAMPLE_CSV), config, str(tmp_path / "stream"), stream=True)
+        for rel in ("llm/products.md", "llm/feed/products.jsonl"):
+            assert (tmp_path / "stream" / rel).read_text() == (
+                tmp_path / "default" / rel
+            ).read_text()
+        # The spill directory is removed once the page has been written
+        assert not list((tmp_path / "stream").glob(".llmindex-spill-*"))
+
+    def test_records_stats(self, config, tmp_path):
+        path = tmp_path / "products.csv"
+        rows = SAMPLE_CSV.read_text().splitlines()
+        path.write_text("\n".join([*rows, "BAD1,,https://example.com/bad,1,USD"]) + "\n")
+        stats = RunStats()
+        result = write_catalog(
+            iter_csv(path, stats=stats), config, str(tmp_path / "out"), stats=stats
+        )
+        stats.finish()
+
+        assert (stats.rows_parsed, stats.rows_rejected, stats.products) == (21, 1, 20)
+        written = sum(Path(p).stat().st_size for p in result.written)
+        assert stats.bytes_written == written
+        report = stats.report()
+        assert list(report["stages"]) == [
+            "import",
+            "parse",
+            "validate",
+            "serialize",
+            "write",
+            "pages",
+        ]
+        assert all(seconds >= 0 for seconds in report["stages"].values())
+        assert 0 < stats.validate_seconds <= stats.import_seconds <= stats.total_seconds
+        assert report["rows_per_second"] > 0
+
+    def test_empty_stream_writes_no_feed(self, config, tmp_path):
+        result = write_catalog(iter(()), config, str(tmp_path))
+        assert result.feed_path is None
+        assert len(result.written) == 5
+        assert not (tmp_path / "llm" / "feed" / "products.jsonl").exists()
+        manifest = json.loads(Path(result.manifest_path).read_text())
+        assert "feeds" not in manifest
+
+    def test_empty_catalog_removes_previous_feed(self, config, products, tmp_path):
+        feed_dir = tmp_path / "llm" / "feed"
+        write_catalog(products, config, str(tmp_path), precompress=("gzip",))
+        write_catalog(products, config, str(tmp_path), shard_size=ShardSize(5))
+        assert (feed_dir / "feed-index.json").exists()
+
+        write_catalog(iter(()), config, str(tmp_path))
+        assert sorted(p.name for p in feed_dir.iterdir()) == []
+
+    def test_failed_import_leaves_previous_output(self, config, products, tmp_path):
+        out = tmp_path / "out"
+        options = dict(
+            shard_size=ShardSize(5),
+            precompress=("gzip",),
+            delta_buckets="daily",
+            delta_snapshot=str(tmp_path / "snapshot"),
+        )
+        write_catalog(products, config, str(out), **options)
+        write_catalog(products[2:], config, str(out), **options)
+        before = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+
+        def failing():
+            yield from products[:12]
+            raise ValueError("malformed input")
+
+        with pytest.raises(ValueError, match="malformed input"):
+            write_catalog(failing(), config, str(out), **options)
+        after = {p: p.read_bytes() for p in tmp_path.rglob("*") if p.is_file()}
+        assert after == before
+
 
 class TestPagesGenerator:
     def test_writes_four_pages(self, products, config, tmp_path):
@@ -121,6 +688,17 @@ class TestPagesGenerator:
         assert "Shipping" in content
         assert "Return" in content
 
+    def test_spilled_page_matches_in_memory(self, products, config, tmp_path):
+        page = ProductsPage(config, spill_dir=tmp_path, max_buffered=3)
+        for p in products:
+            page.add(p)
+            assert page._buffered < 3
+        assert page.render() == generate_products_page(products, config)
+        assert list(tmp_path.glob("*.md"))
+
+    def test_empty_products_page(self, config):
+        assert generate_products_page([], config) == "# Test Store — Products\n\n"
+
     def test_about_page_has_site_name(self, products, config, tmp_path):
         write_pages(products, config, str(tmp_path))
         content = (tmp_path / "llm" / "about.md").read_text()
@@ -154,3 +732,50 @@ class TestEndToEnd:
         # Verify feed line count
         feed_lines = Path(feed_path).read_text().strip().split("\n")
         assert len(feed_lines) == 20
+
+
+class TestProductTable:
+    def test_feed_and_page_match_list(self, products, config):
+        table = ProductTable(products)
+        assert len(table) == len(products)
+        assert generate_feed(table) == generate_feed(products)
+        assert generate_products_page(table, config) == generate_products_page(products, config)
+
+    def test_rows_behave_like_products(self, products):
+        table = ProductTable(products)
+        assert list(table) == products
+        assert table[-1] == products[-1]
+        assert table[0].to_product() == products[0]
+        with pytest.raises(IndexError):
+            table[len(products)]
+
+    def test_missing_price_and_price_range(self):
+        product = Product(
+            id="P1",
+            title="Bundle",
+            url="https://example.com/p1",
+            price_range=PriceRange(min=1, max=5, currency="USD"),
+            availability="in_stock",
+            updated_at="2026-01-01T00:00:00Z",
+        )
+        row = ProductTable([product])[0]
+        assert row.price is None
+        assert row.price_range == product.price_range
+        assert row.model_dump() == product.model_dump()
+
+    def test_strings_are_dictionary_encoded(self, products):
+        table = ProductTable(products * 50)
+        categories = {p.category for p in products}
+        assert len(table._category.values) == len(categories) + 1  # plus the None slot
+
+    def test_pickle_round_trip(self, products):
+        table = pickle.loads(pickle.dumps(ProductTable(products)))
+        assert list(table) == products
+        table.append(products[0])
+        assert table._brand.codes[-1] == table._brand.codes[0]
+
+    def test_write_catalog_accepts_table(self, products, config, tmp_path):
+        write_catalog(products, config, str(tmp_path / "list"))
+        write_catalog(ProductTable(products), config, str(tmp_path / "table"))
+        for rel in ("llm/feed/products.jsonl", "llm/products.md"):
+            assert (tmp_path / "table" / rel).read_text() == (tmp_path / "list" / rel).read_text()
@@ -1,16 +1,44 @@
-"""Tests for CSV, JSON, and Shopify CSV importers."""
+"""Tests for CSV, JSON, Shopify CSV, Parquet/Arrow and SQLite importers."""
 
+import bz2
+import gzip
+import io
+import itertools
+import json
+import lzma
+import sqlite3
+import types
+from contextlib import closing
 from pathlib import Path
 
 import pytest
 
-from llmindex.importers.csv_importer import import_csv
-from llmindex.importers.json_importer import import_json
-from llmindex.importers.shopify_importer import import_shopify_csv
+from llmindex.importers.arrow_importer import import_arrow, import_parquet
+from llmindex.importers.batch import construct_product, validate_records
+from llmindex.importers.compression import detect_compression, open_source
+from llmindex.importers.csv_importer import compile_row_getter, import_csv, iter_csv
+from llmindex.importers.json_importer import _iter_json_array, import_json, iter_json
+from llmindex.importers.jsonl_importer import import_jsonl, iter_jsonl
+from llmindex.importers.merchant_importer import import_merchant_feed, iter_merchant_feed
+from llmindex.importers.shopify_importer import (
+    _SHOPIFY_COLUMN_MAP,
+    _SHOPIFY_DEFAULTS,
+    import_shopify_csv,
+    iter_shopify_csv,
+)
+from llmindex.importers.shopify_importer import _iter_records as _shopify_records
+from llmindex.importers.sources import iter_products
+from llmindex.importers.sqlite_importer import import_sqlite, iter_sqlite
+from llmindex.llmindex_cli.generators.feed import generate_feed
+from llmindex.llmindex_cli.generators.pages import generate_products_page
+from llmindex.llmindex_cli.models import Product, SiteConfig
+from llmindex.llmindex_cli.validators import validate_products
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+SAMPLE_CSV = PROJECT_ROOT / "llmindex" / "sample_data" / "sample.csv"
 SAMPLE_JSON = PROJECT_ROOT / "llmindex" / "sample_data" / "sample.json"
 SAMPLE_SHOPIFY = PROJECT_ROOT / "llmindex" / "sample_data" / "sample_shopify.csv"
+SAMPLE_MERCHANT = PROJECT_ROOT / "llmindex" / "sample_data" / "sample_merchant.xml"
 
 
 class TestJSONImporter:
@@ -57,6 +85,123 @@ class TestJSONImporter:
         assert products[0].id == "1"
 
 
+class TestIncrementalJSONParser:
+    """The chunked array parser must agree with json.loads at every chunk boundary."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+    def test_matches_json_loads(self, chunk_size):
+        data = [
+            {"id": "1", "nested": {"a": [1, 2, {"b": None}]}, "s": 'é " ] ,'},
+            12345678901234567890,
+            -0.25,
+            1.5e10,
+            1e-7,
+            True,
+            None,
+            "tail",
+        ]
+        for indent in (None, 2):
+            text = json.dumps(data, indent=indent)
+            assert list(_iter_json_array(io.StringIO(text), chunk_size)) == data
+
+    def test_item_larger_than_chunk(self):
+        data = [{"title": "x" * 10_000}, {"title": "y"}]
+        assert list(_iter_json_array(io.StringIO(json.dumps(data)), 16)) == data
+
+    @pytest.mark.parametrize("text", ["[1,2", "[1 2]", "[1,]", "[1] x", ""])
+    def test_malformed_json_raises(self, text):
+        with pytest.raises(ValueError, match="Invalid JSON at offset"):
+            list(_iter_json_array(io.StringIO(text), 2))
+
+    def test_malformed_item_does_not_buffer_whole_file(self):
+        items = ",".join(['{"id": "x"}'] * 10_000)
+        stream = io.StringIO('[{"id": "1"}, {"id" "2"}, ' + items + "]")
+        with pytest.raises(ValueError, match="Expecting ':' delimiter"):
+            list(_iter_json_array(stream, 64))
+        assert stream.tell() < 1000
+
+        # An unterminated string only fails once max_item_chars are buffered
+        stream = io.StringIO('[{"id": "1' + "x" * 100_000 + "}]")
+        with pytest.raises(ValueError, match="no complete element within 1000 characters"):
+            list(_iter_json_array(stream, 64, max_item_chars=1000))
+        assert stream.tell() < 4000
+
+    def test_yields_before_reading_whole_file(self):
+        stream = io.StringIO("[" + ",".join(['{"id": "x"}'] * 1000) + "]")
+        items = _iter_json_array(stream, 64)
+        next(items)
+        assert stream.tell() < 1000
+
+    def test_item_errors_keep_index_and_defaults(self, tmp_path, capsys):
+        path = tmp_path / "mixed.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"id": "1", "title": "A", "url": "https://x.com/a"},
+                    "not an object",
+                    {"id": "", "title": "B", "url": "https://x.com/b"},
+                    {"id": "4", "title": "D", "url": "https://x.com/d", "availability": ""},
+                ]
+            )
+        )
+        products = list(iter_json(path))
+        assert [p.id for p in products] == ["1", "4"]
+        assert all(p.availability == "in_stock" and p.updated_at for p in products)
+        err = capsys.readouterr().err
+        assert "Item 1: expected object, got str" in err
+        assert "Item 2:" in err
+
+
+class TestJSONLImporter:
+    """Test newline-delimited JSON importer."""
+
+    def test_import_jsonl(self, tmp_path):
+        path = tmp_path / "products.jsonl"
+        path.write_text(
+            '{"id": "1", "title": "A", "url": "https://x.com/a", "price": 5, "currency": "EUR"}\n'
+            "\n"
+            '{"id": "2", "title": "B", "url": "https://x.com/b", "availability": "preorder"}\n'
+        )
+        products = import_jsonl(path)
+        assert [p.id for p in products] == ["1", "2"]
+        assert products[0].availability == "in_stock"
+        assert products[0].updated_at
+        assert products[1].availability == "preorder"
+
+    def test_malformed_lines_reported_by_line_number(self, tmp_path, capsys):
+        path = tmp_path / "products.jsonl"
+        path.write_text(
+            '{"id": "1", "title": "A", "url": "https://x.com/a"}\n'
+            "{not json\n"
+            "[1, 2]\n"
+            '{"id": "", "title": "B", "url": "https://x.com/b"}\n'
+            '{"id": "5", "title": "E", "url": "https://x.com/e"}\n'
+        )
+        assert [p.id for p in iter_jsonl(path)] == ["1", "5"]
+        err = capsys.readouterr().err
+        assert "Line 2: invalid JSON" in err
+        assert "Line 3: expected object, got list" in err
+        assert "Line 4:" in err
+
+    def test_feed_round_trip(self, tmp_path):
+        products = import_csv(SAMPLE_CSV)
+        feed = generate_feed(products)
+        path = tmp_path / "products.jsonl"
+        path.write_text(feed, encoding="utf-8")
+        assert generate_feed(import_jsonl(path)) == feed
+
+    def test_price_range_round_trip(self, tmp_path):
+        path = tmp_path / "products.jsonl"
+        path.write_text(
+            '{"id": "1", "title": "A", "url": "https://x.com/a", "availability": "in_stock", '
+            '"updated_at": "2026-01-01T00:00:00Z", '
+            '"price_range": {"min": 1.0, "max": 2.0, "currency": "USD"}}\n'
+        )
+        (product,) = import_jsonl(path)
+        assert product.price_range is not None
+        assert product.price_range.max == 2.0
+
+
 class TestShopifyImporter:
     """Test Shopify CSV export importer."""
 
@@ -66,7 +211,7 @@ class TestShopifyImporter:
         assert len(products) == 4
 
     def test_deduplicates_variants(self):
-        """Shopify exports one row per variant; we take only the first."""
+        """Shopify exports one row per variant; they fold into one product."""
         products = import_shopify_csv(SAMPLE_SHOPIFY, base_url="https://myshop.com")
         handles = [p.url.split("/products/")[-1] for p in products]
         assert len(handles) == len(set(handles)), "Duplicate handles found"
@@ -98,6 +243,202 @@ class TestShopifyImporter:
         assert bag.image_url == "https://cdn.shopify.com/leather-bag.jpg"
 
 
+class TestGoogleMerchantImporter:
+    """Test Google Merchant Center feeds (RSS/Atom XML and TSV)."""
+
+    TSV = (
+        "id\ttitle\tlink\tprice\tavailability\tbrand\tproduct_type\n"
+        "A1\tMug\thttps://x.com/a1\t12.99 USD\tin stock\tAcme\tKitchen\n"
+        "A2\tCup\thttps://x.com/a2\t3.50 EUR\tout of stock\t\t\n"
+    )
+
+    def test_rss(self):
+        products = import_merchant_feed(SAMPLE_MERCHANT)
+        assert [(p.id, p.price, p.currency, p.availability) for p in products] == [
+            ("P001", 129.99, "USD", "in_stock"),
+            ("P002", 89.99, "USD", "preorder"),
+            ("P003", 199.99, "USD", "out_of_stock"),  # backorder
+        ]
+        runner, backpack, jacket = products
+        assert runner.url == "https://acme.com/products/trail-runner-pro"
+        assert runner.image_url == "https://acme.com/img/trail-runner-pro.jpg"
+        assert (runner.brand, runner.category) == ("ACME", "Footwear")
+        assert backpack.category == "Luggage & Bags > Backpacks"
+        assert jacket.image_url is None
+
+    def test_atom(self, tmp_path):
+        path = tmp_path / "feed.xml"
+        path.write_text(
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:g="http://base.google.com/ns/1.0">'
+            "<title>Shop</title><entry>"
+            "<title>Plain</title><g:title>Mug</g:title><g:id>A1</g:id>"
+            '<link rel="self" href="https://x.com/feed"/><link href="https://x.com/a1"/>'
+            "<g:price>12.99 usd</g:price></entry></feed>"
+        )
+        [product] = import_merchant_feed(path)
+        assert (product.id, product.title, product.url) == ("A1", "Mug", "https://x.com/a1")
+        assert (product.price, product.currency, product.availability) == (12.99, "USD", "in_stock")
+
+    def test_tsv(self, tmp_path):
+        path = tmp_path / "feed.tsv"
+        path.write_text(self.TSV.replace("link", "g:Link", 1), encoding="utf-8-sig")
+        mug, cup = import_merchant_feed(path)
+        assert (mug.url, mug.price, mug.currency, mug.brand, mug.category) == (
+            "https://x.com/a1",
+            12.99,
+            "USD",
+            "Acme",
+            "Kitchen",
+        )
+        assert (cup.currency, cup.availability, cup.brand) == ("EUR", "out_of_stock", None)
+
+    def test_compressed_and_stdin(self, tmp_path, monkeypatch):
+        path = tmp_path / "feed.xml.gz"
+        path.write_bytes(gzip.compress(SAMPLE_MERCHANT.read_bytes()))
+        expected = import_merchant_feed(SAMPLE_MERCHANT)
+        assert import_merchant_feed(path) == expected
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(self.TSV.encode())))
+        assert [p.id for p in import_merchant_feed("-")] == ["A1", "A2"]
+
+    def test_bad_items_warn_and_continue(self, tmp_path, capsys):
+        path = tmp_path / "feed.tsv"
+        path.write_text(
+            self.TSV + "A3\tBowl\thttps://x.com/a3\tabout 5\tin stock\t\t\n" + "A4\tPlate\n"
+        )
+        assert [p.id for p in import_merchant_feed(path)] == ["A1", "A2"]
+        err = capsys.readouterr().err
+        assert "[warn] Row 4: invalid price 'about 5'" in err
+        assert "[warn] Row 5: row has fewer columns than the header" in err
+
+    def test_blank_lines_do_not_shift_row_numbers(self, tmp_path, capsys):
+        path = tmp_path / "feed.tsv"
+        path.write_text(self.TSV + "\n\nA3\tBowl\thttps://x.com/a3\tabout 5\tin stock\t\t\n")
+        assert [p.id for p in import_merchant_feed(path)] == ["A1", "A2"]
+        assert "[warn] Row 4: invalid price 'about 5'" in capsys.readouterr().err
+
+    def test_malformed_xml(self, tmp_path):
+        path = tmp_path / "feed.xml"
+        path.write_text("<rss><channel><item><g:id>A1</g:id></item>")
+        with pytest.raises(ValueError, match="Invalid Merchant Center XML"):
+            import_merchant_feed(path)
+
+    def test_items_are_released(self, tmp_path, monkeypatch):
+        """Each parsed item is cleared from the tree, so the channel stays empty."""
+        from xml.etree import ElementTree
+
+        item = "<item><g:id>{0}</g:id><g:title>T</g:title><g:link>https://x.com/{0}</g:link></item>"
+        items = "".join(item.format(i) for i in range(1000))
+        path = tmp_path / "feed.xml"
+        path.write_text(
+            f'<rss xmlns:g="http://base.google.com/ns/1.0"><channel>{items}</channel></rss>'
+        )
+        elements = []
+        iterparse = ElementTree.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            for event, elem in iterparse(*args, **kwargs):
+                elements.append(elem)
+                yield event, elem
+
+        monkeypatch.setattr(ElementTree, "iterparse", recording_iterparse)
+        assert sum(1 for _ in iter_merchant_feed(path, trusted=True)) == 1000
+        channel = elements[1]
+        assert channel.tag == "channel" and len(channel) == 0
+
+
+class TestShopifyVariantAggregation:
+    """Test folding of Shopify variant rows into one product."""
+
+    HEADER = (
+        "Handle,Title,Vendor,Variant SKU,Variant Price,Status,"
+        "Variant Inventory Qty,Variant Inventory Policy\n"
+    )
+
+    def test_price_range_from_variants(self):
+        products = import_shopify_csv(SAMPLE_SHOPIFY, base_url="https://myshop.com")
+        bag = next(p for p in products if p.id == "CLB-001")
+        assert bag.price is None and bag.currency is None
+        assert (bag.price_range.min, bag.price_range.max) == (149.99, 169.99)
+        assert bag.price_range.currency == "USD"
+        scarf = next(p for p in products if p.id == "WS-001")
+        assert (scarf.price, scarf.currency, scarf.price_range) == (45.0, "USD", None)
+        assert validate_products(products).valid
+
+    def test_in_stock_if_any_variant_is(self, tmp_path):
+        path = tmp_path / "shopify.csv"
+        path.write_text(
+            self.HEADER + "a,A,V,A-1,10,active,0,deny\n"
+            "a,,,A-2,12,active,3,deny\n"
+            "b,B,V,B-1,10,active,0,deny\n"
+            "b,,,B-2,10,active,0,deny\n"
+            "c,C,V,C-1,10,active,0,continue\n"
+            "d,D,V,D-1,10,draft,5,deny\n"
+        )
+        availability = {p.id: p.availability for p in import_shopify_csv(path)}
+        assert availability == {
+            "A-1": "in_stock",
+            "B-1": "out_of_stock",
+            "C-1": "in_stock",
+            "D-1": "out_of_stock",
+        }
+
+    def test_image_row_is_not_a_variant(self, tmp_path):
+        path = tmp_path / "shopify.csv"
+        path.write_text(
+            "Handle,Title,Variant SKU,Variant Price,Variant Inventory Qty,"
+            "Variant Inventory Policy,Image Src\n"
+            "tee,Tee,T-S,20,0,deny,https://x/1.jpg\n"
+            "tee,,T-M,22,0,deny,\n"
+            "tee,,,,,,https://x/2.jpg\n"
+        )
+        [product] = import_shopify_csv(path)
+        assert product.availability == "out_of_stock"
+        assert (product.price_range.min, product.price_range.max) == (20.0, 22.0)
+        assert product.image_url == "https://x/1.jpg"
+
+    def test_bad_variant_row_warns(self, tmp_path, capsys):
+        path = tmp_path / "shopify.csv"
+        path.write_text(
+            self.HEADER + "a,A,V,A-1,10,active,,\na,,,A-2,abc,active,,\na,,,A-3,14,active,,\n"
+        )
+        [product] = import_shopify_csv(path)
+        assert (product.price_range.min, product.price_range.max) == (10.0, 14.0)
+        assert "Row 3:" in capsys.readouterr().err
+
+    def test_bad_first_variant_rejects_handle(self, tmp_path, capsys):
+        path = tmp_path / "shopify.csv"
+        path.write_text(self.HEADER + "bag,Bag,V,SKU1,abc,active,,\nbag,,,SKU2,12,active,,\n")
+        assert import_shopify_csv(path) == []
+        assert "Row 2:" in capsys.readouterr().err
+
+    def test_streams_one_handle_at_a_time(self):
+        def rows():
+            for i in itertools.count():
+                consumed.append(i)
+                yield [f"h{i // 3}", f"T{i}" if i % 3 == 0 else "", "V", f"S{i}", "1.00"]
+
+        consumed: list[int] = []
+        records = _shopify_records(
+            rows(),
+            compile_row_getter(
+                ["Handle", "Title", "Vendor", "Variant SKU", "Variant Price"],
+                list(_SHOPIFY_COLUMN_MAP),
+                _SHOPIFY_DEFAULTS,
+            ),
+            "https://example.com",
+            "USD",
+            "2026-01-01T00:00:00Z",
+        )
+        row_num, record = next(records)
+        assert (row_num, record["id"]) == (2, "S0")
+        assert consumed == [0, 1, 2, 3]  # flushed as soon as the next handle starts
+
+    def test_products_page_renders_range(self):
+        config = SiteConfig(name="Shop", canonical_url="https://myshop.com")
+        page = generate_products_page(import_shopify_csv(SAMPLE_SHOPIFY), config)
+        assert "USD 149.99–169.99" in page
+
+
 class TestCSVImporterBoundaries:
     """Boundary tests for the standard products CSV importer."""
 
@@ -123,3 +464,344 @@ class TestCSVImporterBoundaries:
         products = import_csv(csv_file)
         assert len(products) == 2
         assert [p.id for p in products] == ["P001", "P001"]
+
+
+class TestStreamingImporters:
+    """The iter_* variants yield the same products as import_* without building a list."""
+
+    def test_iter_csv_is_generator(self):
+        products = iter_csv(SAMPLE_CSV)
+        assert isinstance(products, types.GeneratorType)
+        assert list(products) == import_csv(SAMPLE_CSV)
+
+    def test_iter_json_matches_import_json(self):
+        assert list(iter_json(SAMPLE_JSON)) == import_json(SAMPLE_JSON)
+
+    def test_iter_shopify_matches_import_shopify(self):
+        streamed = list(iter_shopify_csv(SAMPLE_SHOPIFY, base_url="https://myshop.com"))
+        assert [p.id for p in streamed] == [
+            p.id for p in import_shopify_csv(SAMPLE_SHOPIFY, base_url="https://myshop.com")
+        ]
+
+    def test_iter_csv_is_lazy(self):
+        first = next(iter_csv(SAMPLE_CSV))
+        assert first.id == "P001"
+
+    def test_bad_rows_warn_and_continue(self, tmp_path, capsys):
+        csv_file = tmp_path / "mixed.csv"
+        csv_file.write_text(
+            "id,title,url,price,currency,availability,updated_at\n"
+            "P001,Good,https://example.com/p1,10.00,USD,in_stock,2026-01-01T00:00:00Z\n"
+            "P002,Bad,https://example.com/p2,abc,USD,in_stock,2026-01-01T00:00:00Z\n"
+            "P003,Good,https://example.com/p3,12.00,USD,in_stock,2026-01-01T00:00:00Z\n"
+        )
+        assert [p.id for p in iter_csv(csv_file)] == ["P001", "P003"]
+        assert "Row 3:" in capsys.readouterr().err
+
+    def test_dispatch_by_source_type(self):
+        assert [p.id for p in iter_products(SAMPLE_JSON, "json")] == ["J001", "J002", "J003"]
+
+    def test_dispatch_unknown_source_type(self):
+        with pytest.raises(ValueError, match="Unknown source type"):
+            iter_products(SAMPLE_JSON, "xml")
+
+
+class TestBatchValidation:
+    """Test block-wise validation shared by the importers."""
+
+    RECORDS = [
+        (1, {"id": "P1", "title": "A", "url": "https://e.com/1", "availability": "In Stock",
+             "updated_at": "2026-01-01T00:00:00Z"}),
+        (2, ValueError("could not parse")),
+        (3, {"id": "", "title": "B", "url": "https://e.com/3", "availability": "in_stock",
+             "updated_at": "2026-01-01T00:00:00Z"}),
+        (4, {"id": "P4", "title": "D", "url": "https://e.com/4", "availability": "preorder",
+             "updated_at": "2026-01-01T00:00:00Z", "price": 2}),
+    ]  # fmt: skip
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 1024])
+    def test_matches_per_record_validation(self, batch_size):
+        warnings = []
+        products = list(
+            validate_records(
+                self.RECORDS,
+                lambda ref, exc: warnings.append((ref, str(exc))),
+                batch_size=batch_size,
+            )
+        )
+        assert [p.id for p in products] == ["P1", "P4"]
+        assert products[0].availability == "in_stock"
+        with pytest.raises(Exception) as excinfo:
+            Product(**self.RECORDS[2][1])
+        assert warnings == [(2, "could not parse"), (3, str(excinfo.value))]
+
+    def test_trusted_matches_validated(self):
+        products = import_csv(SAMPLE_CSV)
+        feed = [json.loads(line) for line in generate_feed(products).splitlines()]
+        assert [construct_product(item) for item in feed] == products
+
+    def test_trusted_price_range(self):
+        product = construct_product(
+            {"id": "P1", "price_range": {"min": 1.0, "max": 2.0, "currency": "USD"}, "extra": 1}
+        )
+        assert product.price_range.max == 2.0
+        assert "extra" not in product.model_dump()
+
+    def test_trusted_import_jsonl(self, tmp_path):
+        path = tmp_path / "products.jsonl"
+        path.write_text(generate_feed(import_csv(SAMPLE_CSV)), encoding="utf-8")
+        assert import_jsonl(path, trusted=True) == import_jsonl(path)
+
+    def test_fallback_timestamp_computed_once(self, tmp_path):
+        path = tmp_path / "products.csv"
+        rows = "".join(f"P{i},T,https://e.com/{i},in_stock,\n" for i in range(3000))
+        path.write_text("id,title,url,availability,updated_at\n" + rows)
+        assert len({p.updated_at for p in import_csv(path)}) == 1
+
+
+_COMPRESSORS = {
+    "gzip": (".gz", gzip.compress),
+    "bz2": (".bz2", bz2.compress),
+    "xz": (".xz", lzma.compress),
+}
+
+
+class TestCompressedInput:
+    """Test transparent decompression of product sources."""
+
+    @pytest.mark.parametrize("codec", sorted(_COMPRESSORS))
+    @pytest.mark.parametrize(
+        "source, importer",
+        [
+            (SAMPLE_CSV, import_csv),
+            (SAMPLE_JSON, import_json),
+            (SAMPLE_SHOPIFY, import_shopify_csv),
+        ],
+    )
+    def test_matches_plain_input(self, tmp_path, codec, source, importer):
+        suffix, compress = _COMPRESSORS[codec]
+        path = tmp_path / (source.name + suffix)
+        path.write_bytes(compress(source.read_bytes()))
+        assert detect_compression(path) == codec
+        plain = [p.model_dump(exclude={"updated_at"}) for p in importer(source)]
+        assert [p.model_dump(exclude={"updated_at"}) for p in importer(path)] == plain
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / "products.jsonl.gz"
+        path.write_bytes(gzip.compress(generate_feed(import_csv(SAMPLE_CSV)).encode()))
+        assert import_jsonl(path) == import_csv(SAMPLE_CSV)
+
+    def test_detects_magic_bytes_without_extension(self, tmp_path):
+        path = tmp_path / "products.csv"
+        path.write_bytes(bz2.compress(SAMPLE_CSV.read_bytes()))
+        assert detect_compression(path) == "bz2"
+        assert detect_compression(SAMPLE_CSV) is None
+        assert import_csv(path) == import_csv(SAMPLE_CSV)
+
+    def test_parallel_csv_falls_back_to_sequential(self, tmp_path):
+        path = tmp_path / "products.csv.gz"
+        path.write_bytes(gzip.compress(SAMPLE_CSV.read_bytes()))
+        assert import_csv(path, workers=2) == import_csv(SAMPLE_CSV)
+
+    def test_zstd(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "products.json.zst"
+        path.write_bytes(zstandard.ZstdCompressor().compress(SAMPLE_JSON.read_bytes()))
+        assert detect_compression(path) == "zstd"
+        with open_source(path, encoding="utf-8") as f:
+            assert f.read() == SAMPLE_JSON.read_text(encoding="utf-8")
+        assert len(import_json(path)) == 3
+
+
+class TestStdinInput:
+    """Test reading a product source from standard input ("-")."""
+
+    @staticmethod
+    def _stdin(monkeypatch, data: bytes) -> None:
+        monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(data)))
+
+    @pytest.mark.parametrize("compress", [lambda b: b, gzip.compress, lzma.compress])
+    def test_csv(self, monkeypatch, compress):
+        self._stdin(monkeypatch, compress(SAMPLE_CSV.read_bytes()))
+        assert import_csv("-", workers=2) == import_csv(SAMPLE_CSV)
+
+    def test_jsonl(self, monkeypatch):
+        self._stdin(monkeypatch, generate_feed(import_csv(SAMPLE_CSV)).encode())
+        assert import_jsonl("-") == import_csv(SAMPLE_CSV)
+
+    def test_arrow_engine_rejects_stdin(self, monkeypatch):
+        self._stdin(monkeypatch, SAMPLE_CSV.read_bytes())
+        with pytest.raises(ValueError, match="cannot read standard input"):
+            list(iter_csv("-", engine="arrow"))
+
+
+class TestArrowImporter:
+    """Test Parquet and Arrow IPC input."""
+
+    @pytest.fixture
+    def table(self):
+        pa_csv = pytest.importorskip("pyarrow.csv")
+        return pa_csv.read_csv(SAMPLE_CSV)
+
+    def test_parquet_matches_csv(self, tmp_path, table):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "products.parquet"
+        pq.write_table(table, path, row_group_size=7)
+        assert import_parquet(path) == import_csv(SAMPLE_CSV)
+
+    @pytest.mark.parametrize("fmt", ["file", "stream"])
+    def test_ipc_matches_csv(self, tmp_path, table, fmt):
+        import pyarrow as pa
+
+        path = tmp_path / "products.arrow"
+        writer = pa.ipc.new_file if fmt == "file" else pa.ipc.new_stream
+        with writer(path, table.schema) as w:
+            w.write_table(table, max_chunksize=5)
+        assert import_arrow(path) == import_csv(SAMPLE_CSV)
+
+    def test_feather(self, tmp_path, table):
+        import pyarrow.feather as feather
+
+        path = tmp_path / "products.feather"
+        feather.write_feather(table, path)
+        assert list(iter_products(path, "arrow", "", "USD")) == import_csv(SAMPLE_CSV)
+
+    def test_types_and_defaults(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        table = pa.table(
+            {
+                "sku": ["A1", "A2"],
+                "title": ["One", "Two"],
+                "url": ["https://x.com/1", "https://x.com/2"],
+                "price": pa.array([10, None], pa.int64()),
+                "brand": pa.array(["Acme", ""]).dictionary_encode(),
+                "availability": [None, "Out of stock"],
+                "updated_at": pa.array(
+                    [1_700_000_000_123, None], pa.timestamp("ms", tz="Europe/Paris")
+                ),
+                "ignored": [1, 2],
+            }
+        )
+        path = tmp_path / "products.parquet"
+        pq.write_table(table, path)
+        first, second = import_parquet(path, columns={"id": "sku"})
+        assert (first.id, first.price, first.brand) == ("A1", 10.0, "Acme")
+        assert (first.availability, first.updated_at) == ("in_stock", "2023-11-14T22:13:20Z")
+        assert (second.price, second.brand, second.availability) == (None, None, "out_of_stock")
+        assert second.updated_at.endswith("Z")
+
+    def test_missing_mapped_column(self, tmp_path, table):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "products.parquet"
+        pq.write_table(table, path)
+        with pytest.raises(ValueError, match="Column 'sku'"):
+            import_parquet(path, columns={"id": "sku"})
+
+    def test_bad_rows_warn_and_continue(self, tmp_path, capsys):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        table = pa.table(
+            {
+                "id": ["A1", "A2", "A3"],
+                "title": ["One", "Two", "Three"],
+                "url": ["https://x.com/1", "https://x.com/2", "https://x.com/3"],
+                "price": ["1.50", "abc", "-1"],
+                "currency": ["USD", "USD", "USD"],
+            }
+        )
+        path = tmp_path / "products.parquet"
+        pq.write_table(table, path)
+        assert [p.id for p in import_parquet(path)] == ["A1"]
+        err = capsys.readouterr().err
+        assert "[warn] Row 2:" in err
+        assert "[warn] Row 3:" in err
+
+    def test_trusted_matches_validated(self, tmp_path, table):
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "products.parquet"
+        pq.write_table(table, path)
+        assert import_parquet(path, trusted=True) == import_parquet(path)
+
+
+def _sqlite_from_csv(path: Path, table: str = "products") -> Path:
+    import csv
+
+    with SAMPLE_CSV.open(newline="", encoding="utf-8") as f:
+        header, *rows = list(csv.reader(f))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(f"CREATE TABLE {table} ({', '.join(header)})")
+        placeholders = ", ".join("?" * len(header))
+        conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+    return path
+
+
+class TestSQLiteImporter:
+    """Test the SQLite query importer."""
+
+    def test_matches_csv(self, tmp_path):
+        db = _sqlite_from_csv(tmp_path / "products.db")
+        expected = [p.model_dump(exclude={"updated_at"}) for p in import_csv(SAMPLE_CSV)]
+        products = import_sqlite(db)
+        assert [p.model_dump(exclude={"updated_at"}) for p in products] == expected
+        assert list(iter_products(db, "sqlite")) == products
+
+    def test_query_aliases_and_column_mapping(self, tmp_path):
+        db = tmp_path / "shop.db"
+        with closing(sqlite3.connect(db)) as conn, conn:
+            conn.execute("CREATE TABLE items (sku INTEGER, name TEXT, link TEXT, cost REAL)")
+            conn.execute("INSERT INTO items VALUES (7, 'Widget', 'https://x.com/w', 2.5)")
+            conn.execute("INSERT INTO items VALUES (8, 'Hidden', 'https://x.com/h', 1)")
+        query = "SELECT sku AS id, name AS title, link, cost FROM items WHERE sku < 8"
+        [product] = import_sqlite(db, query=query, columns={"url": "link", "price": "cost"})
+        assert (product.id, product.title, product.url) == ("7", "Widget", "https://x.com/w")
+        assert (product.price, product.availability) == (2.5, "in_stock")
+
+        with pytest.raises(ValueError, match="Column 'nope'"):
+            import_sqlite(db, query=query, columns={"url": "nope"})
+
+    def test_streams_without_loading_result(self, tmp_path):
+        db = tmp_path / "empty.db"
+        sqlite3.connect(db).close()
+        # An effectively unbounded result: only the rows consumed are ever fetched
+        query = (
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) "
+            "SELECT i AS id, 'T' AS title, 'https://x.com/' || i AS url FROM n"
+        )
+        first = list(itertools.islice(iter_sqlite(db, query=query), 3))
+        assert [p.id for p in first] == ["1", "2", "3"]
+
+    def test_bad_rows_warn_and_continue(self, tmp_path, capsys):
+        db = tmp_path / "products.db"
+        with closing(sqlite3.connect(db)) as conn, conn:
+            conn.execute("CREATE TABLE products (id, title, url, price)")
+            conn.executemany(
+                "INSERT INTO products VALUES (?, ?, ?, ?)",
+                [
+                    ("A", "a", "https://x.com/a", 1),
+                    ("B", "", "https://x.com/b", 1),
+                    ("C", "c", "https://x.com/c", "abc"),
+                    ("D", "d", "https://x.com/d", "4.5"),
+                ],
+            )
+        assert [(p.id, p.price) for p in import_sqlite(db)] == [("A", 1.0), ("D", 4.5)]
+        err = capsys.readouterr().err
+        assert "[warn] Row 2:" in err
+        assert "[warn] Row 3:" in err
+
+    @pytest.mark.parametrize("query", ["SELECT * FROM missing", "SELEC 1"])
+    def test_query_errors(self, tmp_path, query):
+        db = _sqlite_from_csv(tmp_path / "products.db")
+        with pytest.raises(ValueError, match="SQLite query failed"):
+            import_sqlite(db, query=query)
+
+    def test_read_only(self, tmp_path):
+        db = _sqlite_from_csv(tmp_path / "products.db")
+        with pytest.raises(ValueError, match="SQLite query failed"):
+            import_sqlite(db, query="DELETE FROM products RETURNING *")
+        assert len(import_sqlite(db)) == 20
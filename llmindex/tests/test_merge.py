@@ -0,0 +1,80 @@
+"""Tests for merging several product sources."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from llmindex.importers.csv_importer import import_csv
+from llmindex.importers.merge import merge_products
+from llmindex.llmindex_cli.models import Product, ProductTable
+
+SAMPLE_CSV = Path(__file__).resolve().parent.parent / "sample_data" / "sample.csv"
+
+
+def _product(id_: str, title: str, updated_at: str = "2026-01-01T00:00:00Z") -> Product:
+    return Product(
+        id=id_,
+        title=title,
+        url=f"https://example.com/{id_}",
+        availability="in_stock",
+        updated_at=updated_at,
+    )
+
+
+def _titles(products) -> list[tuple[str, str]]:
+    return [(p.id, p.title) for p in products]
+
+
+class TestMergeProducts:
+    def test_last_wins_keeps_first_appearance_order(self):
+        base = [_product("A", "a1"), _product("B", "b1"), _product("C", "c1")]
+        update = [_product("D", "d2"), _product("B", "b2"), _product("B", "b3")]
+        merged = merge_products([base, update])
+        assert _titles(merged) == [("A", "a1"), ("B", "b3"), ("C", "c1"), ("D", "d2")]
+
+    def test_newest_wins_by_updated_at(self):
+        base = [
+            _product("A", "a-new", "2026-03-01T00:00:00Z"),
+            _product("B", "b-old", "2026-01-01T00:00:00Z"),
+        ]
+        update = [
+            _product("A", "a-old", "2026-02-01T00:00:00Z"),
+            # 2026-01-01T00:30:00Z, despite sorting lower as a string
+            _product("B", "b-new", "2026-01-01T01:30:00+01:00"),
+            _product("C", "c-unparsed", "yesterday"),
+        ]
+        merged = merge_products([base, update], "newest")
+        assert _titles(merged) == [("A", "a-new"), ("B", "b-new"), ("C", "c-unparsed")]
+
+    def test_newest_tie_goes_to_last(self):
+        merged = merge_products([[_product("A", "first")], [_product("A", "second")]], "newest")
+        assert _titles(merged) == [("A", "second")]
+
+    @pytest.mark.parametrize("policy", ["last-wins", "newest"])
+    @pytest.mark.parametrize("max_in_memory", [1, 2, 3, 7])
+    def test_external_merge_matches_in_memory(self, tmp_path, policy, max_in_memory):
+        products = import_csv(SAMPLE_CSV)
+        base = products[:14]
+        update = [
+            p.model_copy(update={"title": p.title + " v2", "updated_at": "2026-01-01T00:00:00Z"})
+            for p in reversed(products[6:])
+        ]
+        expected = list(merge_products([base, update], policy))
+        merged = list(
+            merge_products([base, update], policy, max_in_memory=max_in_memory, tmp_dir=tmp_path)
+        )
+        assert merged == expected
+        assert len(merged) == len(products)
+        assert list(tmp_path.iterdir()) == []  # run files removed
+
+    def test_accepts_product_table_rows(self):
+        products = import_csv(SAMPLE_CSV)
+        table = ProductTable(products)
+        merged = list(merge_products([table, products[:2]], max_in_memory=5))
+        assert merged == products
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="Unknown merge policy"):
+            list(merge_products([], "first-wins"))
@@ -0,0 +1,294 @@
+"""Tests for the sitemap / JSON-LD site crawler, against a local HTTP server."""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from llmindex.importers.site_importer import (
+    CrawlCounts,
+    ResponseCache,
+    SitemapEntry,
+    extract_jsonld_products,
+    iter_site,
+    iter_sitemap,
+    product_record,
+)
+from llmindex.llmindex_cli.main import app
+
+pytest.importorskip("httpx")
+
+
+def _page(*documents: object) -> bytes:
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(d)}</script>' for d in documents
+    )
+    return f"<html><head>{scripts}</head><body><h1>x</h1></body></html>".encode()
+
+
+def _product(sku: str, price: float = 10.0, **extra: object) -> dict:
+    return {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "sku": sku,
+        "name": f"Product {sku}",
+        "offers": {
+            "@type": "Offer",
+            "price": str(price),
+            "priceCurrency": "usd",
+            "availability": "https://schema.org/InStock",
+        },
+        **extra,
+    }
+
+
+def _urlset(base: str, paths: list[str], lastmod: str = "") -> bytes:
+    mod = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+    urls = "".join(f"<url><loc>{base}{p}</loc>{mod}</url>" for p in paths)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+    ).encode()
+
+
+class _Site:
+    """A stand-in web site: path -> body, with ETags and a request log."""
+
+    def __init__(self) -> None:
+        self.pages: dict[str, bytes] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.latency = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with site.lock:
+                    site.requests.append((self.path, self.headers.get("If-None-Match", "")))
+                    site.in_flight += 1
+                    site.max_in_flight = max(site.max_in_flight, site.in_flight)
+                try:
+                    time.sleep(site.latency)
+                    body = site.pages.get(self.path)
+                    if body is None:
+                        self.send_error(404)
+                        return
+                    etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with site.lock:
+                        site.in_flight -= 1
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.requests]
+
+
+@pytest.fixture
+def site():
+    site = _Site()
+    thread = threading.Thread(target=site.server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield site
+    site.server.shutdown()
+    site.server.server_close()
+
+
+@pytest.fixture
+def shop(site):
+    """Sitemap index -> two sitemaps (one gzipped) -> three product pages and a blog post."""
+    site.pages["/sitemap.xml"] = (
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<sitemap><loc>/sitemap-products.xml</loc></sitemap>"
+        f"<sitemap><loc>{site.base}/sitemap-more.xml.gz</loc></sitemap>"
+        "</sitemapindex>"
+    ).encode()
+    site.pages["/sitemap-products.xml"] = _urlset(site.base, ["/p/a", "/p/b"])
+    site.pages["/sitemap-more.xml.gz"] = gzip.compress(_urlset(site.base, ["/p/c", "/blog"]))
+    site.pages["/p/a"] = _page(_product("A", 5.0, image={"@type": "ImageObject", "url": "/a.jpg"}))
+    site.pages["/p/b"] = _page({"@graph": [{"@type": "WebPage"}, _product("B", 7.5)]})
+    site.pages["/p/c"] = _page(_product("C", 9.0))
+    site.pages["/blog"] = b"<html><body>No products here</body></html>"
+    return site
+
+
+class TestSitemap:
+    def test_urlset_and_index(self):
+        data = _urlset("https://x.com", ["/a", "/b"], lastmod="2026-02-01")
+        assert list(iter_sitemap(gzip.compress(data))) == [
+            SitemapEntry("url", "https://x.com/a", "2026-02-01"),
+            SitemapEntry("url", "https://x.com/b", "2026-02-01"),
+        ]
+        index = b"<sitemapindex><sitemap><loc>https://x.com/s1.xml</loc></sitemap></sitemapindex>"
+        assert list(iter_sitemap(index)) == [SitemapEntry("sitemap", "https://x.com/s1.xml")]
+
+    def test_malformed(self):
+        with pytest.raises(ValueError, match="Invalid sitemap"):
+            list(iter_sitemap(b"<urlset><url><loc>x</loc>"))
+
+
+class TestJSONLD:
+    def test_extracts_products_only(self):
+        html = _page(
+            {"@type": "Organization", "name": "Shop"},
+            {"@type": "ItemPage", "mainEntity": _product("A")},
+        ).decode()
+        html += '<script type="application/ld+json">{not json</script>'
+        assert [p["sku"] for p in extract_jsonld_products(html)] == ["A"]
+
+    def test_product_record(self):
+        node = {
+            "@type": ["Product", "Thing"],
+            "productID": "P-1",
+            "name": "Mug",
+            "url": "/mug",
+            "image": ["https://cdn.x.com/mug.jpg"],
+            "brand": {"@type": "Brand", "name": "Acme"},
+            "category": "Kitchen",
+            "offers": {
+                "@type": "AggregateOffer",
+                "lowPrice": 4,
+                "highPrice": "6.50",
+                "priceCurrency": "EUR",
+                "offers": [
+                    {"availability": "https://schema.org/OutOfStock"},
+                    {"availability": "http://schema.org/PreOrder"},
+                ],
+            },
+        }
+        record = product_record(node, "https://x.com/p/1", "2026-01-01T00:00:00Z")
+        assert record["id"] == "P-1"
+        assert record["url"] == "https://x.com/mug"
+        assert record["image_url"] == "https://cdn.x.com/mug.jpg"
+        assert (record["brand"], record["category"]) == ("Acme", "Kitchen")
+        assert record["price"] is None
+        assert record["price_range"] == {"min": 4.0, "max": 6.5, "currency": "EUR"}
+        assert record["availability"] == "preorder"
+
+    def test_defaults_to_page_url(self):
+        record = product_record({"name": "Mug"}, "https://x.com/p/1", "t")
+        assert (record["id"], record["url"], record["price"]) == (
+            "https://x.com/p/1",
+            "https://x.com/p/1",
+            None,
+        )
+        assert record["availability"] == "in_stock"
+
+
+class TestCrawl:
+    def test_crawl(self, shop, capsys):
+        counts = CrawlCounts()
+        products = list(iter_site(f"{shop.base}/sitemap.xml", counts=counts))
+        assert [(p.id, p.price, p.currency) for p in products] == [
+            ("A", 5.0, "USD"),
+            ("B", 7.5, "USD"),
+            ("C", 9.0, "USD"),
+        ]
+        assert products[0].image_url == f"{shop.base}/a.jpg"
+        assert products[0].url == f"{shop.base}/p/a"
+        assert (counts.sitemaps, counts.pages, counts.fetched) == (3, 4, 7)
+        # A page without products is counted, not reported as a rejected record
+        assert counts.no_products == 1
+        assert "/blog" not in capsys.readouterr().err
+
+    def test_streams_products_while_crawling(self, site):
+        paths = [f"/p/{i}" for i in range(12)]
+        site.pages["/sitemap.xml"] = _urlset(site.base, paths)
+        for i, path in enumerate(paths):
+            site.pages[path] = _page(_product(str(i)))
+        # trusted: validation would otherwise wait for a full batch of records
+        products = iter_site(f"{site.base}/sitemap.xml", concurrency=1, trusted=True)
+        assert next(products).id == "0"
+        assert len(site.paths()) < 1 + len(paths)
+        products.close()
+
+    def test_recrawl_uses_conditional_requests(self, shop, tmp_path):
+        cache = ResponseCache(tmp_path / "http")
+        first = list(iter_site(f"{shop.base}/sitemap.xml", cache=cache))
+        shop.requests.clear()
+        shop.pages["/p/b"] = _page(_product("B", 8.0))
+
+        counts = CrawlCounts()
+        second = list(iter_site(f"{shop.base}/sitemap.xml", cache=cache, counts=counts))
+        assert [p.price for p in second] == [5.0, 8.0, 9.0]
+        assert [p.id for p in second] == [p.id for p in first]
+        assert all(etag for _, etag in shop.requests)
+        assert (counts.fetched, counts.not_modified) == (1, 6)
+
+    def test_lastmod_skips_request(self, site, tmp_path):
+        site.pages["/sitemap.xml"] = _urlset(site.base, ["/p/a"], lastmod="2020-01-01")
+        site.pages["/p/a"] = _page(_product("A"))
+        cache = ResponseCache(tmp_path / "http")
+        list(iter_site(f"{site.base}/sitemap.xml", cache=cache))
+        site.requests.clear()
+
+        counts = CrawlCounts()
+        [product] = iter_site(f"{site.base}/sitemap.xml", cache=cache, counts=counts)
+        assert product.id == "A"
+        assert product.updated_at == "2020-01-01T00:00:00Z"
+        assert site.paths() == ["/sitemap.xml"]
+        assert counts.cached == 1
+
+    def test_per_host_limit(self, site):
+        paths = [f"/p/{i}" for i in range(12)]
+        site.pages["/sitemap.xml"] = _urlset(site.base, paths)
+        for i, path in enumerate(paths):
+            site.pages[path] = _page(_product(str(i)))
+        site.latency = 0.05
+        products = list(iter_site(f"{site.base}/sitemap.xml", concurrency=8, per_host=3))
+        assert [p.id for p in products] == [str(i) for i in range(12)]
+        assert 1 < site.max_in_flight <= 3
+
+    def test_limit_and_failures(self, shop, capsys):
+        counts = CrawlCounts()
+        shop.pages.pop("/p/b")
+        products = list(iter_site(f"{shop.base}/sitemap.xml", limit=2, counts=counts))
+        assert [p.id for p in products] == ["A"]
+        assert (counts.pages, counts.failed) == (2, 1)
+        assert f"[warn] Page {shop.base}/p/b: " in capsys.readouterr().err
+
+    def test_missing_sitemap(self, site):
+        with pytest.raises(ValueError, match="Could not fetch sitemap"):
+            list(iter_site(f"{site.base}/sitemap.xml"))
+
+
+class TestImportSiteCommand:
+    def test_writes_jsonl(self, shop, tmp_path):
+        out = tmp_path / "products.jsonl"
+        runner = CliRunner(mix_stderr=False)
+        args = ["import-site", "--sitemap", f"{shop.base}/sitemap.xml", "-o", str(out)]
+        result = runner.invoke(app, [*args, "--cache-dir", str(tmp_path / "cache")])
+        assert result.exit_code == 0, result.stderr
+        assert [json.loads(line)["id"] for line in out.read_text().splitlines()] == ["A", "B", "C"]
+        assert "7 fetched, 0 not modified" in result.stderr
+        assert "Wrote 3 products to" in result.stderr
+
+        result = runner.invoke(app, [*args, "--cache-dir", str(tmp_path / "cache")])
+        assert "0 fetched, 7 not modified" in result.stderr
+
+    def test_rejects_non_http_sitemap(self, tmp_path: Path):
+        result = CliRunner(mix_stderr=False).invoke(
+            app, ["import-site", "--sitemap", str(tmp_path / "sitemap.xml")]
+        )
+        assert result.exit_code == 1
+        assert "--sitemap must be an http(s) URL" in result.stderr
@@ -6,11 +6,22 @@ from pathlib import Path
 
 import pytest
 
-from llmindex.llmindex_cli.validators import validate_all, validate_feed, validate_manifest
+from llmindex.importers.csv_importer import import_csv
+from llmindex.llmindex_cli.generators.catalog import write_catalog
+from llmindex.llmindex_cli.generators.feed import ShardSize
+from llmindex.llmindex_cli.models import Product, ProductTable, SiteConfig
+from llmindex.llmindex_cli.validators import (
+    validate_all,
+    validate_feed,
+    validate_feed_index,
+    validate_manifest,
+    validate_products,
+)
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 EXAMPLES_DIR = PROJECT_ROOT / "spec" / "examples"
 TEST_VECTORS_DIR = PROJECT_ROOT / "spec" / "test-vectors"
+SAMPLE_CSV = PROJECT_ROOT / "llmindex" / "sample_data" / "sample.csv"
 
 
 class TestManifestValidation:
@@ -114,6 +125,26 @@ class TestFeedValidation:
         assert not result.valid
 
 
+class TestProductsValidation:
+    """Test validation of in-memory products."""
+
+    def test_valid_products(self):
+        products = import_csv(SAMPLE_CSV)
+        for source in (products, ProductTable(products)):
+            result = validate_products(source)
+            assert result.valid, f"Errors: {result.errors}"
+            assert "Validated 20 products" in result.warnings
+
+    def test_invalid_product(self):
+        product = Product.model_construct(
+            id="P1", title="Bad", url="https://example.com/p1", availability="sold",
+            updated_at="2026-01-01T00:00:00Z",
+        )  # fmt: skip
+        result = validate_products(ProductTable([product]))
+        assert not result.valid
+        assert result.errors[0].startswith("Product 1 (P1): availability")
+
+
 class TestValidateAll:
     """Test combined manifest + feed validation."""
 
@@ -153,6 +184,26 @@ class TestValidateAll:
         assert any("File not found" in e for e in result.errors)
         assert sum(e.startswith("Schema:") for e in result.errors) >= 2
 
+    def test_sharded_feed(self, tmp_path):
+        config = SiteConfig(name="S", canonical_url="https://example.com", topics=["t"])
+        result = write_catalog(
+            import_csv(SAMPLE_CSV), config, str(tmp_path), shard_size=ShardSize(6)
+        )
+        combined = validate_all(result.manifest_path)
+        assert combined.valid, f"Errors: {combined.errors}"
+        assert any(w.endswith("feed-index.json") for w in combined.warnings)
+        assert "Validated 20 product lines in 4 shards" in combined.warnings
+
+        shard = tmp_path / "llm" / "feed" / "products-00002.jsonl"
+        shard.write_text(shard.read_text().replace("in_stock", "sold_out", 1))
+        errors = validate_feed_index(result.feed_path).errors
+        assert any(e.startswith("products-00002.jsonl: sha256 is") for e in errors)
+        assert any("products-00002.jsonl: Line" in e for e in errors)
+        shard.unlink()
+        assert "feed-index.json: shard not found: products-00002.jsonl" in (
+            validate_feed_index(result.feed_path).errors
+        )
+
 
 def _make_manifest(tmp_path, **overrides):
     """Helper: create a minimal valid manifest, optionally with overrides."""
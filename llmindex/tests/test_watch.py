@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 
@@ -13,7 +15,7 @@ from llmindex.llmindex_cli.commands.watch import (
     build_artifacts,
     collect_watch_paths,
 )
-from llmindex.llmindex_cli.config import ConfigError
+from llmindex.llmindex_cli.config import ConfigError, load_yaml_config
 
 
 @pytest.fixture
@@ -63,6 +65,17 @@ def config_with_json(config_dir: Path) -> Path:
     return config_dir
 
 
+@pytest.fixture
+def config_with_jsonl(config_dir: Path) -> Path:
+    """Config dir with a products.jsonl file."""
+    jsonl_path = config_dir / "products.jsonl"
+    jsonl_path.write_text(
+        '{"id": "P001", "title": "Widget", "url": "https://example.com/widget"}\n',
+        encoding="utf-8",
+    )
+    return config_dir
+
+
 class TestBuildArtifacts:
     """Test the shared build_artifacts function."""
 
@@ -99,6 +112,13 @@ class TestBuildArtifacts:
         feed_path = output_dir / "llm" / "feed" / "products.jsonl"
         assert feed_path.exists()
 
+    def test_build_with_jsonl(self, config_with_jsonl: Path, tmp_path: Path):
+        output_dir = tmp_path / "dist"
+        written = build_artifacts(config_with_jsonl / "llmindex.yaml", output_dir)
+        assert len(written) == 6
+        feed_path = output_dir / "llm" / "feed" / "products.jsonl"
+        assert json.loads(feed_path.read_text())["id"] == "P001"
+
     def test_build_with_explicit_csv(self, config_dir: Path, tmp_path: Path):
         output_dir = tmp_path / "dist"
         csv_path = tmp_path / "custom_products.csv"
@@ -130,9 +150,90 @@ class TestBuildArtifacts:
             build_artifacts(config_path, tmp_path / "dist")
 
 
+class TestColumnMapping:
+    """Test the `columns:` header mapping in llmindex.yaml."""
+
+    def test_load_columns(self, tmp_path: Path):
+        config_path = tmp_path / "llmindex.yaml"
+        config_path.write_text(yaml.safe_dump({"columns": {"id": " sku ", "title": "name"}}))
+        assert load_yaml_config(config_path).columns == {"id": "sku", "title": "name"}
+
+    @pytest.mark.parametrize(
+        "columns, match",
+        [
+            (["sku"], "must be a mapping"),
+            ({"sku": "id"}, "unknown product field 'sku'"),
+            ({"id": ""}, "columns.id must be a non-empty string"),
+        ],
+    )
+    def test_invalid_columns(self, tmp_path: Path, columns, match):
+        config_path = tmp_path / "llmindex.yaml"
+        config_path.write_text(yaml.safe_dump({"columns": columns}))
+        with pytest.raises(ConfigError, match=match):
+            load_yaml_config(config_path)
+
+    def test_load_query(self, tmp_path: Path):
+        config_path = tmp_path / "llmindex.yaml"
+        config_path.write_text(yaml.safe_dump({"query": " SELECT * FROM items "}))
+        assert load_yaml_config(config_path).query == "SELECT * FROM items"
+        config_path.write_text(yaml.safe_dump({"query": ["SELECT 1"]}))
+        with pytest.raises(ConfigError, match="query must be a non-empty string"):
+            load_yaml_config(config_path)
+
+    def test_build_uses_mapping(self, tmp_path: Path):
+        config = {
+            "site_name": "TestSite",
+            "base_url": "https://example.com",
+            "columns": {"id": "sku", "title": "name"},
+        }
+        config_path = tmp_path / "llmindex.yaml"
+        config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        csv_path = tmp_path / "products.csv"
+        csv_path.write_text(
+            "sku,name,url,availability,updated_at\n"
+            "P001,Widget,https://example.com/widget,in_stock,2026-01-01T00:00:00Z\n",
+            encoding="utf-8",
+        )
+        output_dir = tmp_path / "dist"
+        build_artifacts(config_path, output_dir)
+        feed = (output_dir / "llm" / "feed" / "products.jsonl").read_text(encoding="utf-8")
+        assert json.loads(feed)["id"] == "P001"
+
+
 class TestCollectWatchPaths:
     """Test watch path discovery."""
 
+    def test_includes_compressed_source(self, config_dir: Path):
+        csv_gz = config_dir / "products.csv.gz"
+        csv_gz.write_bytes(gzip.compress(b"id,title,url,availability,updated_at\n"))
+        paths = collect_watch_paths(config_dir / "llmindex.yaml")
+        assert csv_gz.resolve() in paths
+
+    def test_includes_parquet_source(self, config_dir: Path):
+        parquet = config_dir / "products.parquet"
+        parquet.write_bytes(b"PAR1")
+        paths = collect_watch_paths(config_dir / "llmindex.yaml")
+        assert parquet.resolve() in paths
+
+    def test_includes_sqlite_source_and_wal(self, config_dir: Path, tmp_path: Path):
+        db = config_dir / "products.db"
+        writer = sqlite3.connect(db)
+        try:
+            writer.execute("PRAGMA journal_mode=WAL")
+            with writer:
+                writer.execute("CREATE TABLE products (id, title, url)")
+                writer.execute("INSERT INTO products VALUES ('P1', 'T', 'https://x.com/1')")
+            paths = collect_watch_paths(config_dir / "llmindex.yaml")
+            assert db.resolve() in paths
+            assert (config_dir / "products.db-wal").resolve() in paths
+
+            written = build_artifacts(config_dir / "llmindex.yaml", tmp_path / "dist")
+            feed = tmp_path / "dist" / "llm" / "feed" / "products.jsonl"
+            assert str(feed) in written
+            assert json.loads(feed.read_text())["id"] == "P1"
+        finally:
+            writer.close()
+
     def test_includes_config_file(self, config_dir: Path):
         config_path = config_dir / "llmindex.yaml"
         paths = collect_watch_paths(config_path)
@@ -150,6 +251,11 @@ class TestCollectWatchPaths:
         paths = collect_watch_paths(config_path)
         assert json_path.resolve() in paths
 
+    def test_includes_jsonl_source(self, config_with_jsonl: Path):
+        config_path = config_with_jsonl / "llmindex.yaml"
+        paths = collect_watch_paths(config_path)
+        assert (config_with_jsonl / "products.jsonl").resolve() in paths
+
     def test_includes_template_files(self, config_dir: Path):
         template = config_dir / "policies.md.j2"
         template.write_text("# {{ config.name }}", encoding="utf-8")
@@ -41,7 +41,11 @@ export interface LocalizedEndpoints {
 /** Optional machine-readable data feeds. */
 export interface LlmindexFeeds {
   products_jsonl?: string;
+  /** URL to feed-index.json of a sharded products feed. */
+  products_jsonl_index?: string;
   products_jsonl_delta?: string;
+  /** URL to delta-index.json of a time-bucketed delta archive. */
+  products_jsonl_delta_index?: string;
   offers_json?: string;
 }
 